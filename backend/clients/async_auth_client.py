@@ -0,0 +1,58 @@
+import logging
+import httpx
+from backend.models.auth import AuthRequest, AuthResponse
+
+
+class AsyncAuthClient:
+    """
+    Асинхронный Page Object для авторизации /auth.
+
+    Шаги Allure внутри корутин не открываются: стек шагов Allure привязан к потоку,
+    и при конкурентном выполнении запросов вложенность шагов перепуталась бы.
+    Оборачивать в шаги следует вызывающий код (например, весь asyncio.gather).
+    """
+
+    def __init__(self, base_url: str, session: httpx.AsyncClient, quiet: bool = False):
+        """
+        :param quiet: быстрый режим - только предупреждения и ошибки в логе (для нагрузочных прогонов)
+        """
+        self.base_url = base_url
+        self.session = session
+        self.quiet = quiet
+        self.logger = logging.getLogger(self.__class__.__name__)
+        if quiet:
+            # Отдельный логгер с уровнем WARNING: info-вызовы отсекаются на isEnabledFor без создания записей
+            self.logger = self.logger.getChild("quiet")
+            self.logger.setLevel(logging.WARNING)
+
+    def _log_payloads(self) -> bool:
+        """Сериализовать payload для лога только при включенном INFO"""
+        return self.logger.isEnabledFor(logging.INFO)
+
+    async def create_token(self, username: str = "admin", password: str = "password123") -> str:
+        """
+        Создает токен аутентификации.
+
+        :return: Возвращает токен в виде строки.
+        """
+        self.logger.info("Создание токена для пользователя: %s", username)
+        payload = AuthRequest(username=username, password=password)
+
+        url = f"{self.base_url}/auth"
+        self.logger.info("Отправка POST запроса на: %s", url)
+        response = await self.session.post(url, json=payload.model_dump())
+
+        data = response.json()
+        self.logger.info("Получен ответ: статус %s", response.status_code)
+        if self._log_payloads():
+            self.logger.info("JSON ответа: %s", data)
+
+        if response.status_code >= 400:
+            if 'reason' in data:
+                raise Exception(f"Ошибка аутентификации: {data['reason']}")
+            response.raise_for_status()
+
+        token_data = AuthResponse.model_validate(data)
+        self.logger.info("Токен успешно создан")
+
+        return token_data.token
@@ -0,0 +1,156 @@
+import logging
+import httpx
+from typing import Dict, Any, List
+from backend.models.booking import (
+    BookingCreateRequest,
+    BookingCreateResponse,
+    BookingGetResponse,
+    BookingUpdateResponse,
+    BOOKING_ID_LIST_ADAPTER,
+    construct_booking
+)
+
+
+class AsyncBookingClient:
+    """
+    Асинхронный Page Object для управления бронированиями.
+
+    Методы повторяют BookingClient, но выполняются на общем пуле keep-alive соединений
+    httpx.AsyncClient, поэтому независимые вызовы можно запускать через asyncio.gather.
+    Шаги Allure, как и в AsyncAuthClient, открывает вызывающий код.
+    """
+
+    def __init__(self, base_url: str, session: httpx.AsyncClient, quiet: bool = False,
+                 trusted: bool = False):
+        """
+        :param quiet: быстрый режим - только предупреждения и ошибки в логе (для нагрузочных прогонов)
+        :param trusted: не валидировать ответы pydantic, модели собираются через model_construct
+            (для нагрузочных прогонов, где корректность ответов проверяют функциональные тесты)
+        """
+        self.base_url = base_url
+        self.session = session
+        self.quiet = quiet
+        self.trusted = trusted
+        self.logger = logging.getLogger(self.__class__.__name__)
+        if quiet:
+            # Отдельный логгер с уровнем WARNING: info-вызовы отсекаются на isEnabledFor без создания записей
+            self.logger = self.logger.getChild("quiet")
+            self.logger.setLevel(logging.WARNING)
+
+    def _log_payloads(self) -> bool:
+        """Сериализовать payload для лога только при включенном INFO"""
+        return self.logger.isEnabledFor(logging.INFO)
+
+    def _parse_booking(self, model_cls, response):
+        """Модель бронирования из тела ответа: валидация прямо из байтов или сборка без проверки в trusted-режиме"""
+        if self.trusted:
+            return construct_booking(model_cls, response.json())
+        return model_cls.model_validate_json(response.content)
+
+    async def get_all_bookings(self) -> List[int]:
+        """Получить список всех ID бронирований"""
+        self.logger.info("Запрос всех booking IDs")
+
+        response = await self.session.get(f"{self.base_url}/booking")
+        self.logger.info("Получен ответ: статус %s", response.status_code)
+
+        response.raise_for_status()
+        if self.trusted:
+            booking_ids = [item["bookingid"] for item in response.json()]
+        else:
+            booking_ids = [item["bookingid"] for item in BOOKING_ID_LIST_ADAPTER.validate_json(response.content)]
+        self.logger.info("Найдено %d бронирований", len(booking_ids))
+
+        return booking_ids
+
+    async def get_booking_by_id(self, booking_id: int) -> BookingGetResponse:
+        """Получить конкретное бронирование по ID"""
+        self.logger.info("Запрос бронирования с ID: %s", booking_id)
+
+        response = await self.session.get(f"{self.base_url}/booking/{booking_id}")
+        self.logger.info("Получен ответ: статус %s", response.status_code)
+
+        response.raise_for_status()
+        booking_data = self._parse_booking(BookingGetResponse, response)
+        if self._log_payloads():
+            self.logger.info("Получены данные бронирования: %s", booking_data)
+
+        return booking_data
+
+    async def create_booking(self, payload: BookingCreateRequest) -> int:
+        """Создать бронирование и вернуть его ID"""
+        request_data = payload.model_dump()
+        if self._log_payloads():
+            self.logger.info("Создание бронирования с данными: %s", request_data)
+
+        response = await self.session.post(f"{self.base_url}/booking", json=request_data)
+        self.logger.info("Получен ответ: статус %s", response.status_code)
+
+        response.raise_for_status()
+        if self.trusted:
+            booking_id = response.json()["bookingid"]
+        else:
+            booking_id = BookingCreateResponse.model_validate_json(response.content).bookingid
+        self.logger.info("Бронирование создано успешно, ID: %s", booking_id)
+
+        return booking_id
+
+    async def update_booking_full(self, booking_id: int, token: str,
+                                  payload: BookingCreateRequest) -> BookingUpdateResponse:
+        """Полное обновление бронирования (PUT)"""
+        self.logger.info("Полное обновление бронирования %s", booking_id)
+        headers = {"Cookie": f"token={token}"}
+        request_data = payload.model_dump()
+
+        response = await self.session.put(
+            f"{self.base_url}/booking/{booking_id}",
+            json=request_data,
+            headers=headers
+        )
+        self.logger.info("Получен ответ: статус %s", response.status_code)
+
+        response.raise_for_status()
+        updated_data = self._parse_booking(BookingUpdateResponse, response)
+        if self._log_payloads():
+            self.logger.info("Бронирование успешно обновлено: %s", updated_data)
+
+        return updated_data
+
+    async def partial_update_booking(self, booking_id: int, token: str,
+                                     updates: Dict[str, Any]) -> BookingUpdateResponse:
+        """Частичное обновление (PATCH)"""
+        self.logger.info("Частичное обновление бронирования %s", booking_id)
+        if self._log_payloads():
+            self.logger.info("Обновляемые поля: %s", updates)
+        headers = {"Cookie": f"token={token}"}
+
+        response = await self.session.patch(
+            f"{self.base_url}/booking/{booking_id}",
+            json=updates,
+            headers=headers
+        )
+        self.logger.info("Получен ответ: статус %s", response.status_code)
+
+        response.raise_for_status()
+        updated_data = self._parse_booking(BookingUpdateResponse, response)
+        if self._log_payloads():
+            self.logger.info("Бронирование частично обновлено: %s", updated_data)
+
+        return updated_data
+
+    async def delete_booking(self, booking_id: int, token: str) -> bool:
+        """Удалить бронирование"""
+        self.logger.info("Удаление бронирования с ID: %s", booking_id)
+        headers = {"Cookie": f"token={token}"}
+
+        response = await self.session.delete(
+            f"{self.base_url}/booking/{booking_id}",
+            headers=headers
+        )
+        self.logger.info("Получен ответ: статус %s", response.status_code)
+
+        response.raise_for_status()
+        is_success = response.status_code in [200, 201]
+        self.logger.info("Удаление %s", "успешно" if is_success else "не удалось")
+
+        return is_success
@@ -1,16 +1,45 @@
 import logging
 import requests
+from typing import Optional
+from backend.helpers.token_cache import TokenCache
 from backend.models.auth import AuthRequest, AuthResponse
-import allure
+from common import reporting as allure
 
 
 class AuthClient:
     """Page Object для авторизации /auth"""
 
-    def __init__(self, base_url: str, session: requests.Session):
+    def __init__(self, base_url: str, session: requests.Session, token_cache: Optional[TokenCache] = None,
+                 quiet: bool = False):
+        """
+        :param quiet: быстрый режим - только предупреждения и ошибки в логе (для нагрузочных прогонов)
+        """
         self.base_url = base_url
         self.session = session
+        self.token_cache = token_cache
+        self.quiet = quiet
         self.logger = logging.getLogger(self.__class__.__name__)
+        if quiet:
+            # Отдельный логгер с уровнем WARNING: info-вызовы отсекаются на isEnabledFor без создания записей
+            self.logger = self.logger.getChild("quiet")
+            self.logger.setLevel(logging.WARNING)
+
+    def _log_payloads(self) -> bool:
+        """Сериализовать payload для лога только при включенном INFO"""
+        return self.logger.isEnabledFor(logging.INFO)
+
+    def get_token(self, username: str = "admin", password: str = "password123") -> str:
+        """
+        Возвращает токен из кэша, запрашивая новый только при отсутствии или скором истечении.
+
+        Без настроенного кэша работает как create_token.
+        """
+        if self.token_cache is None:
+            return self.create_token(username, password)
+        return self.token_cache.get_token(
+            self.base_url, username, password,
+            factory=lambda: self.create_token(username, password)
+        )
 
     def create_token(self, username: str = "admin", password: str = "password123") -> str:
         """
@@ -19,27 +48,30 @@ class AuthClient:
         :return: Возвращает токен в виде строки.
         """
         with allure.step(f"Создание токена для пользователя {username}"):
-            self.logger.info(f"Создание токена для пользователя: {username}")
+            self.logger.info("Создание токена для пользователя: %s", username)
 
             with allure.step("Подготовка payload"):
-                payload = AuthRequest(username=username, password=password)
-                self.logger.info(f"Подготовка запроса с данными: {payload.model_dump()}")
+                request_data = AuthRequest(username=username, password=password).model_dump()
+                if self._log_payloads():
+                    self.logger.info("Подготовка запроса с данными: %s", request_data)
 
             with allure.step("Отправка POST запроса"):
                 url = f"{self.base_url}/auth"
-                self.logger.info(f"Отправка POST запроса на: {url}")
-                response = self.session.post(url, json=payload.model_dump())
+                self.logger.info("Отправка POST запроса на: %s", url)
+                response = self.session.post(url, json=request_data)
 
             with allure.step("Обработка ответа"):
-                self.logger.info(f"Получен ответ: статус {response.status_code}, JSON {response.json()}")
+                data = response.json()
+                self.logger.info("Получен ответ: статус %s", response.status_code)
+                if self._log_payloads():
+                    self.logger.info("JSON ответа: %s", data)
 
                 if response.status_code >= 400:
-                    error_data = response.json()
-                    if 'reason' in error_data:
-                        raise Exception(f"Ошибка аутентификации: {error_data['reason']}")
+                    if 'reason' in data:
+                        raise Exception(f"Ошибка аутентификации: {data['reason']}")
                     response.raise_for_status()
 
-                token_data = AuthResponse.model_validate(response.json())
-                self.logger.info(f"Токен успешно создан")
+                token_data = AuthResponse.model_validate(data)
+                self.logger.info("Токен успешно создан")
 
                 return token_data.token
\ No newline at end of file
@@ -1,23 +1,52 @@
 import logging
 import requests
-import allure
-from typing import Dict, Any, List
+from common import reporting as allure
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
 from backend.models.booking import (
     BookingCreateRequest,
     BookingCreateResponse,
     BookingGetResponse,
     BookingUpdateResponse,
-    BookingListResponseItem
+    BOOKING_ID_ADAPTER,
+    BOOKING_ID_LIST_ADAPTER,
+    construct_booking
 )
+from backend.models.bulk import BulkItemResult
+from backend.helpers.json_stream import iter_json_array
 
 
 class BookingClient:
     """Page Object для управления бронированиями"""
 
-    def __init__(self, base_url: str, session: requests.Session):
+    def __init__(self, base_url: str, session: requests.Session, max_workers: int = 10, quiet: bool = False,
+                 trusted: bool = False):
+        """
+        :param quiet: быстрый режим - только предупреждения и ошибки в логе (для нагрузочных прогонов)
+        :param trusted: не валидировать ответы pydantic, модели собираются через model_construct
+            (для нагрузочных прогонов, где корректность ответов проверяют функциональные тесты)
+        """
         self.base_url = base_url
         self.session = session
+        self.max_workers = max_workers
+        self.quiet = quiet
+        self.trusted = trusted
         self.logger = logging.getLogger(self.__class__.__name__)
+        if quiet:
+            # Отдельный логгер с уровнем WARNING: info-вызовы отсекаются на isEnabledFor без создания записей
+            self.logger = self.logger.getChild("quiet")
+            self.logger.setLevel(logging.WARNING)
+
+    def _log_payloads(self) -> bool:
+        """Сериализовать payload для лога только при включенном INFO"""
+        return self.logger.isEnabledFor(logging.INFO)
+
+    def _parse_booking(self, model_cls, response):
+        """Модель бронирования из тела ответа: валидация прямо из байтов или сборка без проверки в trusted-режиме"""
+        if self.trusted:
+            return construct_booking(model_cls, response.json())
+        return model_cls.model_validate_json(response.content)
 
     def get_all_bookings(self) -> List[int]:
         """Получить список всех ID бронирований"""
@@ -26,70 +55,142 @@ class BookingClient:
 
             with allure.step("Отправка GET запроса на /booking"):
                 response = self.session.get(f"{self.base_url}/booking")
-                data = response.json()
-                self.logger.info(f"Получен ответ: статус {response.status_code}, JSON {data}")
+                self.logger.info("Получен ответ: статус %s", response.status_code)
 
             with allure.step("Обработка ответа"):
                 response.raise_for_status()
-                BookingListResponseItem.model_validate(data)
-                booking_ids = [item["bookingid"] for item in data]
-                self.logger.info(f"Найдено {len(booking_ids)} бронирований")
+                if self.trusted:
+                    booking_ids = [item["bookingid"] for item in response.json()]
+                else:
+                    items = BOOKING_ID_LIST_ADAPTER.validate_json(response.content)
+                    booking_ids = [item["bookingid"] for item in items]
+                self.logger.info("Найдено %d бронирований", len(booking_ids))
 
                 return booking_ids
 
+    def iter_bookings(self, firstname: Optional[str] = None, lastname: Optional[str] = None,
+                      checkin: Optional[str] = None, checkout: Optional[str] = None,
+                      hydrate: bool = False, lookahead: Optional[int] = None,
+                      chunk_size: int = 64 * 1024
+                      ) -> Iterator[Union[int, Tuple[int, BookingGetResponse]]]:
+        """
+        Потоково перебрать ID бронирований, не загружая весь список в память.
+
+        Ответ /booking читается кусками и разбирается инкрементально. Фильтры передаются
+        в query-параметрах, так что проверка существования не тянет весь набор данных.
+
+        :param firstname: фильтр по имени
+        :param lastname: фильтр по фамилии
+        :param checkin: фильтр по дате заезда (YYYY-MM-DD)
+        :param checkout: фильтр по дате выезда (YYYY-MM-DD)
+        :param hydrate: отдавать пары (ID, бронирование), загружая бронирования параллельно
+        :param lookahead: сколько бронирований загружать наперед (по умолчанию self.max_workers)
+        :param chunk_size: размер куска чтения ответа в байтах
+        :return: генератор ID или пар (ID, BookingGetResponse) в порядке ответа сервера
+        """
+        params = {key: value for key, value in (
+            ("firstname", firstname), ("lastname", lastname), ("checkin", checkin), ("checkout", checkout)
+        ) if value is not None}
+        booking_ids = self._stream_booking_ids(params, chunk_size)
+        if hydrate:
+            return self._hydrate_bookings(booking_ids, lookahead or self.max_workers)
+        return booking_ids
+
+    def _stream_booking_ids(self, params: Dict[str, str], chunk_size: int) -> Iterator[int]:
+        # Шаги Allure не охватывают yield: иначе стек шагов потребителя перемешается с шагами генератора
+        with allure.step(f"Потоковый запрос ID бронирований {params or ''}".rstrip()):
+            self.logger.info("Потоковый запрос booking IDs, фильтры: %s", params)
+            response = self.session.get(f"{self.base_url}/booking", params=params, stream=True)
+            self.logger.info("Получен ответ: статус %s", response.status_code)
+
+        count = 0
+        try:
+            response.raise_for_status()
+            for item in iter_json_array(response.iter_content(chunk_size), response.encoding or "utf-8"):
+                if not self.trusted:
+                    item = BOOKING_ID_ADAPTER.validate_python(item)
+                count += 1
+                yield item["bookingid"]
+        finally:
+            response.close()
+            self.logger.info("Потоковый перебор завершен, получено ID: %d", count)
+
+    def _hydrate_bookings(self, booking_ids: Iterator[int],
+                          lookahead: int) -> Iterator[Tuple[int, BookingGetResponse]]:
+        """Загружает бронирования в пуле потоков, держа в работе не больше lookahead запросов"""
+        executor = ThreadPoolExecutor(max_workers=min(lookahead, self.max_workers),
+                                      thread_name_prefix="booking-stream")
+        pending = deque()
+        try:
+            for booking_id in booking_ids:
+                pending.append((booking_id, executor.submit(self.get_booking_by_id, booking_id)))
+                if len(pending) >= lookahead:
+                    booking_id, future = pending.popleft()
+                    yield booking_id, future.result()
+            while pending:
+                booking_id, future = pending.popleft()
+                yield booking_id, future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            booking_ids.close()
+
     def get_booking_by_id(self, booking_id: int) -> BookingGetResponse:
         """Получить конкретное бронирование по ID"""
         with allure.step(f"Получение бронирования по ID {booking_id}"):
-            self.logger.info(f"Запрос бронирования с ID: {booking_id}")
+            self.logger.info("Запрос бронирования с ID: %s", booking_id)
 
             with allure.step("Отправка GET запроса"):
                 response = self.session.get(f"{self.base_url}/booking/{booking_id}")
-                self.logger.info(f"Получен ответ: статус {response.status_code}")
+                self.logger.info("Получен ответ: статус %s", response.status_code)
 
             with allure.step("Валидация и парсинг ответа"):
                 response.raise_for_status()
-                booking_data = BookingGetResponse.model_validate(response.json())
-                self.logger.info(f"Получены данные бронирования: {booking_data}")
+                booking_data = self._parse_booking(BookingGetResponse, response)
+                if self._log_payloads():
+                    self.logger.info("Получены данные бронирования: %s", booking_data)
 
                 return booking_data
 
     def create_booking(self, payload: BookingCreateRequest) -> int:
         """Создать бронирование и вернуть его ID"""
         with allure.step("Создание нового бронирования"):
-            self.logger.info(f"Создание бронирования с данными: {payload.model_dump()}")
+            self.logger.info("Создание бронирования")
 
             with allure.step("Подготовка payload"):
                 request_data = payload.model_dump()
-                self.logger.info(f"Payload для создания: {request_data}")
+                if self._log_payloads():
+                    self.logger.info("Payload для создания: %s", request_data)
 
             with allure.step("Отправка POST запроса на /booking"):
                 response = self.session.post(
                     f"{self.base_url}/booking",
                     json=request_data
                 )
-                self.logger.info(f"Получен ответ: статус {response.status_code}")
+                self.logger.info("Получен ответ: статус %s", response.status_code)
 
             with allure.step("Обработка ответа создания"):
                 response.raise_for_status()
-                result = response.json()
-                BookingCreateResponse.model_validate(result)
-                booking_id = result["bookingid"]
-                self.logger.info(f"Бронирование создано успешно, ID: {booking_id}")
+                if self.trusted:
+                    booking_id = response.json()["bookingid"]
+                else:
+                    booking_id = BookingCreateResponse.model_validate_json(response.content).bookingid
+                self.logger.info("Бронирование создано успешно, ID: %s", booking_id)
 
                 return booking_id
 
     def update_booking_full(self, booking_id: int, token: str, payload: BookingCreateRequest) -> BookingUpdateResponse:
         """Полное обновление бронирования (PUT)"""
         with allure.step(f"Полное обновление бронирования ID {booking_id}"):
-            self.logger.info(f"Полное обновление бронирования {booking_id}")
+            self.logger.info("Полное обновление бронирования %s", booking_id)
 
             with allure.step("Подготовка заголовков с токеном"):
                 headers = {"Cookie": f"token={token}"}
-                self.logger.info(f"Заголовки запроса: {headers}")
+                self.logger.info("Заголовки запроса: %s", headers)
 
             with allure.step("Подготовка данных для обновления"):
                 request_data = payload.model_dump()
-                self.logger.info(f"Данные для обновления: {request_data}")
+                if self._log_payloads():
+                    self.logger.info("Данные для обновления: %s", request_data)
 
             with allure.step("Отправка PUT запроса"):
                 response = self.session.put(
@@ -97,26 +198,28 @@ class BookingClient:
                     json=request_data,
                     headers=headers
                 )
-                self.logger.info(f"Получен ответ: статус {response.status_code}")
+                self.logger.info("Получен ответ: статус %s", response.status_code)
 
             with allure.step("Валидация ответа обновления"):
                 response.raise_for_status()
-                updated_data = BookingUpdateResponse.model_validate(response.json())
-                self.logger.info(f"Бронирование успешно обновлено: {updated_data}")
+                updated_data = self._parse_booking(BookingUpdateResponse, response)
+                if self._log_payloads():
+                    self.logger.info("Бронирование успешно обновлено: %s", updated_data)
 
                 return updated_data
 
     def partial_update_booking(self, booking_id: int, token: str, updates: Dict[str, Any]) -> BookingUpdateResponse:
         """Частичное обновление (PATCH)"""
         with allure.step(f"Частичное обновление бронирования ID {booking_id}"):
-            self.logger.info(f"Частичное обновление бронирования {booking_id}")
+            self.logger.info("Частичное обновление бронирования %s", booking_id)
 
             with allure.step("Подготовка заголовков с токеном"):
                 headers = {"Cookie": f"token={token}"}
-                self.logger.info(f"Заголовки запроса: {headers}")
+                self.logger.info("Заголовки запроса: %s", headers)
 
             with allure.step("Подготовка данных для частичного обновления"):
-                self.logger.info(f"Обновляемые поля: {updates}")
+                if self._log_payloads():
+                    self.logger.info("Обновляемые поля: %s", updates)
 
             with allure.step("Отправка PATCH запроса"):
                 response = self.session.patch(
@@ -124,34 +227,95 @@ class BookingClient:
                     json=updates,
                     headers=headers
                 )
-                self.logger.info(f"Получен ответ: статус {response.status_code}")
+                self.logger.info("Получен ответ: статус %s", response.status_code)
 
             with allure.step("Валидация ответа частичного обновления"):
                 response.raise_for_status()
-                updated_data = BookingUpdateResponse.model_validate(response.json())
-                self.logger.info(f"Бронирование частично обновлено: {updated_data}")
+                updated_data = self._parse_booking(BookingUpdateResponse, response)
+                if self._log_payloads():
+                    self.logger.info("Бронирование частично обновлено: %s", updated_data)
 
                 return updated_data
 
     def delete_booking(self, booking_id: int, token: str) -> bool:
         """Удалить бронирование"""
         with allure.step(f"Удаление бронирования ID {booking_id}"):
-            self.logger.info(f"Удаление бронирования с ID: {booking_id}")
+            self.logger.info("Удаление бронирования с ID: %s", booking_id)
 
             with allure.step("Подготовка заголовков с токеном"):
                 headers = {"Cookie": f"token={token}"}
-                self.logger.info(f"Заголовки запроса: {headers}")
+                self.logger.info("Заголовки запроса: %s", headers)
 
             with allure.step("Отправка DELETE запроса"):
                 response = self.session.delete(
                     f"{self.base_url}/booking/{booking_id}",
                     headers=headers
                 )
-                self.logger.info(f"Получен ответ: статус {response.status_code}")
+                self.logger.info("Получен ответ: статус %s", response.status_code)
 
             with allure.step("Проверка успешности удаления"):
                 response.raise_for_status()
                 is_success = response.status_code in [200, 201]
-                self.logger.info(f"Удаление {'успешно' if is_success else 'не удалось'}")
-
-                return is_success
\ No newline at end of file
+                self.logger.info("Удаление %s", "успешно" if is_success else "не удалось")
+
+                return is_success
+
+    def create_many(self, payloads: Iterable[BookingCreateRequest],
+                    max_workers: Optional[int] = None) -> List[BulkItemResult[int]]:
+        """Создать бронирования пакетом. Результаты в порядке входных payload"""
+        with allure.step("Пакетное создание бронирований"):
+            return self._run_bulk(self.create_booking, payloads, max_workers)
+
+    def get_many(self, booking_ids: Iterable[int],
+                 max_workers: Optional[int] = None) -> List[BulkItemResult[BookingGetResponse]]:
+        """Получить бронирования пакетом. Результаты в порядке входных ID"""
+        with allure.step("Пакетное получение бронирований"):
+            return self._run_bulk(self.get_booking_by_id, booking_ids, max_workers)
+
+    def delete_many(self, booking_ids: Iterable[int], token: str,
+                    max_workers: Optional[int] = None) -> List[BulkItemResult[bool]]:
+        """Удалить бронирования пакетом. Результаты в порядке входных ID"""
+        with allure.step("Пакетное удаление бронирований"):
+            return self._run_bulk(lambda booking_id: self.delete_booking(booking_id, token),
+                                  booking_ids, max_workers)
+
+    def _run_bulk(self, operation: Callable[[Any], Any], items: Iterable[Any],
+                  max_workers: Optional[int]) -> List[BulkItemResult]:
+        """
+        Выполняет операцию для каждого элемента в пуле потоков.
+
+        Ошибка одного элемента не прерывает остальные и сохраняется в его BulkItemResult.
+
+        :param operation: функция одного вызова API
+        :param items: входные элементы (payload или ID)
+        :param max_workers: ограничение параллелизма (по умолчанию self.max_workers)
+        :return: список результатов в порядке входных элементов
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        workers = min(max_workers or self.max_workers, len(items))
+        self.logger.info("Пакетная операция над %d элементами, потоков: %d", len(items), workers)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="booking-bulk") as executor:
+            futures = [executor.submit(operation, item) for item in items]
+
+        results = []
+        for index, (item, future) in enumerate(zip(items, futures)):
+            error = future.exception()
+            if error is None:
+                results.append(BulkItemResult(index=index, item=item, result=future.result()))
+            else:
+                self.logger.error("Ошибка пакетной операции для элемента %d (%s): %s", index, item, error)
+                results.append(BulkItemResult(index=index, item=item, error=error))
+
+        failed = sum(1 for result in results if not result.ok)
+        allure.attach(
+            f"Всего: {len(results)}\nУспешно: {len(results) - failed}\nОшибок: {failed}",
+            name="Итог пакетной операции",
+            attachment_type=allure.attachment_type.TEXT
+        )
+        self.logger.info("Пакетная операция завершена: успешно %d, ошибок %d", len(results) - failed, failed)
+
+        return results
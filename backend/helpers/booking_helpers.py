@@ -1,5 +1,7 @@
 from datetime import date
+from typing import List
 from backend.models.booking import BookingGetResponse, BookingUpdateResponse
+from backend.models.bulk import BulkItemResult
 
 def assert_booking_created_correctly(booking: BookingGetResponse, expected_data: dict):
     """Проверка корректности создания бронирования."""
@@ -30,4 +32,9 @@ def assert_booking_dates_duration(booking: BookingGetResponse, expected_days: in
 def assert_booking_dates_equal(booking: BookingGetResponse, expected_date: date):
     """Проверка одинаковых дат заезда/выезда."""
     assert booking.bookingdates.checkin == expected_date
-    assert booking.bookingdates.checkout == expected_date
\ No newline at end of file
+    assert booking.bookingdates.checkout == expected_date
+
+def assert_bulk_succeeded(results: List[BulkItemResult]):
+    """Проверка, что все элементы пакетной операции выполнены без ошибок."""
+    failed = [f"#{result.index} ({result.item}): {result.error}" for result in results if not result.ok]
+    assert not failed, f"Ошибки пакетной операции: {'; '.join(failed)}"
@@ -1,5 +1,6 @@
-import allure
+from common import reporting as allure
 from backend.factories.booking_factory import create_booking_payload
+from backend.helpers.booking_helpers import assert_bulk_succeeded
 
 def create_test_booking(booking_client, **kwargs):
     """Создание тестового бронирования с allure steps."""
@@ -12,4 +13,12 @@ def create_and_get_booking(booking_client, **kwargs):
     """Создание бронирования и получение его данных."""
     booking_id, payload = create_test_booking(booking_client, **kwargs)
     booking = booking_client.get_booking_by_id(booking_id)
-    return booking_id, payload, booking
\ No newline at end of file
+    return booking_id, payload, booking
+
+def create_test_bookings(booking_client, payload_kwargs, max_workers=None):
+    """Пакетное создание тестовых бронирований. Возвращает ID в порядке входных данных."""
+    with allure.step(f"Пакетное создание {len(payload_kwargs)} тестовых бронирований"):
+        payloads = [create_booking_payload(**kwargs) for kwargs in payload_kwargs]
+        results = booking_client.create_many(payloads, max_workers=max_workers)
+        assert_bulk_succeeded(results)
+        return [result.result for result in results], payloads
@@ -0,0 +1,91 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_WHITESPACE = " \t\r\n"
+# Чем может закончиться число или литерал внутри массива
+_SCALAR_END = _WHITESPACE + ",]"
+
+
+def iter_json_array(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Инкрементальный разбор JSON-массива верхнего уровня из потока байтов.
+
+    Элементы отдаются по мере поступления данных, в памяти держится только
+    неразобранный хвост буфера, а не весь ответ.
+
+    :param chunks: куски тела ответа (например, response.iter_content())
+    :param encoding: кодировка тела ответа
+    :return: генератор элементов массива
+    :raises ValueError: тело не является JSON-массивом или обрывается посередине
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ""
+    position = 0
+    started = False
+    expect_value = True
+    after_comma = False
+    source = iter(chunks)
+    has_more = True
+
+    def refill() -> bool:
+        """Дочитать следующий кусок в буфер, отбросив разобранную часть. False - поток закончился"""
+        nonlocal buffer, position
+        chunk = next(source, None)
+        if chunk is None:
+            buffer = buffer[position:] + text_decoder.decode(b"", final=True)
+        else:
+            buffer = buffer[position:] + text_decoder.decode(chunk)
+        position = 0
+        return chunk is not None
+
+    while True:
+        while position < len(buffer) and buffer[position] in _WHITESPACE:
+            position += 1
+        if position >= len(buffer):
+            if not has_more:
+                raise ValueError("Неожиданный конец JSON-массива")
+            has_more = refill()
+            continue
+
+        char = buffer[position]
+        if not started:
+            if char != "[":
+                raise ValueError(f"Ожидался JSON-массив, получено: {char!r}")
+            started = True
+            position += 1
+            continue
+        if char == "]":
+            if after_comma:
+                raise ValueError("Лишняя запятая в JSON-массиве")
+            return
+        if char == ",":
+            if expect_value:
+                raise ValueError("Лишняя запятая в JSON-массиве")
+            expect_value = after_comma = True
+            position += 1
+            continue
+        if not expect_value:
+            raise ValueError(f"Ожидалась запятая в JSON-массиве, получено: {char!r}")
+
+        if char not in "{[\"" and has_more:
+            # Число или литерал на границе куска могут быть обрезаны ("1." + "5"): raw_decode разобрал бы
+            # начало как отдельное значение, поэтому разбираем их, только увидев конец токена
+            end = position
+            while end < len(buffer) and buffer[end] not in _SCALAR_END:
+                end += 1
+            if end >= len(buffer):
+                has_more = refill()
+                continue
+
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if not has_more:
+                raise
+            has_more = refill()
+            continue
+        position = end
+        expect_value = after_comma = False
+        yield value
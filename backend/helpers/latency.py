@@ -0,0 +1,210 @@
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+from requests.adapters import HTTPAdapter
+
+SUB_BUCKET_BITS = 7
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+SUB_BUCKET_HALF = SUB_BUCKET_COUNT // 2
+MAX_TRACKABLE_NS = (1 << 43) - 1  # ~2.4 часа
+BUCKET_COUNT = SUB_BUCKET_COUNT + (MAX_TRACKABLE_NS.bit_length() - SUB_BUCKET_BITS) * SUB_BUCKET_HALF
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def _index_for(value: int) -> int:
+    if value < SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return SUB_BUCKET_COUNT + (shift - 1) * SUB_BUCKET_HALF + (value >> shift) - SUB_BUCKET_HALF
+
+
+def _highest_value_for(index: int) -> int:
+    if index < SUB_BUCKET_COUNT:
+        return index
+    shift = (index - SUB_BUCKET_COUNT) // SUB_BUCKET_HALF + 1
+    sub_bucket = (index - SUB_BUCKET_COUNT) % SUB_BUCKET_HALF + SUB_BUCKET_HALF
+    return ((sub_bucket + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Гистограмма задержек в наносекундах в стиле HDR Histogram.
+
+    Значения раскладываются по логарифмическим корзинам с 64 линейными подкорзинами
+    (относительная погрешность < 1.6%), поэтому запись выполняется за O(1),
+    а размер гистограммы не зависит от числа записанных значений.
+    """
+
+    def __init__(self):
+        self.counts: List[int] = [0] * BUCKET_COUNT
+        self.total_count = 0
+        self.total_ns = 0
+        self.min_ns: Optional[int] = None
+        self.max_ns = 0
+
+    def record(self, value_ns: int):
+        value_ns = min(max(int(value_ns), 0), MAX_TRACKABLE_NS)
+        self.counts[_index_for(value_ns)] += 1
+        self.total_count += 1
+        self.total_ns += value_ns
+        if self.min_ns is None or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.total_count += other.total_count
+        self.total_ns += other.total_ns
+        if other.min_ns is not None and (self.min_ns is None or other.min_ns < self.min_ns):
+            self.min_ns = other.min_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        return self
+
+    def copy(self) -> "LatencyHistogram":
+        return LatencyHistogram().merge(self)
+
+    def percentile(self, percent: float) -> int:
+        """Верхняя граница корзины, в которую попадает заданный перцентиль (нс)"""
+        if not self.total_count:
+            return 0
+        threshold = max(percent / 100 * self.total_count, 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= threshold:
+                return min(_highest_value_for(index), self.max_ns)
+        return self.max_ns
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.total_count if self.total_count else 0.0
+
+    def bucket_counts(self, bounds_ns: Iterable[int]) -> List[int]:
+        """Количество значений по произвольным границам; последний элемент - значения выше всех границ"""
+        bounds = list(bounds_ns)
+        result = [0] * (len(bounds) + 1)
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+            value = _highest_value_for(index)
+            position = next((i for i, bound in enumerate(bounds) if value <= bound), len(bounds))
+            result[position] += count
+        return result
+
+    def to_dict(self) -> dict:
+        return {
+            "counts": {index: count for index, count in enumerate(self.counts) if count},
+            "total_count": self.total_count,
+            "total_ns": self.total_ns,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        histogram = cls()
+        for index, count in data["counts"].items():
+            histogram.counts[int(index)] = count
+        histogram.total_count = data["total_count"]
+        histogram.total_ns = data["total_ns"]
+        histogram.min_ns = data["min_ns"]
+        histogram.max_ns = data["max_ns"]
+        return histogram
+
+
+class LatencyRecorder:
+    """Потокобезопасный реестр гистограмм задержек по эндпоинтам"""
+
+    def __init__(self):
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, duration_ns: int):
+        with self._lock:
+            histogram = self._histograms.get(endpoint)
+            if histogram is None:
+                histogram = self._histograms[endpoint] = LatencyHistogram()
+            histogram.record(duration_ns)
+
+    def snapshot(self) -> Dict[str, LatencyHistogram]:
+        with self._lock:
+            return {endpoint: histogram.copy() for endpoint, histogram in self._histograms.items()}
+
+    def merge(self, snapshot: Dict[str, LatencyHistogram]):
+        with self._lock:
+            for endpoint, histogram in snapshot.items():
+                self._histograms.setdefault(endpoint, LatencyHistogram()).merge(histogram)
+
+    def to_dict(self) -> dict:
+        return {endpoint: histogram.to_dict() for endpoint, histogram in self.snapshot().items()}
+
+    def merge_dict(self, data: dict):
+        self.merge({endpoint: LatencyHistogram.from_dict(item) for endpoint, item in data.items()})
+
+    def format_table(self) -> str:
+        """Таблица перцентилей по эндпоинтам в миллисекундах"""
+        rows = [("endpoint", "count", "mean", "p50", "p90", "p99", "max")]
+        for endpoint, histogram in sorted(self.snapshot().items()):
+            rows.append((
+                endpoint,
+                str(histogram.total_count),
+                *(f"{value / 1e6:.2f}" for value in (
+                    histogram.mean_ns,
+                    histogram.percentile(50),
+                    histogram.percentile(90),
+                    histogram.percentile(99),
+                    histogram.max_ns,
+                ))
+            ))
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        return "\n".join(
+            "  ".join(cell.ljust(widths[0]) if i == 0 else cell.rjust(widths[i]) for i, cell in enumerate(row))
+            for row in rows
+        )
+
+
+latency_recorder = LatencyRecorder()
+
+
+def endpoint_key(method: str, path: str) -> str:
+    """Ключ эндпоинта: метод и путь с числовыми ID, замененными на {id}"""
+    return f"{method.upper()} {_ID_SEGMENT.sub('/{id}', path) or '/'}"
+
+
+class TimingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter для requests, записывающий задержку до получения заголовков ответа в LatencyRecorder"""
+
+    def __init__(self, *args, recorder: LatencyRecorder = latency_recorder, **kwargs):
+        self.recorder = recorder
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, *args, **kwargs):
+        started = time.perf_counter_ns()
+        try:
+            return super().send(request, *args, **kwargs)
+        finally:
+            path = urlsplit(request.url).path
+            self.recorder.record(endpoint_key(request.method, path), time.perf_counter_ns() - started)
+
+
+class TimingAsyncTransport(httpx.AsyncHTTPTransport):
+    """Транспорт httpx.AsyncClient, записывающий задержку до получения заголовков ответа в LatencyRecorder"""
+
+    def __init__(self, *args, recorder: LatencyRecorder = latency_recorder, **kwargs):
+        self.recorder = recorder
+        super().__init__(*args, **kwargs)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter_ns()
+        try:
+            return await super().handle_async_request(request)
+        finally:
+            self.recorder.record(endpoint_key(request.method, request.url.path), time.perf_counter_ns() - started)
@@ -0,0 +1,269 @@
+import json
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from common import reporting as allure
+
+from backend.factories.booking_factory import create_booking_payload, create_update_payload
+from backend.helpers.latency import LatencyHistogram
+
+HISTOGRAM_BOUNDS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """
+    Разбирает строку смеси операций вида "get=70,create=20,update=10".
+
+    :return: словарь операция -> доля (сумма долей = 1)
+    """
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight)
+    total = sum(mix.values())
+    if total <= 0:
+        raise ValueError(f"Некорректная смесь операций: {value}")
+    return {name: weight / total for name, weight in mix.items()}
+
+
+@dataclass
+class LoadProfile:
+    """Параметры нагрузки: смесь операций, длительность и интенсивность"""
+    mix: Dict[str, float] = field(default_factory=lambda: {"get": 0.7, "create": 0.2, "update": 0.1})
+    duration: float = 10.0
+    concurrency: int = 10
+    target_rps: Optional[float] = None
+    seed_bookings: int = 10
+
+
+class OperationStats:
+    """Задержки и ошибки одной операции; память не растет с длительностью прогона"""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency_ns: int, failed: bool):
+        with self._lock:
+            self.latency.record(latency_ns)
+            if failed:
+                self.errors += 1
+
+    @property
+    def requests(self) -> int:
+        return self.latency.total_count
+
+    def merge(self, other: "OperationStats") -> "OperationStats":
+        self.latency.merge(other.latency)
+        self.errors += other.errors
+        return self
+
+    def histogram(self) -> Dict[str, int]:
+        counts = self.latency.bucket_counts(bound * 1_000_000 for bound in HISTOGRAM_BOUNDS_MS)
+        labels = [f"<={bound}ms" for bound in HISTOGRAM_BOUNDS_MS] + [f">{HISTOGRAM_BOUNDS_MS[-1]}ms"]
+        return dict(zip(labels, counts))
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "p50_ms": round(self.latency.percentile(50) / 1e6, 3),
+            "p90_ms": round(self.latency.percentile(90) / 1e6, 3),
+            "p99_ms": round(self.latency.percentile(99) / 1e6, 3),
+            "max_ms": round(self.latency.max_ns / 1e6, 3),
+            "histogram": self.histogram(),
+        }
+
+
+@dataclass
+class LoadReport:
+    """Итог нагрузочного прогона"""
+    profile: LoadProfile
+    elapsed: float
+    operations: Dict[str, OperationStats]
+
+    @property
+    def total_requests(self) -> int:
+        return sum(stats.requests for stats in self.operations.values())
+
+    @property
+    def total_errors(self) -> int:
+        return sum(stats.errors for stats in self.operations.values())
+
+    @property
+    def throughput(self) -> float:
+        return self.total_requests / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.total_errors / self.total_requests if self.total_requests else 0.0
+
+    def to_dict(self) -> dict:
+        overall = OperationStats()
+        for stats in self.operations.values():
+            overall.merge(stats)
+        return {
+            "profile": {
+                "mix": self.profile.mix,
+                "duration_s": self.profile.duration,
+                "concurrency": self.profile.concurrency,
+                "target_rps": self.profile.target_rps,
+            },
+            "elapsed_s": round(self.elapsed, 3),
+            "throughput_rps": round(self.throughput, 2),
+            "error_rate": round(self.error_rate, 4),
+            "overall": overall.to_dict(),
+            "operations": {name: stats.to_dict() for name, stats in self.operations.items()},
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+
+    def attach_to_allure(self, name: str = "Результаты нагрузочного прогона"):
+        allure.attach(self.to_json(), name=name, attachment_type=allure.attachment_type.JSON)
+
+
+class LoadRunner:
+    """
+    Нагрузочный драйвер поверх BookingClient/AuthClient.
+
+    Потоки-исполнители выбирают операцию по весам из LoadProfile.mix и выполняют ее
+    до истечения длительности прогона. Бронирования, созданные подготовкой и операцией create,
+    удаляются после прогона вне замеряемого окна. При заданном target_rps запуски распределяются
+    по общему расписанию, иначе каждый поток работает без пауз (замкнутая модель).
+    В режиме target_rps задержка считается от запланированного времени запуска, а не от
+    фактического: ожидание свободного потока входит в задержку (без coordinated omission).
+    """
+
+    def __init__(self, booking_client, auth_client, profile: LoadProfile):
+        self.booking_client = booking_client
+        self.auth_client = auth_client
+        self.profile = profile
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._booking_ids: List[int] = []
+        self._ids_lock = threading.Lock()
+        self._schedule_lock = threading.Lock()
+        self._next_slot = 0
+        self._token: Optional[str] = None
+        self._operations: Dict[str, Callable[[], object]] = {
+            "get": self._op_get,
+            "list": self.booking_client.get_all_bookings,
+            "create": self._op_create,
+            "update": self._op_update,
+            "partial_update": self._op_partial_update,
+            "auth": self.auth_client.create_token,
+        }
+        unknown = set(profile.mix) - set(self._operations)
+        if unknown:
+            raise ValueError(f"Неизвестные операции в смеси: {', '.join(sorted(unknown))}")
+
+    def run(self) -> LoadReport:
+        """Выполняет прогон и возвращает отчет"""
+        with allure.step(f"Нагрузочный прогон: {self.profile.duration} с, смесь {self.profile.mix}"):
+            self._prepare()
+            stats = {name: OperationStats() for name in self.profile.mix}
+            names = list(self.profile.mix)
+            weights = [self.profile.mix[name] for name in names]
+
+            try:
+                started = time.perf_counter()
+                deadline = started + self.profile.duration
+                with ThreadPoolExecutor(max_workers=self.profile.concurrency, thread_name_prefix="load") as executor:
+                    for _ in range(self.profile.concurrency):
+                        executor.submit(self._worker, names, weights, stats, started, deadline)
+                elapsed = time.perf_counter() - started
+            finally:
+                self._cleanup()
+
+            report = LoadReport(profile=self.profile, elapsed=elapsed, operations=stats)
+            self.logger.info(
+                f"Прогон завершен: {report.total_requests} запросов, "
+                f"{report.throughput:.1f} rps, ошибок {report.error_rate:.2%}"
+            )
+            return report
+
+    def _prepare(self):
+        with allure.step("Подготовка данных для нагрузки"):
+            self._token = self.auth_client.get_token()
+            payloads = [create_booking_payload(firstname="Load", lastname=f"Seed{i}")
+                        for i in range(self.profile.seed_bookings)]
+            results = self.booking_client.create_many(payloads)
+            self._booking_ids = [result.result for result in results if result.ok]
+            if not self._booking_ids:
+                raise RuntimeError("Не удалось создать начальные бронирования для нагрузки")
+
+    def _cleanup(self):
+        """Удаляет бронирования прогона, чтобы повторные прогоны не наращивали данные на стенде"""
+        with self._ids_lock:
+            booking_ids, self._booking_ids = self._booking_ids, []
+        if not booking_ids:
+            return
+        with allure.step(f"Удаление бронирований, созданных прогоном: {len(booking_ids)}"):
+            try:
+                results = self.booking_client.delete_many(booking_ids, self.auth_client.get_token())
+            except Exception as e:
+                self.logger.warning(f"Не удалось удалить бронирования прогона: {e}")
+                return
+            failed = [result.item for result in results if not result.ok]
+            if failed:
+                self.logger.warning(f"Не удалось удалить {len(failed)} бронирований: {failed[:10]}")
+
+    def _worker(self, names, weights, stats, started, deadline):
+        rng = random.Random()
+        while True:
+            if self.profile.target_rps:
+                slot_time = self._reserve_slot(started)
+                if slot_time >= deadline:
+                    return
+                time.sleep(max(slot_time - time.perf_counter(), 0))
+            elif time.perf_counter() >= deadline:
+                return
+
+            name = rng.choices(names, weights)[0]
+            if self.profile.target_rps:
+                begin = int(slot_time * 1_000_000_000)
+            else:
+                begin = time.perf_counter_ns()
+            failed = False
+            try:
+                self._operations[name]()
+            except Exception as e:
+                failed = True
+                self.logger.warning(f"Ошибка операции {name}: {e}")
+            stats[name].record(time.perf_counter_ns() - begin, failed)
+
+    def _reserve_slot(self, started: float) -> float:
+        """Выдает время следующего запуска по общему расписанию target_rps"""
+        with self._schedule_lock:
+            slot = self._next_slot
+            self._next_slot += 1
+        return started + slot / self.profile.target_rps
+
+    def _random_booking_id(self) -> int:
+        with self._ids_lock:
+            return random.choice(self._booking_ids)
+
+    def _op_get(self):
+        return self.booking_client.get_booking_by_id(self._random_booking_id())
+
+    def _op_create(self):
+        booking_id = self.booking_client.create_booking(create_booking_payload(firstname="Load", lastname="Create"))
+        with self._ids_lock:
+            self._booking_ids.append(booking_id)
+        return booking_id
+
+    def _op_update(self):
+        return self.booking_client.update_booking_full(
+            self._random_booking_id(), self._token, create_update_payload(firstname="Load", lastname="Update")
+        )
+
+    def _op_partial_update(self):
+        return self.booking_client.partial_update_booking(
+            self._random_booking_id(), self._token, {"additionalneeds": "Load"}
+        )
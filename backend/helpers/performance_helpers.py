@@ -1,11 +1,11 @@
 import time
 
 def measure_response_time(func, *args, **kwargs):
-    """Измерение времени выполнения функции."""
-    start_time = time.time()
+    """Измерение времени выполнения функции (монотонный счетчик высокого разрешения), в секундах."""
+    start_time = time.perf_counter_ns()
     result = func(*args, **kwargs)
-    end_time = time.time()
-    return result, end_time - start_time
+    end_time = time.perf_counter_ns()
+    return result, (end_time - start_time) / 1e9
 
 def assert_response_time(response_time: float, max_time: float = 2.0):
     """Проверка времени ответа."""
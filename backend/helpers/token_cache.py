@@ -0,0 +1,113 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from filelock import FileLock
+
+
+@dataclass
+class CachedToken:
+    token: str
+    expires_at: float
+
+
+class MemoryTokenStore:
+    """Хранилище токенов в памяти процесса"""
+
+    def __init__(self):
+        self._tokens: Dict[str, CachedToken] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedToken]:
+        return self._tokens.get(key)
+
+    def set(self, key: str, value: CachedToken):
+        self._tokens[key] = value
+
+    @contextmanager
+    def lock(self):
+        with self._lock:
+            yield
+
+
+class FileTokenStore:
+    """
+    Хранилище токенов в JSON-файле под файловой блокировкой.
+
+    Используется для обмена токенами между воркерами pytest-xdist: файл лежит
+    в общем для всех воркеров каталоге, поэтому токен запрашивает только первый из них.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file_lock = FileLock(str(self.path) + ".lock")
+        self._thread_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedToken]:
+        if not self.path.exists():
+            return None
+        data = json.loads(self.path.read_text(encoding="utf-8") or "{}")
+        entry = data.get(key)
+        return CachedToken(**entry) if entry else None
+
+    def set(self, key: str, value: CachedToken):
+        data = json.loads(self.path.read_text(encoding="utf-8") or "{}") if self.path.exists() else {}
+        data[key] = {"token": value.token, "expires_at": value.expires_at}
+        self.path.write_text(json.dumps(data), encoding="utf-8")
+
+    @contextmanager
+    def lock(self):
+        with self._thread_lock, self._file_lock:
+            yield
+
+
+class TokenCache:
+    """
+    Кэш токенов авторизации по адресу API и учетным данным.
+
+    Токен живет ttl секунд и обновляется заранее: если до истечения осталось меньше
+    refresh_margin, следующий запрос к кэшу получает новый токен (ленивое обновление).
+    Локальная копия в памяти избавляет от чтения общего хранилища на каждый вызов.
+    """
+
+    def __init__(self, store=None, ttl: float = 600, refresh_margin: float = 60):
+        if ttl <= refresh_margin:
+            raise ValueError(f"TTL токена ({ttl} с) должен быть больше запаса на обновление ({refresh_margin} с)")
+        self.store = store or MemoryTokenStore()
+        self.ttl = ttl
+        self.refresh_margin = refresh_margin
+        self._local: Dict[str, CachedToken] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def get_token(self, base_url: str, username: str, password: str, factory: Callable[[], str]) -> str:
+        """
+        Возвращает закэшированный токен или получает новый через factory.
+
+        :param factory: функция, выполняющая реальный запрос токена
+        """
+        key = self._key(base_url, username, password)
+        entry = self._local.get(key)
+        if self._is_fresh(entry):
+            return entry.token
+
+        with self.store.lock():
+            entry = self.store.get(key)
+            if not self._is_fresh(entry):
+                self.logger.info(f"Запрос нового токена для пользователя {username}")
+                entry = CachedToken(token=factory(), expires_at=time.time() + self.ttl)
+                self.store.set(key, entry)
+            self._local[key] = entry
+            return entry.token
+
+    def _is_fresh(self, entry: Optional[CachedToken]) -> bool:
+        return entry is not None and time.time() < entry.expires_at - self.refresh_margin
+
+    @staticmethod
+    def _key(base_url: str, username: str, password: str) -> str:
+        return hashlib.sha256(f"{base_url}\0{username}\0{password}".encode()).hexdigest()
@@ -1,6 +1,9 @@
-from pydantic import BaseModel, RootModel, field_serializer
+from pydantic import BaseModel, RootModel, TypeAdapter, field_serializer
 from datetime import date
-from typing import List
+from typing import Any, Dict, List, Type, TypeVar
+from typing_extensions import TypedDict
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 class BookingDates(BaseModel):
     checkin: date
@@ -44,10 +47,36 @@ class BookingIdItem(BaseModel):
 class BookingListResponseItem(RootModel):
     root: List[BookingIdItem]
 
+class BookingIdDict(TypedDict):
+    """Та же схема, что BookingIdItem, но без создания экземпляра модели на каждый элемент"""
+    bookingid: int
+
+# Схема списка ID собирается один раз; validate_json разбирает и проверяет байты ответа за один проход
+BOOKING_ID_LIST_ADAPTER = TypeAdapter(List[BookingIdDict])
+# Для потокового разбора, где элементы списка проверяются по одному
+BOOKING_ID_ADAPTER = TypeAdapter(BookingIdDict)
+
 class BookingUpdateResponse(BaseModel):
     firstname: str
     lastname: str
     totalprice: int
     depositpaid: bool
     bookingdates: BookingDates
-    additionalneeds: str = ""
\ No newline at end of file
+    additionalneeds: str = ""
+
+
+def construct_booking(model_cls: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    """
+    Собрать модель бронирования без валидации (trusted-режим клиента).
+
+    Поля ответа принимаются как есть, разбираются только даты, чтобы модель
+    сериализовалась так же, как провалидированная.
+    """
+    fields = dict(data)
+    dates = fields.get("bookingdates")
+    if isinstance(dates, dict):
+        fields["bookingdates"] = BookingDates.model_construct(
+            checkin=date.fromisoformat(dates["checkin"]),
+            checkout=date.fromisoformat(dates["checkout"])
+        )
+    return model_cls.model_construct(**fields)
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Any, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class BulkItemResult(Generic[T]):
+    """Результат одной операции пакетного вызова: входной элемент и результат либо ошибка"""
+    index: int
+    item: Any
+    result: Optional[T] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
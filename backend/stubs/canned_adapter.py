@@ -0,0 +1,63 @@
+import json
+import re
+from typing import Any, List, Tuple
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+BOOKING = {
+    "firstname": "Bench",
+    "lastname": "Mark",
+    "totalprice": 100,
+    "depositpaid": True,
+    "bookingdates": {"checkin": "2025-01-01", "checkout": "2025-01-05"},
+    "additionalneeds": "Breakfast",
+}
+
+DEFAULT_ROUTES: List[Tuple[str, str, int, Any]] = [
+    ("POST", r"/auth$", 200, {"token": "abc123def456ghi"}),
+    ("GET", r"/booking$", 200, [{"bookingid": i} for i in range(1, 11)]),
+    ("POST", r"/booking$", 200, {"bookingid": 1, "booking": BOOKING}),
+    ("GET", r"/booking/\d+$", 200, BOOKING),
+    ("PUT", r"/booking/\d+$", 200, BOOKING),
+    ("PATCH", r"/booking/\d+$", 200, BOOKING),
+    ("DELETE", r"/booking/\d+$", 201, "Created"),
+]
+
+
+class CannedResponseAdapter(BaseAdapter):
+    """
+    Транспорт requests, отвечающий заранее подготовленными ответами без сети.
+
+    Нужен для микробенчмарков клиентского слоя: время сети исключено,
+    остаются только затраты самих BookingClient/AuthClient.
+    """
+
+    def __init__(self, routes: List[Tuple[str, str, int, Any]] = None):
+        super().__init__()
+        self.routes = []
+        for method, pattern, status, body in routes or DEFAULT_ROUTES:
+            content = body.encode() if isinstance(body, str) else json.dumps(body).encode()
+            self.routes.append((method, re.compile(pattern), status, content))
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        path = request.path_url.split("?", 1)[0]
+        for method, pattern, status, content in self.routes:
+            if method == request.method and pattern.search(path):
+                return self._build_response(request, status, content)
+        return self._build_response(request, 404, b"Not Found")
+
+    def close(self):
+        pass
+
+    @staticmethod
+    def _build_response(request: PreparedRequest, status: int, content: bytes) -> Response:
+        response = Response()
+        response.status_code = status
+        response._content = content
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
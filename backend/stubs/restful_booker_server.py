@@ -0,0 +1,263 @@
+import itertools
+import json
+import logging
+import secrets
+import threading
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import ValidationError
+
+from backend.models.auth import AuthRequest
+from backend.models.booking import BookingCreateRequest
+
+ADMIN_USERNAME = "admin"
+ADMIN_PASSWORD = "password123"
+ADMIN_BASIC_AUTH = "Basic YWRtaW46cGFzc3dvcmQxMjM="
+
+
+class BookingStore:
+    """Потокобезопасное in-memory хранилище бронирований с поиском по ID за O(1)"""
+
+    def __init__(self):
+        self._bookings: Dict[int, Dict[str, Any]] = {}
+        self._ids = itertools.count(1)
+        self._tokens = set()
+        self._lock = threading.Lock()
+
+    def issue_token(self) -> str:
+        token = secrets.token_hex(8)[:15]
+        with self._lock:
+            self._tokens.add(token)
+        return token
+
+    def is_valid_token(self, token: Optional[str]) -> bool:
+        with self._lock:
+            return token in self._tokens
+
+    def create(self, booking: Dict[str, Any]) -> int:
+        with self._lock:
+            booking_id = next(self._ids)
+            self._bookings[booking_id] = booking
+            return booking_id
+
+    def get(self, booking_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._bookings.get(booking_id)
+
+    def replace(self, booking_id: int, booking: Dict[str, Any]) -> bool:
+        with self._lock:
+            if booking_id not in self._bookings:
+                return False
+            self._bookings[booking_id] = booking
+            return True
+
+    def delete(self, booking_id: int) -> bool:
+        with self._lock:
+            return self._bookings.pop(booking_id, None) is not None
+
+    def find(self, firstname: str = None, lastname: str = None,
+             checkin: str = None, checkout: str = None) -> List[int]:
+        """Фильтрация по правилам Restful-Booker: имена на равенство, даты - не раньше указанной"""
+        with self._lock:
+            items = list(self._bookings.items())
+        return [
+            booking_id for booking_id, booking in items
+            if (firstname is None or booking["firstname"] == firstname)
+            and (lastname is None or booking["lastname"] == lastname)
+            and (checkin is None or booking["bookingdates"]["checkin"] >= checkin)
+            and (checkout is None or booking["bookingdates"]["checkout"] >= checkout)
+        ]
+
+
+class _RestfulBookerHandler(BaseHTTPRequestHandler):
+    """Обработчик эндпоинтов /ping, /auth и /booking"""
+
+    protocol_version = "HTTP/1.1"
+    # Заголовки и тело пишутся отдельно: без TCP_NODELAY keep-alive ответы ждут delayed ACK (~40 мс)
+    disable_nagle_algorithm = True
+    server: "_StubHTTPServer"
+
+    def log_message(self, format, *args):
+        logging.getLogger("RestfulBookerServer").debug(format, *args)
+
+    @property
+    def store(self) -> BookingStore:
+        return self.server.store
+
+    def do_GET(self):
+        path, query = self._parse_path()
+        if path == "/ping":
+            return self._send_text(201, "Created")
+        if path == "/booking":
+            filters = {key: values[0] for key, values in query.items()
+                       if key in ("firstname", "lastname", "checkin", "checkout")}
+            return self._send_json(200, [{"bookingid": booking_id} for booking_id in self.store.find(**filters)])
+        booking_id = self._booking_id(path)
+        booking = self.store.get(booking_id) if booking_id is not None else None
+        if booking is None:
+            return self._send_text(404, "Not Found")
+        return self._send_json(200, booking)
+
+    def do_POST(self):
+        path, _ = self._parse_path()
+        body = self._read_json()
+        if path == "/auth":
+            try:
+                credentials = AuthRequest.model_validate(body)
+            except ValidationError:
+                return self._send_json(200, {"reason": "Bad credentials"})
+            if (credentials.username, credentials.password) != (ADMIN_USERNAME, ADMIN_PASSWORD):
+                return self._send_json(200, {"reason": "Bad credentials"})
+            return self._send_json(200, {"token": self.store.issue_token()})
+        if path == "/booking":
+            booking = self._validate_booking(body)
+            if booking is None:
+                return self._send_text(500, "Internal Server Error")
+            booking_id = self.store.create(booking)
+            return self._send_json(200, {"bookingid": booking_id, "booking": booking})
+        return self._send_text(404, "Not Found")
+
+    def do_PUT(self):
+        self._update_booking(partial=False)
+
+    def do_PATCH(self):
+        self._update_booking(partial=True)
+
+    def do_DELETE(self):
+        booking_id = self._authorized_booking_id()
+        if booking_id is None:
+            return
+        self.store.delete(booking_id)
+        self._send_text(201, "Created")
+
+    def _update_booking(self, partial: bool):
+        booking_id = self._authorized_booking_id()
+        if booking_id is None:
+            return
+        body = self._read_json()
+        if partial:
+            current = self.store.get(booking_id) or {}
+            if isinstance(body, dict):
+                dates = {**current.get("bookingdates", {}), **body.get("bookingdates", {})}
+                body = {**current, **body, "bookingdates": dates}
+        booking = self._validate_booking(body)
+        if booking is None:
+            return self._send_text(400, "Bad Request")
+        self.store.replace(booking_id, booking)
+        self._send_json(200, booking)
+
+    def _authorized_booking_id(self) -> Optional[int]:
+        """Проверяет токен/Basic-авторизацию и существование бронирования, иначе отвечает ошибкой"""
+        path, _ = self._parse_path()
+        booking_id = self._booking_id(path)
+        if booking_id is None:
+            self._send_text(404, "Not Found")
+            return None
+        if not self._is_authorized():
+            self._send_text(403, "Forbidden")
+            return None
+        if self.store.get(booking_id) is None:
+            self._send_text(405, "Method Not Allowed")
+            return None
+        return booking_id
+
+    def _is_authorized(self) -> bool:
+        if self.headers.get("Authorization") == ADMIN_BASIC_AUTH:
+            return True
+        cookies = dict(
+            part.strip().split("=", 1) for part in self.headers.get("Cookie", "").split(";") if "=" in part
+        )
+        return self.store.is_valid_token(cookies.get("token"))
+
+    @staticmethod
+    def _validate_booking(body: Any) -> Optional[Dict[str, Any]]:
+        try:
+            return BookingCreateRequest.model_validate(body).model_dump(mode="json")
+        except ValidationError:
+            return None
+
+    def _parse_path(self):
+        parts = urlsplit(self.path)
+        return parts.path.rstrip("/") or "/", parse_qs(parts.query)
+
+    @staticmethod
+    def _booking_id(path: str) -> Optional[int]:
+        prefix, _, raw_id = path.rpartition("/")
+        if prefix != "/booking" or not raw_id.isdigit():
+            return None
+        return int(raw_id)
+
+    def _read_json(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if "application/json" not in self.headers.get("Content-Type", ""):
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    def _send_json(self, status: int, data: Any):
+        self._send(status, json.dumps(data).encode(), "application/json; charset=utf-8")
+
+    def _send_text(self, status: int, text: str):
+        self._send(status, text.encode(), "text/plain; charset=utf-8")
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, store: BookingStore):
+        super().__init__(address, _RestfulBookerHandler)
+        self.store = store
+
+
+class RestfulBookerServer:
+    """
+    Локальная замена Restful-Booker, работающая в процессе тестов.
+
+    Поднимает HTTP-сервер на свободном порту в фоновом потоке, поэтому клиенты
+    (BookingClient, AsyncBookingClient) работают с ним без изменений.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, seed: int = 10):
+        self.store = BookingStore()
+        self._server = _StubHTTPServer((host, port), self.store)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="restful-booker-stub", daemon=True)
+        self._seed(seed)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "RestfulBookerServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _seed(self, count: int):
+        """Начальные данные, как у публичного стенда, чтобы список бронирований не был пустым"""
+        for i in range(count):
+            checkin = date.today() + timedelta(days=i)
+            self.store.create(BookingCreateRequest(
+                firstname=f"Seed{i}",
+                lastname="Booker",
+                totalprice=100 + i,
+                depositpaid=i % 2 == 0,
+                bookingdates={"checkin": checkin, "checkout": checkin + timedelta(days=3)},
+                additionalneeds="Breakfast"
+            ).model_dump(mode="json"))
@@ -1,4 +1,5 @@
 import allure
+import random
 import pytest
 from datetime import date, timedelta
 
@@ -7,9 +8,11 @@ from backend.helpers.booking_helpers import (
     assert_booking_created_correctly,
     assert_booking_updated_correctly,
     assert_booking_dates_duration,
-    assert_booking_dates_equal
+    assert_booking_dates_equal,
+    assert_bulk_succeeded
 )
-from backend.helpers.booking_operations import create_and_get_booking
+from backend.clients.booking_client import BookingClient
+from backend.helpers.booking_operations import create_and_get_booking, create_test_bookings
 
 
 @pytest.mark.booking
@@ -33,6 +36,20 @@ class TestBookingBasicOperations:
         with allure.step(f"Запрашиваем бронирование с ID {first_id}"):
             booking_client.get_booking_by_id(first_id)
 
+    def test_iter_bookings_with_filter(self, booking_client):
+        """Тест: потоковый перебор бронирований с фильтром по имени."""
+        firstname = f"Stream{random.randint(100000, 999999)}"
+        with allure.step("Создание бронирований с уникальным именем"):
+            booking_ids, _ = create_test_bookings(booking_client, [{"firstname": firstname} for _ in range(3)])
+
+        with allure.step("Потоковый перебор ID по фильтру"):
+            assert sorted(booking_client.iter_bookings(firstname=firstname)) == sorted(booking_ids)
+
+        with allure.step("Перебор с загрузкой бронирований наперед"):
+            hydrated = dict(booking_client.iter_bookings(firstname=firstname, hydrate=True, lookahead=2))
+            assert sorted(hydrated) == sorted(booking_ids)
+            assert all(booking.firstname == firstname for booking in hydrated.values())
+
     def test_get_booking_nonexistent_id(self, booking_client):
         """Тест: запрос бронирования с несуществующим ID."""
         with allure.step("Запрашиваем бронирование с ID 999999"):
@@ -297,4 +314,70 @@ class TestBookingDeletion:
         """Тест: попытка удалить несуществующее бронирование."""
         with allure.step("Попытка удаления несуществующего бронирования"):
             with pytest.raises(Exception, match=r"405|Method Not Allowed|404"):
-                booking_client.delete_booking(999999, auth_token)
\ No newline at end of file
+                booking_client.delete_booking(999999, auth_token)
+
+
+@pytest.mark.booking
+@pytest.mark.backend
+@allure.feature("Бронирования")
+@allure.story("Пакетные операции с бронированиями")
+class TestBookingBulkOperations:
+    """Тесты пакетного API BookingClient."""
+
+    def test_create_get_delete_many(self, booking_client, auth_token):
+        """Тест: пакетное создание, получение и удаление бронирований."""
+        with allure.step("Пакетное создание бронирований"):
+            booking_ids, payloads = create_test_bookings(
+                booking_client,
+                [{"firstname": f"Bulk{i}", "lastname": "Test", "totalprice": i + 1} for i in range(10)]
+            )
+
+        with allure.step("Пакетное получение бронирований"):
+            results = booking_client.get_many(booking_ids)
+            assert_bulk_succeeded(results)
+
+        with allure.step("Проверка порядка и данных результатов"):
+            for payload, result in zip(payloads, results):
+                assert result.result.firstname == payload.firstname
+                assert result.result.totalprice == payload.totalprice
+
+        with allure.step("Пакетное удаление бронирований"):
+            results = booking_client.delete_many(booking_ids, auth_token)
+            assert_bulk_succeeded(results)
+            assert all(result.result is True for result in results)
+
+    def test_get_many_reports_failures_per_item(self, booking_client):
+        """Тест: ошибка одного элемента не влияет на остальные."""
+        with allure.step("Создание бронирования"):
+            booking_ids, _ = create_test_bookings(booking_client, [{"firstname": "Partial"}])
+
+        with allure.step("Пакетное получение существующего и несуществующего ID"):
+            results = booking_client.get_many([booking_ids[0], 999999])
+
+        with allure.step("Проверка результатов по каждому элементу"):
+            assert results[0].ok
+            assert results[0].result.firstname == "Partial"
+            assert not results[1].ok
+            assert results[1].item == 999999
+            assert "404" in str(results[1].error) or "Not Found" in str(results[1].error)
+
+
+@pytest.mark.booking
+@pytest.mark.backend
+@allure.feature("Бронирования")
+@allure.story("Trusted-режим клиента")
+class TestBookingTrustedMode:
+    """Тесты клиента без валидации ответов."""
+
+    def test_trusted_client_matches_validated(self, booking_client):
+        """Тест: trusted-режим возвращает те же данные, что и режим с валидацией."""
+        trusted_client = BookingClient(booking_client.base_url, booking_client.session, trusted=True)
+
+        with allure.step("Создание бронирования trusted-клиентом"):
+            booking_id = trusted_client.create_booking(create_booking_payload(firstname="Trusted"))
+
+        with allure.step("Сравнение ответов обоих режимов"):
+            assert booking_id in trusted_client.get_all_bookings()
+            trusted = trusted_client.get_booking_by_id(booking_id)
+            validated = booking_client.get_booking_by_id(booking_id)
+            assert trusted.model_dump() == validated.model_dump()
@@ -0,0 +1,77 @@
+import asyncio
+import allure
+import pytest
+from datetime import date, timedelta
+
+from backend.factories.booking_factory import create_booking_payload, create_update_payload
+from backend.helpers.booking_helpers import assert_booking_created_correctly, assert_booking_updated_correctly
+
+
+@pytest.mark.booking
+@pytest.mark.backend
+@pytest.mark.asyncio
+@allure.feature("Бронирования")
+@allure.story("Конкурентные операции через асинхронный клиент")
+class TestAsyncBookingOperations:
+    """Тесты конкурентных операций с бронированиями через AsyncBookingClient."""
+
+    async def test_create_and_get_bookings_concurrently(self, async_booking_client):
+        """Тест: параллельное создание и получение нескольких бронирований."""
+        with allure.step("Подготовка payload для нескольких бронирований"):
+            payloads = [
+                create_booking_payload(firstname=f"Async{i}", lastname="User", totalprice=100 + i)
+                for i in range(5)
+            ]
+
+        with allure.step("Параллельное создание бронирований"):
+            booking_ids = await asyncio.gather(
+                *(async_booking_client.create_booking(payload) for payload in payloads)
+            )
+
+        with allure.step("Параллельное получение созданных бронирований"):
+            bookings = await asyncio.gather(
+                *(async_booking_client.get_booking_by_id(booking_id) for booking_id in booking_ids)
+            )
+
+        with allure.step("Проверка корректности данных бронирований"):
+            for i, booking in enumerate(bookings):
+                expected_data = {
+                    "firstname": f"Async{i}",
+                    "lastname": "User",
+                    "totalprice": 100 + i,
+                    "depositpaid": True,
+                    "checkin": date.today(),
+                    "checkout": date.today() + timedelta(days=7)
+                }
+                assert_booking_created_correctly(booking, expected_data)
+
+    async def test_update_and_delete_bookings_concurrently(self, async_booking_client, async_auth_token):
+        """Тест: параллельное обновление и удаление бронирований."""
+        with allure.step("Создание бронирований для обновления и удаления"):
+            update_id, delete_id = await asyncio.gather(
+                async_booking_client.create_booking(create_booking_payload(firstname="ToUpdate")),
+                async_booking_client.create_booking(create_booking_payload(firstname="ToDelete"))
+            )
+
+        with allure.step("Параллельное обновление одного и удаление другого бронирования"):
+            update_payload = create_update_payload(firstname="Updated", additionalneeds="Breakfast")
+            updated, deleted = await asyncio.gather(
+                async_booking_client.update_booking_full(update_id, async_auth_token, update_payload),
+                async_booking_client.delete_booking(delete_id, async_auth_token)
+            )
+
+        with allure.step("Проверка результатов"):
+            assert_booking_updated_correctly(updated, {
+                "firstname": "Updated",
+                "lastname": "User",
+                "totalprice": 200,
+                "depositpaid": False,
+                "checkin": date(2025, 2, 1),
+                "checkout": date(2025, 2, 5),
+                "additionalneeds": "Breakfast"
+            })
+            assert deleted is True
+
+        with allure.step("Проверка, что удаленное бронирование недоступно"):
+            with pytest.raises(Exception, match=r"404|Not Found"):
+                await async_booking_client.get_booking_by_id(delete_id)
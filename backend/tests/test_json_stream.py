@@ -0,0 +1,76 @@
+import json
+import random
+
+import allure
+import pytest
+
+from backend.helpers.json_stream import iter_json_array
+
+DOCUMENT = [
+    {"bookingid": 1, "firstname": "Jim", "totalprice": 111.5, "depositpaid": True},
+    {"bookingid": 22, "firstname": "Иван", "additionalneeds": None, "bookingdates": {"checkin": "2024-01-01"}},
+    -12.75e-3,
+    1e3,
+    0,
+    'строка с "кавычками" и запятой, ]',
+    [1, [2, []], {}],
+    True,
+    False,
+    None,
+]
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.backend
+@allure.feature("Потоковый разбор ответов")
+@allure.story("JSON-массив из кусков тела ответа")
+class TestJsonStream:
+    """Тесты инкрементального разбора JSON-массива."""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 4096])
+    def test_fixed_chunk_sizes(self, size):
+        """Тест: результат не зависит от размера кусков, в том числе для многобайтных символов."""
+        data = json.dumps(DOCUMENT, ensure_ascii=False, indent=1).encode("utf-8")
+        assert list(iter_json_array(_chunks(data, size))) == DOCUMENT
+
+    @pytest.mark.parametrize("chunks,expected", [
+        ([b"[1.", b"5]"], [1.5]),
+        ([b"[1e", b"3]"], [1000.0]),
+        ([b"[-", b"7, 2", b"0]"], [-7, 20]),
+        ([b"[tr", b"ue, nu", b"ll]"], [True, None]),
+        ([b"[12", b"]"], [12]),
+        ([b" [ ", b"", b" ] "], []),
+    ], ids=["fraction", "exponent", "sign", "literals", "integer", "empty"])
+    def test_scalar_split_between_chunks(self, chunks, expected):
+        """Тест: число или литерал, разрезанные между кусками, разбираются целиком."""
+        assert list(iter_json_array(chunks)) == expected
+
+    @pytest.mark.parametrize("chunks", [
+        [b"[1,]"],
+        [b"[1,", b" ]"],
+        [b"[,1]"],
+        [b"[1,,2]"],
+        [b"[1 2]"],
+        [b"{\"a\": 1}"],
+        [b"[1, 2"],
+        [b"[{\"a\": "],
+    ], ids=["trailing_comma", "trailing_comma_split", "leading_comma", "double_comma", "missing_comma",
+            "not_array", "unterminated", "truncated_object"])
+    def test_malformed_rejected(self, chunks):
+        """Тест: невалидный или оборванный массив вызывает ValueError."""
+        with pytest.raises(ValueError):
+            list(iter_json_array(chunks))
+
+    def test_random_chunking(self):
+        """Тест: случайная нарезка тела ответа дает тот же результат, что и json.loads."""
+        rng = random.Random(20241018)
+        for _ in range(200):
+            document = [rng.choice(DOCUMENT) for _ in range(rng.randint(0, 12))]
+            data = json.dumps(document, ensure_ascii=False, separators=rng.choice([(",", ":"), (", ", ": ")]))
+            data = data.encode("utf-8")
+            cuts = sorted(rng.sample(range(1, len(data)), min(len(data) - 1, rng.randint(0, 10))))
+            chunks = [data[start:end] for start, end in zip([0] + cuts, cuts + [len(data)])]
+            assert list(iter_json_array(chunks)) == json.loads(data), chunks
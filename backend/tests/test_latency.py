@@ -0,0 +1,129 @@
+import json
+import math
+import random
+
+import allure
+import pytest
+import requests
+
+from backend.helpers.latency import (
+    LatencyHistogram,
+    LatencyRecorder,
+    TimingHTTPAdapter,
+    endpoint_key,
+)
+from backend.stubs.restful_booker_server import RestfulBookerServer
+
+
+@pytest.fixture(scope="module")
+def stub_url():
+    server = RestfulBookerServer().start()
+    yield server.url
+    server.stop()
+
+
+def _exact_percentile(values, percent):
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+@pytest.mark.backend
+@allure.feature("Задержки API")
+@allure.story("Гистограммы задержек по эндпоинтам")
+class TestLatencyHistogram:
+    """Тесты гистограммы задержек, ее сериализации и записи задержек клиентом requests."""
+
+    def test_percentile_within_one_sub_bucket(self):
+        """Тест: перцентиль не меньше точного значения и отличается от него не больше чем на ширину подкорзины."""
+        rng = random.Random(20241018)
+        values = [int(rng.lognormvariate(16, 1.5)) for _ in range(20000)]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for percent in (1, 10, 50, 90, 99, 99.9):
+            exact = _exact_percentile(values, percent)
+            estimate = histogram.percentile(percent)
+            assert exact <= estimate <= exact + exact / 64 + 1, percent
+        assert histogram.percentile(100) == histogram.max_ns == max(values)
+        assert histogram.min_ns == min(values)
+        assert histogram.total_count == len(values)
+
+    def test_small_values_exact(self):
+        """Тест: значения меньше числа подкорзин хранятся точно, отрицательные приводятся к нулю."""
+        histogram = LatencyHistogram()
+        for value in (-5, 0, 1, 2, 3, 127):
+            histogram.record(value)
+        assert [histogram.percentile(p) for p in (1, 33, 50, 66, 83, 100)] == [0, 0, 1, 2, 3, 127]
+
+    def test_merge_equals_single_histogram(self):
+        """Тест: объединение гистограмм воркеров совпадает с гистограммой всех значений."""
+        rng = random.Random(7)
+        parts = [[rng.randint(1, 10 ** 9) for _ in range(500)] for _ in range(3)]
+        merged, combined = LatencyHistogram(), LatencyHistogram()
+        for part in parts:
+            histogram = LatencyHistogram()
+            for value in part:
+                histogram.record(value)
+                combined.record(value)
+            merged.merge(histogram)
+        assert merged.to_dict() == combined.to_dict()
+        assert LatencyHistogram().merge(LatencyHistogram()).to_dict()["min_ns"] is None
+
+    def test_dict_roundtrip_through_json(self):
+        """Тест: to_dict/from_dict сохраняют гистограмму, в том числе после JSON (ключи-строки)."""
+        histogram = LatencyHistogram()
+        for value in (150, 3_000, 45_000_000, 45_000_001, 2_000_000_000):
+            histogram.record(value)
+
+        for data in (histogram.to_dict(), json.loads(json.dumps(histogram.to_dict()))):
+            restored = LatencyHistogram.from_dict(data)
+            assert restored.counts == histogram.counts
+            assert restored.to_dict() == histogram.to_dict()
+            assert restored.percentile(50) == histogram.percentile(50)
+
+    def test_recorder_merges_worker_output(self):
+        """Тест: реестр контроллера объединяет to_dict() воркеров, как в pytest_testnodedown."""
+        workers = [LatencyRecorder() for _ in range(2)]
+        workers[0].record("GET /booking/{id}", 1_000_000)
+        workers[1].record("GET /booking/{id}", 3_000_000)
+        workers[1].record("POST /auth", 2_000_000)
+
+        controller = LatencyRecorder()
+        for worker in workers:
+            controller.merge_dict(worker.to_dict())
+        snapshot = controller.snapshot()
+        assert {endpoint: histogram.total_count for endpoint, histogram in snapshot.items()} == \
+               {"GET /booking/{id}": 2, "POST /auth": 1}
+        assert snapshot["GET /booking/{id}"].max_ns == 3_000_000
+        assert "GET /booking/{id}" in controller.format_table()
+
+    @pytest.mark.parametrize("method,path,key", [
+        ("get", "/booking/123", "GET /booking/{id}"),
+        ("PUT", "/booking/7/", "PUT /booking/{id}/"),
+        ("GET", "/booking", "GET /booking"),
+        ("GET", "", "GET /"),
+        ("GET", "/v2/booking/42/guests/3", "GET /v2/booking/{id}/guests/{id}"),
+        ("GET", "/booking/12abc", "GET /booking/12abc"),
+    ], ids=["id", "trailing_slash", "collection", "root", "nested", "not_numeric"])
+    def test_endpoint_key_collapses_numeric_ids(self, method, path, key):
+        """Тест: числовые сегменты пути заменяются на {id}, остальные сохраняются."""
+        assert endpoint_key(method, path) == key
+
+    def test_timing_adapter_records_each_request(self, stub_url):
+        """Тест: TimingHTTPAdapter записывает одно значение на запрос к локальной заглушке."""
+        recorder = LatencyRecorder()
+        session = requests.Session()
+        session.mount("http://", TimingHTTPAdapter(recorder=recorder))
+
+        booking_ids = [item["bookingid"] for item in session.get(f"{stub_url}/booking").json()]
+        for booking_id in booking_ids[:3]:
+            session.get(f"{stub_url}/booking/{booking_id}")
+        session.get(f"{stub_url}/booking/999999")
+        session.close()
+
+        snapshot = recorder.snapshot()
+        assert {endpoint: histogram.total_count for endpoint, histogram in snapshot.items()} == \
+               {"GET /booking": 1, "GET /booking/{id}": 4}
+        assert all(histogram.min_ns > 0 for histogram in snapshot.values())
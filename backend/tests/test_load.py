@@ -0,0 +1,103 @@
+import time
+from types import SimpleNamespace
+
+import allure
+import pytest
+import requests
+
+from backend.clients.auth_client import AuthClient
+from backend.clients.booking_client import BookingClient
+from backend.helpers.load_testing import LoadProfile, LoadRunner
+from backend.stubs.restful_booker_server import RestfulBookerServer
+
+
+class SlowBookingClient:
+    """Клиент без сети: каждый запрос бронирования занимает delay секунд"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def create_many(self, payloads):
+        return [SimpleNamespace(ok=True, result=i) for i, _ in enumerate(payloads, 1)]
+
+    def delete_many(self, booking_ids, token):
+        return [SimpleNamespace(ok=True, item=booking_id) for booking_id in booking_ids]
+
+    def get_all_bookings(self):
+        time.sleep(self.delay)
+        return []
+
+    def get_booking_by_id(self, booking_id):
+        time.sleep(self.delay)
+        return booking_id
+
+
+@pytest.mark.load
+@pytest.mark.backend
+@allure.feature("Нагрузка")
+@allure.story("Смешанная нагрузка на API бронирований")
+class TestBookingLoad:
+    """Нагрузочные тесты API бронирований (запускаются с опцией --load)."""
+
+    def test_mixed_operations_load(self, request, booking_client, auth_client, load_profile):
+        """Тест: смешанная нагрузка с проверкой доли ошибок."""
+        with allure.step("Запуск нагрузочного прогона"):
+            report = LoadRunner(booking_client, auth_client, load_profile).run()
+
+        with allure.step("Сохранение результатов"):
+            report.attach_to_allure()
+            report_path = request.config.getoption("--load_report")
+            if report_path:
+                with open(report_path, "w", encoding="utf-8") as report_file:
+                    report_file.write(report.to_json())
+
+        with allure.step("Проверка доли ошибок"):
+            max_error_rate = request.config.getoption("--load_max_error_rate")
+            assert report.total_requests > 0, "Не выполнено ни одного запроса"
+            assert report.error_rate <= max_error_rate, \
+                f"Доля ошибок {report.error_rate:.2%} превышает допустимую {max_error_rate:.2%}"
+
+
+@pytest.mark.backend
+@allure.feature("Нагрузка")
+@allure.story("Измерение задержек нагрузочного драйвера")
+class TestLoadRunnerLatency:
+    """Тесты учета задержек LoadRunner без обращения к API."""
+
+    def test_target_rps_latency_includes_queueing(self):
+        """Тест: при target_rps выше пропускной способности задержка включает ожидание в очереди."""
+        profile = LoadProfile(mix={"get": 1.0}, duration=0.2, concurrency=1, target_rps=50, seed_bookings=1)
+        auth_client = SimpleNamespace(get_token=lambda: "token", create_token=lambda: "token")
+        report = LoadRunner(SlowBookingClient(0.05), auth_client, profile).run()
+
+        stats = report.operations["get"]
+        assert stats.requests == 10
+        # 10 запусков по расписанию за 0.2 с, а обслуживание - 0.5 с: последний ждет ~0.3 с
+        assert stats.latency.max_ns >= 250_000_000
+        assert stats.latency.percentile(50) > 50_000_000
+
+
+@pytest.mark.backend
+@allure.feature("Нагрузка")
+@allure.story("Очистка данных нагрузочного прогона")
+class TestLoadRunnerCleanup:
+    """Тесты удаления данных, созданных нагрузочным прогоном."""
+
+    def test_created_bookings_deleted_after_run(self):
+        """Тест: начальные и созданные под нагрузкой бронирования удаляются после прогона."""
+        server = RestfulBookerServer(seed=3).start()
+        session = requests.Session()
+        session.headers.update({"Content-Type": "application/json", "Accept": "application/json"})
+        try:
+            profile = LoadProfile(mix={"get": 0.4, "create": 0.4, "update": 0.2}, duration=0.3,
+                                  concurrency=2, seed_bookings=5)
+            runner = LoadRunner(BookingClient(server.url, session, quiet=True),
+                                AuthClient(server.url, session, quiet=True), profile)
+            report = runner.run()
+
+            assert report.operations["create"].requests > 0
+            assert report.total_errors == 0
+            assert len(server.store.find()) == 3
+        finally:
+            session.close()
+            server.stop()
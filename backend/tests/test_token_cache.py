@@ -0,0 +1,108 @@
+from threading import Barrier, Thread
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from backend.helpers import token_cache as token_cache_module
+from backend.helpers.token_cache import FileTokenStore, TokenCache
+
+BASE_URL = "https://restful-booker.herokuapp.com"
+
+
+class TokenFactory:
+    """Выдает токены token-1, token-2, ... и считает запросы"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        return f"token-{self.calls}"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Управляемое время для модуля кэша токенов"""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(token_cache_module, "time", SimpleNamespace(time=lambda: now.value))
+    return now
+
+
+@pytest.mark.backend
+@allure.feature("Авторизация")
+@allure.story("Кэш токенов")
+class TestTokenCache:
+    """Тесты срока жизни токенов и общего хранилища для воркеров."""
+
+    def test_ttl_not_greater_than_margin_rejected(self):
+        """Тест: TTL не больше запаса на обновление - ошибка конфигурации."""
+        with pytest.raises(ValueError):
+            TokenCache(ttl=60, refresh_margin=60)
+        with pytest.raises(ValueError):
+            TokenCache(ttl=30, refresh_margin=60)
+
+    def test_token_reused_until_refresh_margin(self, clock):
+        """Тест: токен переиспользуется до порога ttl - refresh_margin, после него запрашивается новый."""
+        cache = TokenCache(ttl=100, refresh_margin=10)
+        factory = TokenFactory()
+        assert cache.get_token(BASE_URL, "admin", "password123", factory) == "token-1"
+
+        clock.value += 89
+        assert cache.get_token(BASE_URL, "admin", "password123", factory) == "token-1"
+        clock.value += 1
+        assert cache.get_token(BASE_URL, "admin", "password123", factory) == "token-2"
+        assert factory.calls == 2
+
+    def test_expired_token_refreshed(self, clock):
+        """Тест: истекший токен не возвращается."""
+        cache = TokenCache(ttl=100, refresh_margin=10)
+        factory = TokenFactory()
+        cache.get_token(BASE_URL, "admin", "password123", factory)
+        clock.value += 500
+        assert cache.get_token(BASE_URL, "admin", "password123", factory) == "token-2"
+
+    def test_tokens_keyed_by_url_and_credentials(self, clock):
+        """Тест: разные адреса и учетные данные получают свои токены."""
+        cache = TokenCache(ttl=100, refresh_margin=10)
+        factory = TokenFactory()
+        tokens = {
+            cache.get_token(BASE_URL, "admin", "password123", factory),
+            cache.get_token(BASE_URL, "admin", "other", factory),
+            cache.get_token("http://127.0.0.1:3001", "admin", "password123", factory),
+        }
+        assert len(tokens) == 3 and factory.calls == 3
+
+    def test_file_store_shares_token_between_caches(self, tmp_path):
+        """Тест: кэши с общим файлом (как воркеры xdist) запрашивают токен один раз."""
+        path = tmp_path / "auth_tokens.json"
+        caches = [TokenCache(store=FileTokenStore(path), ttl=600, refresh_margin=60) for _ in range(2)]
+        factory = TokenFactory()
+        barrier = Barrier(len(caches))
+        tokens = []
+
+        def worker(cache):
+            barrier.wait()
+            tokens.append(cache.get_token(BASE_URL, "admin", "password123", factory))
+
+        threads = [Thread(target=worker, args=(cache,)) for cache in caches]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert tokens == ["token-1", "token-1"]
+        assert factory.calls == 1
+
+    def test_file_store_refreshes_shared_token(self, tmp_path, clock):
+        """Тест: токен, обновленный одним кэшем, подхватывается другим без нового запроса."""
+        path = tmp_path / "auth_tokens.json"
+        first, second = (TokenCache(store=FileTokenStore(path), ttl=100, refresh_margin=10) for _ in range(2))
+        factory = TokenFactory()
+        assert first.get_token(BASE_URL, "admin", "password123", factory) == "token-1"
+        assert second.get_token(BASE_URL, "admin", "password123", factory) == "token-1"
+
+        clock.value += 95
+        assert first.get_token(BASE_URL, "admin", "password123", factory) == "token-2"
+        assert second.get_token(BASE_URL, "admin", "password123", factory) == "token-2"
+        assert factory.calls == 2
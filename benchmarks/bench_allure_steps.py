@@ -0,0 +1,100 @@
+"""
+Бенчмарк накладных расходов шагов и вложений Allure на один запрос клиентского слоя.
+
+Внутри процесса поднимается слушатель Allure, как при реальном прогоне pytest
+(шаги попадают в результат теста, вложения - в память), и сравниваются режимы
+с включенной и выключенной отчетностью (common.reporting.set_enabled).
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_allure_steps --iterations 500
+"""
+import argparse
+import logging
+import time
+
+import allure_commons
+from allure_commons.logger import AllureMemoryLogger
+from allure_commons.model2 import TestResult, TestStepResult
+from allure_commons.reporter import AllureReporter
+from allure_commons.utils import now, uuid4
+
+from benchmarks.bench_client_overhead import BASE_URL, REQUESTS_PER_MIX, _request_mix, _session
+from backend.clients.auth_client import AuthClient
+from backend.clients.booking_client import BookingClient
+from backend.factories.booking_factory import create_booking_payload
+from common import reporting
+
+
+class _BenchListener:
+    """Минимальный аналог AllureListener из allure-pytest: шаги и вложения текущего теста"""
+
+    def __init__(self, reporter: AllureReporter):
+        self.reporter = reporter
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self.reporter.start_step(None, uuid, TestStepResult(name=title, start=now()))
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        self.reporter.stop_step(uuid, stop=now())
+
+    @allure_commons.hookimpl
+    def attach_data(self, body, name, attachment_type, extension):
+        self.reporter.attach_data(uuid4(), body, name=name, attachment_type=attachment_type, extension=extension)
+
+
+def measure(enabled: bool, iterations: int, rounds: int) -> tuple:
+    """Возвращает (мкс CPU на запрос, число шагов на запрос)"""
+    reporting.set_enabled(enabled)
+    reporter = AllureReporter()
+    memory_logger = AllureMemoryLogger()
+    listener = _BenchListener(reporter)
+    allure_commons.plugin_manager.register(listener)
+    allure_commons.plugin_manager.register(memory_logger)
+    try:
+        session = _session()
+        booking_client = BookingClient(BASE_URL, session, quiet=True)
+        auth_client = AuthClient(BASE_URL, session, quiet=True)
+        payload = create_booking_payload()
+
+        best = float("inf")
+        for _ in range(rounds):
+            test_uuid = uuid4()
+            reporter.schedule_test(test_uuid, TestResult(name="bench", uuid=test_uuid, start=now()))
+            started = time.process_time()
+            for _ in range(iterations):
+                _request_mix(booking_client, auth_client, payload)
+            best = min(best, time.process_time() - started)
+            reporter.close_test(test_uuid)
+
+        steps = _count_steps(memory_logger.test_cases[-1].get("steps", [])) if memory_logger.test_cases else 0
+        return best / (iterations * REQUESTS_PER_MIX) * 1e6, steps / (iterations * REQUESTS_PER_MIX)
+    finally:
+        allure_commons.plugin_manager.unregister(listener)
+        allure_commons.plugin_manager.unregister(memory_logger)
+        reporting.set_enabled(True)
+
+
+def _count_steps(steps) -> int:
+    return sum(1 + _count_steps(step.get("steps", [])) for step in steps)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    logging.basicConfig(handlers=[logging.NullHandler()])
+
+    print(f"{'режим':<24} {'мкс CPU/запрос':>16} {'шагов/запрос':>14}")
+    results = {}
+    for name, enabled in (("Allure включен", True), ("Allure выключен", False)):
+        results[enabled] = measure(enabled, args.iterations, args.rounds)
+        cost, steps = results[enabled]
+        print(f"{name:<24} {cost:>16.1f} {steps:>14.1f}")
+    print(f"Экономия на запрос: {results[True][0] - results[False][0]:.1f} мкс")
+
+
+if __name__ == "__main__":
+    main()
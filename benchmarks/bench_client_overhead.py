@@ -0,0 +1,95 @@
+"""
+Микробенчмарк CPU-затрат клиентского слоя BookingClient/AuthClient на один запрос.
+
+Сеть исключена через CannedResponseAdapter, поэтому измеряется только работа клиента:
+логирование, сериализация payload, парсинг и валидация ответа. Режим "прежний клиент"
+(benchmarks/legacy_clients.py) повторяет логирование f-строками и разбор ответов до
+перехода на ленивое логирование; остальные режимы сравниваются с ним при том же уровне лога.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_client_overhead --iterations 5000
+"""
+import argparse
+import logging
+import time
+
+import requests
+
+from backend.clients.auth_client import AuthClient
+from backend.clients.booking_client import BookingClient
+from backend.factories.booking_factory import create_booking_payload
+from backend.stubs.canned_adapter import CannedResponseAdapter
+from benchmarks.legacy_clients import LegacyAuthClient, LegacyBookingClient
+
+BASE_URL = "http://bench.local"
+
+
+def _session() -> requests.Session:
+    session = requests.Session()
+    # Иначе requests на каждый запрос перебирает os.environ в поисках прокси, и это заслоняет клиентский слой
+    session.trust_env = False
+    session.mount("http://", CannedResponseAdapter())
+    return session
+
+
+def _request_mix(booking_client: BookingClient, auth_client: AuthClient, payload):
+    auth_client.create_token()
+    booking_client.create_booking(payload)
+    booking_client.get_booking_by_id(1)
+    booking_client.update_booking_full(1, "token", payload)
+    booking_client.partial_update_booking(1, "token", {"firstname": "Bench"})
+    booking_client.delete_booking(1, "token")
+
+
+REQUESTS_PER_MIX = 6
+
+
+def measure(quiet: bool, log_level: int, iterations: int, rounds: int = 5, legacy: bool = False) -> float:
+    """Возвращает CPU-время на один запрос в микросекундах (лучший из rounds прогонов)"""
+    logging.getLogger().setLevel(log_level)
+    session = _session()
+    booking_cls, auth_cls = (LegacyBookingClient, LegacyAuthClient) if legacy else (BookingClient, AuthClient)
+    booking_client = booking_cls(BASE_URL, session, quiet=quiet)
+    auth_client = auth_cls(BASE_URL, session, quiet=quiet)
+    payload = create_booking_payload()
+
+    for _ in range(50):
+        _request_mix(booking_client, auth_client, payload)
+
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.process_time()
+        for _ in range(iterations):
+            _request_mix(booking_client, auth_client, payload)
+        best = min(best, time.process_time() - started)
+    return best / (iterations * REQUESTS_PER_MIX) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    # Логи уходят в NullHandler: измеряется форматирование, а не вывод в консоль
+    logging.basicConfig(handlers=[logging.NullHandler()])
+
+    legacy = {level: measure(False, level, args.iterations, args.rounds, legacy=True)
+              for level in (logging.INFO, logging.WARNING)}
+    modes = [
+        ("INFO включен, обычный режим", False, logging.INFO),
+        ("INFO выключен, обычный режим", False, logging.WARNING),
+        ("INFO включен, quiet-режим", True, logging.INFO),
+        ("INFO выключен, quiet-режим", True, logging.WARNING),
+    ]
+    print(f"{'режим':<36} {'мкс CPU/запрос':>16} {'к прежнему':>11}")
+    for level, value in legacy.items():
+        name = f"INFO {'включен' if level == logging.INFO else 'выключен'}, прежний клиент"
+        print(f"{name:<36} {value:>16.1f} {'-':>11}")
+    for name, quiet, level in modes:
+        value = measure(quiet, level, args.iterations, args.rounds)
+        print(f"{name:<36} {value:>16.1f} {(value / legacy[level] - 1) * 100:>+10.0f}%")
+
+
+if __name__ == "__main__":
+    main()
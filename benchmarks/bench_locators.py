@@ -0,0 +1,77 @@
+"""
+Бенчмарк поиска элементов: исходный XPath против скомпилированного локатора (CSS, где возможно).
+
+Страница открывается в браузере один раз: сохраненная страница OpenCart (файл .html,
+например "Сохранить как" из браузера) или адрес живого стенда. Для каждого XPath-локатора
+page objects замеряется find_elements в исходном и скомпилированном виде.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_locators --page saved/admin_customer_form.html --browser chrome
+    python -m benchmarks.bench_locators --page http://localhost:8081/administration
+"""
+import argparse
+import time
+from pathlib import Path
+
+from selenium.webdriver.common.by import By
+
+from frontend.driver.factory import DriverConfig, create_driver
+from frontend.page_object.account_login_page import AccountLoginPage
+from frontend.page_object.admin_page import AdminPage
+from frontend.page_object.catalog_page import CatalogPage
+from frontend.page_object.header_elements import HeaderElements
+from frontend.page_object.listpage import ListPage
+from frontend.page_object.locators import compile_locator, is_locator_attribute
+from frontend.page_object.main_page import MainPage
+
+PAGE_CLASSES = [AdminPage, AccountLoginPage, CatalogPage, HeaderElements, ListPage, MainPage]
+
+
+def _page_locators():
+    locators = {}
+    for page_class in PAGE_CLASSES:
+        for name, value in vars(page_class).items():
+            if is_locator_attribute(name, value):
+                locators.setdefault(value, f"{page_class.__name__}.{name}")
+    return locators
+
+
+def measure(driver, by: str, value: str, rounds: int) -> tuple:
+    """Возвращает (лучшее время find_elements в мс, число найденных элементов)"""
+    best = float("inf")
+    found = 0
+    for _ in range(rounds):
+        started = time.perf_counter()
+        found = len(driver.find_elements(by, value))
+        best = min(best, time.perf_counter() - started)
+    return best * 1e3, found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page", required=True, help="Путь к сохраненной странице или URL")
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    page = Path(args.page)
+    url = page.resolve().as_uri() if page.exists() else args.page
+    driver = create_driver(DriverConfig(browser=args.browser, url=url, headless=True))
+    try:
+        print(f"{'локатор':<40} {'XPath, мс':>10} {'итог, мс':>10} {'стратегия':>13} {'найдено':>8}")
+        total_xpath = total_compiled = 0.0
+        for locator, name in _page_locators().items():
+            xpath_ms, xpath_found = measure(driver, By.XPATH, locator, args.rounds)
+            by, value = compile_locator(By.XPATH, locator)
+            compiled_ms, compiled_found = measure(driver, by, value, args.rounds)
+            total_xpath += xpath_ms
+            total_compiled += compiled_ms
+            mismatch = "" if xpath_found == compiled_found else f" (XPath: {xpath_found})"
+            print(f"{name[:40]:<40} {xpath_ms:>10.3f} {compiled_ms:>10.3f} {by:>13} {compiled_found:>8}{mismatch}")
+        print(f"{'Итого':<40} {total_xpath:>10.3f} {total_compiled:>10.3f}")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Бенчмарк навигации: обычный браузер против облегченного режима (--lean).
+
+Для каждого режима запускается браузер, страницы магазина открываются по кругу и
+замеряется время driver.get (до готовности документа по стратегии загрузки) и объем
+загруженных ресурсов по Resource Timing API.
+
+Запуск из корня репозитория (нужен браузер и стенд OpenCart):
+    python -m benchmarks.bench_navigation --url http://localhost:8081/ --browser chrome --rounds 10
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from frontend.driver.factory import DriverConfig, create_driver
+from frontend.driver.lean import ChromeProfileTemplate
+
+PATHS = [
+    "",
+    "index.php?route=product/category&language=en-gb&path=20",
+    "index.php?route=product/product&language=en-gb&product_id=40",
+    "index.php?route=account/login&language=en-gb",
+    "administration/",
+]
+
+RESOURCES_SCRIPT = """
+var entries = performance.getEntriesByType('resource');
+var bytes = entries.reduce(function (sum, e) { return sum + (e.transferSize || 0); }, 0);
+return [entries.length, bytes];
+"""
+
+
+def run(config: DriverConfig, rounds: int, profiles=None) -> dict:
+    driver = create_driver(config, profiles=profiles)
+    timings, requests, transferred = [], [], []
+    try:
+        for _ in range(rounds):
+            for path in PATHS:
+                started = time.perf_counter()
+                driver.open(path)
+                timings.append((time.perf_counter() - started) * 1e3)
+                count, size = driver.execute_script(RESOURCES_SCRIPT)
+                requests.append(count)
+                transferred.append(size)
+    finally:
+        driver.quit()
+    timings.sort()
+    return {
+        "median": statistics.median(timings),
+        "p95": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        "requests": statistics.mean(requests),
+        "kb": statistics.mean(transferred) / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8081/")
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--headless", action="store_true")
+    args = parser.parse_args()
+
+    base = dict(browser=args.browser, url=args.url, headless=args.headless)
+    with tempfile.TemporaryDirectory() as root:
+        profiles = ChromeProfileTemplate(Path(root)) if args.browser in ["ch", "chrome"] else None
+        results = {
+            "normal": run(DriverConfig(**base), args.rounds),
+            "lean": run(DriverConfig(**base, lean=True, page_load_strategy="eager"), args.rounds, profiles),
+        }
+
+    print(f"{'режим':<8} {'медиана, мс':>12} {'p95, мс':>10} {'ресурсов':>9} {'КБ':>9}")
+    for mode, result in results.items():
+        print(f"{mode:<8} {result['median']:>12.1f} {result['p95']:>10.1f} "
+              f"{result['requests']:>9.1f} {result['kb']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Бенчмарк методов page objects на локальных снимках OpenCart (frontend/harness).
+
+Браузер запускается в headless-режиме против встроенного сервера со снимками страниц,
+каждый метод выполняется --rounds раз (подготовка страницы в замер не входит), медиана
+сравнивается с сохраненным базовым значением. Если метод стал медленнее базового больше
+чем на --tolerance (и больше чем на --min_delta_ms), скрипт завершается с кодом 1.
+Без файла базы скрипт завершается с кодом 2: база создается только явно, через --update_baseline.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_page_objects --browser chrome
+    python -m benchmarks.bench_page_objects --browser chrome --update_baseline
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+from frontend.driver.factory import DriverConfig, create_driver
+from frontend.harness.server import SnapshotServer
+from frontend.page_object.admin_page import AdminPage
+from frontend.page_object.catalog_page import CatalogPage
+from frontend.page_object.listpage import ListPage
+from frontend.page_object.main_page import MainPage
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "page_objects.json"
+
+HOME = ""
+CATALOG = "index.php?route=product/category&language=en-gb&path=20"
+ADMIN_CUSTOMERS = "administration/index.php?route=customer/customer"
+ADMIN_PRODUCTS = "administration/index.php?route=catalog/product"
+
+
+def _page(driver, path: str):
+    """Открыть страницу с чистым состоянием магазина (валюта, корзина, список желаний)"""
+    driver.open(path)
+    driver.execute_script("localStorage.clear();")
+    driver.open(path)
+
+
+def build_cases() -> Dict[str, Tuple[Callable, Callable]]:
+    """Название -> (подготовка(driver), замеряемое действие(driver, состояние подготовки))"""
+    main_page, catalog_page, list_page, admin_page = MainPage(), CatalogPage(), ListPage(), AdminPage()
+    header = catalog_page.header
+
+    def add_to_cart(driver):
+        _page(driver, HOME)
+        return main_page.add_product_to_list(driver, list_type="cart")
+
+    return {
+        "HeaderElements.click_logo": (
+            lambda driver: _page(driver, CATALOG),
+            lambda driver, _: header.click_logo(driver)),
+        "HeaderElements.change_currency": (
+            lambda driver: _page(driver, HOME),
+            lambda driver, _: header.change_currency(driver, new_currency="£ Pound Sterling")),
+        "CatalogPage.get_current_product_prices": (
+            lambda driver: _page(driver, CATALOG),
+            lambda driver, _: catalog_page.get_current_product_prices(driver)),
+        "CatalogPage.select_random_menu_item_and_show_all": (
+            lambda driver: _page(driver, HOME),
+            lambda driver, _: catalog_page.select_random_menu_item_and_show_all(driver)),
+        "MainPage.add_product_to_list[cart]": (
+            lambda driver: _page(driver, HOME),
+            lambda driver, _: main_page.add_product_to_list(driver, list_type="cart")),
+        "MainPage.add_product_to_list[wishlist]": (
+            lambda driver: _page(driver, HOME),
+            lambda driver, _: main_page.add_product_to_list(driver, list_type="wishlist")),
+        "ListPage.checking_product_in_list[cart]": (
+            add_to_cart,
+            lambda driver, product: list_page.checking_product_in_list(driver, product_name=product)),
+        "AdminPage.verifying_user_data": (
+            lambda driver: _page(driver, ADMIN_CUSTOMERS),
+            lambda driver, _: admin_page.verifying_user_data(
+                driver, firstname="John", lastname="Doe", email="john.doe@example.com")),
+        "AdminPage.verifying_product_data": (
+            lambda driver: _page(driver, ADMIN_PRODUCTS),
+            lambda driver, _: admin_page.verifying_product_data(driver, value="Test0001")),
+        "AdminPage.delete_entity": (
+            lambda driver: _page(driver, ADMIN_PRODUCTS),
+            lambda driver, _: admin_page.delete_entity(driver)),
+    }
+
+
+def measure(driver, setup: Callable, action: Callable, rounds: int) -> float:
+    """Медиана времени действия в мс"""
+    timings = []
+    for _ in range(rounds):
+        state = setup(driver)
+        started = time.perf_counter()
+        action(driver, state)
+        timings.append((time.perf_counter() - started) * 1e3)
+    return statistics.median(timings)
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], tolerance: float, min_delta_ms: float) -> list:
+    """Методы, которые стали медленнее базового значения сверх допуска"""
+    regressions = []
+    for name, median in results.items():
+        base = baseline.get(name)
+        if base is not None and median > base * (1 + tolerance) and median - base > min_delta_ms:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update_baseline", action="store_true", help="Записать текущие результаты как базовые")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Допустимое замедление, доля от базового")
+    parser.add_argument("--min_delta_ms", type=float, default=50, help="Замедление меньше этого не считается")
+    parser.add_argument("--delay", type=float, default=0.0, help="Задержка ответа сервера снимков, с")
+    parser.add_argument("--only", default=None, help="Запустить только методы, содержащие эту подстроку")
+    args = parser.parse_args()
+
+    if not args.baseline.exists() and not args.update_baseline:
+        print(f"Нет базовых значений {args.baseline}: запустите с --update_baseline", file=sys.stderr)
+        sys.exit(2)
+
+    cases = {name: case for name, case in build_cases().items() if not args.only or args.only in name}
+    results = {}
+    with SnapshotServer(delay=args.delay) as server:
+        driver = create_driver(DriverConfig(browser=args.browser, url=server.url, headless=True))
+        try:
+            for name, (setup, action) in cases.items():
+                results[name] = measure(driver, setup, action, args.rounds)
+        finally:
+            driver.quit()
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+    missing = []
+    print(f"{'метод':<55} {'медиана, мс':>12} {'база, мс':>10} {'изменение':>10}")
+    for name, median in results.items():
+        base = baseline.get(name)
+        if base is None:
+            missing.append(name)
+        change = f"{(median / base - 1) * 100:+.0f}%" if base else "-"
+        print(f"{name:<55} {median:>12.1f} {base if base is not None else '-':>10} {change:>10}")
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps({**baseline, **{k: round(v, 1) for k, v in results.items()}},
+                                            indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"Базовые значения записаны: {args.baseline}")
+        return
+
+    regressions = compare(results, baseline, args.tolerance, args.min_delta_ms)
+    if regressions:
+        print(f"Замедление больше {args.tolerance:.0%} относительно базы: {', '.join(regressions)}")
+        sys.exit(1)
+    if missing:
+        print(f"Нет базовых значений для: {', '.join(missing)} (обновите базу через --update_baseline)")
+
+
+if __name__ == "__main__":
+    main()
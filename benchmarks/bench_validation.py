@@ -0,0 +1,71 @@
+"""
+Бенчмарк разбора и валидации ответа GET /booking на больших списках ID.
+
+Сравниваются три способа получить список ID из байтов ответа:
+- прежний: json.loads + BookingListResponseItem.model_validate + повторный обход словарей;
+- TypeAdapter(List[BookingIdDict]).validate_json: разбор и валидация за один проход
+  без экземпляров моделей на каждый элемент (обычный режим клиента);
+- trusted: только json.loads без валидации (trusted-режим клиента).
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_validation --items 10000
+"""
+import argparse
+import json
+import time
+
+from backend.models.booking import BOOKING_ID_LIST_ADAPTER, BookingListResponseItem
+
+
+def _legacy(content: bytes):
+    data = json.loads(content)
+    BookingListResponseItem.model_validate(data)
+    return [item["bookingid"] for item in data]
+
+
+def _validate_json(content: bytes):
+    return [item["bookingid"] for item in BOOKING_ID_LIST_ADAPTER.validate_json(content)]
+
+
+def _trusted(content: bytes):
+    return [item["bookingid"] for item in json.loads(content)]
+
+
+MODES = [
+    ("json.loads + model_validate", _legacy),
+    ("TypeAdapter.validate_json", _validate_json),
+    ("trusted (без валидации)", _trusted),
+]
+
+
+def measure(parse, content: bytes, iterations: int, rounds: int) -> float:
+    """Возвращает CPU-время одного разбора в миллисекундах (лучший из rounds прогонов)"""
+    parse(content)
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.process_time()
+        for _ in range(iterations):
+            parse(content)
+        best = min(best, time.process_time() - started)
+    return best / iterations * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    content = json.dumps([{"bookingid": i} for i in range(1, args.items + 1)]).encode()
+    expected = list(range(1, args.items + 1))
+
+    print(f"Список из {args.items} ID, {len(content)} байт")
+    print(f"{'режим':<32} {'мс CPU/разбор':>14}")
+    for name, parse in MODES:
+        assert parse(content) == expected, name
+        print(f"{name:<32} {measure(parse, content, args.iterations, args.rounds):>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Клиенты API в виде до перехода на ленивое логирование - точка отсчета для bench_client_overhead.
+
+Методы повторяют прежнее поведение: сообщения собираются f-строками при любом уровне лога,
+payload сериализуется для лога повторно, ответ /auth разбирается json() трижды, ответы
+бронирований валидируются через model_validate(response.json()). Шаги Allure те же, что
+в текущих клиентах, поэтому разница в замере - это логирование и разбор ответа.
+"""
+from typing import Any, Dict
+
+from common import reporting as allure
+
+from backend.clients.auth_client import AuthClient
+from backend.clients.booking_client import BookingClient
+from backend.models.auth import AuthRequest, AuthResponse
+from backend.models.booking import (
+    BookingCreateRequest,
+    BookingCreateResponse,
+    BookingGetResponse,
+    BookingUpdateResponse,
+)
+
+
+class LegacyAuthClient(AuthClient):
+    """AuthClient с прежним логированием и разбором ответа"""
+
+    def create_token(self, username: str = "admin", password: str = "password123") -> str:
+        with allure.step(f"Создание токена для пользователя {username}"):
+            self.logger.info(f"Создание токена для пользователя: {username}")
+
+            with allure.step("Подготовка payload"):
+                payload = AuthRequest(username=username, password=password)
+                self.logger.info(f"Подготовка запроса с данными: {payload.model_dump()}")
+
+            with allure.step("Отправка POST запроса"):
+                url = f"{self.base_url}/auth"
+                self.logger.info(f"Отправка POST запроса на: {url}")
+                response = self.session.post(url, json=payload.model_dump())
+
+            with allure.step("Обработка ответа"):
+                self.logger.info(f"Получен ответ: статус {response.status_code}, JSON {response.json()}")
+
+                if response.status_code >= 400:
+                    error_data = response.json()
+                    if 'reason' in error_data:
+                        raise Exception(f"Ошибка аутентификации: {error_data['reason']}")
+                    response.raise_for_status()
+
+                token_data = AuthResponse.model_validate(response.json())
+                self.logger.info(f"Токен успешно создан")
+
+                return token_data.token
+
+
+class LegacyBookingClient(BookingClient):
+    """BookingClient с прежним логированием и разбором ответов (методы из смеси бенчмарка)"""
+
+    def get_booking_by_id(self, booking_id: int) -> BookingGetResponse:
+        with allure.step(f"Получение бронирования по ID {booking_id}"):
+            self.logger.info(f"Запрос бронирования с ID: {booking_id}")
+
+            with allure.step("Отправка GET запроса"):
+                response = self.session.get(f"{self.base_url}/booking/{booking_id}")
+                self.logger.info(f"Получен ответ: статус {response.status_code}")
+
+            with allure.step("Валидация и парсинг ответа"):
+                response.raise_for_status()
+                booking_data = BookingGetResponse.model_validate(response.json())
+                self.logger.info(f"Получены данные бронирования: {booking_data}")
+
+                return booking_data
+
+    def create_booking(self, payload: BookingCreateRequest) -> int:
+        with allure.step("Создание нового бронирования"):
+            self.logger.info(f"Создание бронирования с данными: {payload.model_dump()}")
+
+            with allure.step("Подготовка payload"):
+                request_data = payload.model_dump()
+                self.logger.info(f"Payload для создания: {request_data}")
+
+            with allure.step("Отправка POST запроса на /booking"):
+                response = self.session.post(f"{self.base_url}/booking", json=request_data)
+                self.logger.info(f"Получен ответ: статус {response.status_code}")
+
+            with allure.step("Обработка ответа создания"):
+                response.raise_for_status()
+                result = response.json()
+                BookingCreateResponse.model_validate(result)
+                booking_id = result["bookingid"]
+                self.logger.info(f"Бронирование создано успешно, ID: {booking_id}")
+
+                return booking_id
+
+    def update_booking_full(self, booking_id: int, token: str, payload: BookingCreateRequest) -> BookingUpdateResponse:
+        with allure.step(f"Полное обновление бронирования ID {booking_id}"):
+            self.logger.info(f"Полное обновление бронирования {booking_id}")
+
+            with allure.step("Подготовка заголовков с токеном"):
+                headers = {"Cookie": f"token={token}"}
+                self.logger.info(f"Заголовки запроса: {headers}")
+
+            with allure.step("Подготовка данных для обновления"):
+                request_data = payload.model_dump()
+                self.logger.info(f"Данные для обновления: {request_data}")
+
+            with allure.step("Отправка PUT запроса"):
+                response = self.session.put(f"{self.base_url}/booking/{booking_id}", json=request_data,
+                                            headers=headers)
+                self.logger.info(f"Получен ответ: статус {response.status_code}")
+
+            with allure.step("Валидация ответа обновления"):
+                response.raise_for_status()
+                updated_data = BookingUpdateResponse.model_validate(response.json())
+                self.logger.info(f"Бронирование успешно обновлено: {updated_data}")
+
+                return updated_data
+
+    def partial_update_booking(self, booking_id: int, token: str, updates: Dict[str, Any]) -> BookingUpdateResponse:
+        with allure.step(f"Частичное обновление бронирования ID {booking_id}"):
+            self.logger.info(f"Частичное обновление бронирования {booking_id}")
+
+            with allure.step("Подготовка заголовков с токеном"):
+                headers = {"Cookie": f"token={token}"}
+                self.logger.info(f"Заголовки запроса: {headers}")
+
+            with allure.step("Подготовка данных для частичного обновления"):
+                self.logger.info(f"Обновляемые поля: {updates}")
+
+            with allure.step("Отправка PATCH запроса"):
+                response = self.session.patch(f"{self.base_url}/booking/{booking_id}", json=updates,
+                                              headers=headers)
+                self.logger.info(f"Получен ответ: статус {response.status_code}")
+
+            with allure.step("Валидация ответа частичного обновления"):
+                response.raise_for_status()
+                updated_data = BookingUpdateResponse.model_validate(response.json())
+                self.logger.info(f"Бронирование частично обновлено: {updated_data}")
+
+                return updated_data
+
+    def delete_booking(self, booking_id: int, token: str) -> bool:
+        with allure.step(f"Удаление бронирования ID {booking_id}"):
+            self.logger.info(f"Удаление бронирования с ID: {booking_id}")
+
+            with allure.step("Подготовка заголовков с токеном"):
+                headers = {"Cookie": f"token={token}"}
+                self.logger.info(f"Заголовки запроса: {headers}")
+
+            with allure.step("Отправка DELETE запроса"):
+                response = self.session.delete(f"{self.base_url}/booking/{booking_id}", headers=headers)
+                self.logger.info(f"Получен ответ: статус {response.status_code}")
+
+            with allure.step("Проверка успешности удаления"):
+                response.raise_for_status()
+                is_success = response.status_code in [200, 201]
+                self.logger.info(f"Удаление {'успешно' if is_success else 'не удалось'}")
+
+                return is_success
@@ -0,0 +1,164 @@
+"""
+Упаковка каталога allure-results в один архив с индексом.
+
+Каждый результат, контейнер и вложение Allure - отдельный файл, и на больших прогонах
+архивирование десятков тысяч мелких файлов в Jenkins занимает больше времени, чем сами тесты.
+Команда compact потоково пишет каталог в один zip: уже сжатые вложения (WebP, PNG, gzip)
+сохраняются как есть, JSON и текст сжимаются. Первым файлом архива идет index.json со списком
+тестов (название, статус, вложения) и файлов, поэтому нужный результат можно найти, не распаковывая
+архив. Команда extract восстанавливает каталог для allure generate.
+
+    python -m common.allure_results compact allure-results --output allure-results.zip --measure
+    python -m common.allure_results extract allure-results.zip allure-results
+"""
+import argparse
+import json
+import shutil
+import tempfile
+import time
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+INDEX_NAME = "index.json"
+STORED_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp", ".gz", ".zip", ".mp4", ".webm"}
+
+
+@dataclass
+class DirectoryStats:
+    files: int
+    bytes: int
+    allocated: int
+
+    @classmethod
+    def scan(cls, directory: Path) -> "DirectoryStats":
+        """Число файлов, их размер и место, которое они реально занимают на диске (блоки ФС)"""
+        files = total = allocated = 0
+        for path in directory.rglob("*"):
+            if path.is_file():
+                stat = path.stat()
+                files += 1
+                total += stat.st_size
+                allocated += getattr(stat, "st_blocks", 0) * 512 or stat.st_size
+        return cls(files, total, allocated)
+
+
+@dataclass
+class CompactionReport:
+    source: DirectoryStats
+    archive_bytes: int
+    seconds: float
+    tests: int
+
+    def lines(self) -> List[str]:
+        saved = self.source.allocated - self.archive_bytes
+        return [
+            f"Файлов: {self.source.files} -> 1, тестов в индексе: {self.tests}",
+            f"Размер: {_mb(self.source.bytes)} МБ, на диске {_mb(self.source.allocated)} МБ -> архив {_mb(self.archive_bytes)} МБ"
+            f" (экономия {_mb(saved)} МБ)",
+            f"Упаковка: {self.seconds:.2f} с",
+        ]
+
+
+def _mb(size: int) -> str:
+    return f"{size / 1024 / 1024:.2f}"
+
+
+def build_index(directory: Path) -> dict:
+    """Индекс архива: тесты из *-result.json и список всех файлов с размерами"""
+    tests = []
+    for path in sorted(directory.glob("*-result.json")):
+        try:
+            result = json.loads(path.read_text(encoding="utf-8"))
+        except ValueError:
+            continue
+        tests.append({
+            "file": path.name,
+            "name": result.get("name"),
+            "fullName": result.get("fullName"),
+            "status": result.get("status"),
+            "attachments": sorted(_attachment_sources(result)),
+        })
+    files = {str(path.relative_to(directory)): path.stat().st_size
+             for path in sorted(directory.rglob("*")) if path.is_file()}
+    return {"tests": tests, "files": files}
+
+
+def _attachment_sources(item: dict) -> set:
+    sources = {attachment["source"] for attachment in item.get("attachments", [])}
+    for step in item.get("steps", []):
+        sources |= _attachment_sources(step)
+    return sources
+
+
+def compact(directory: Path, archive: Path, remove: bool = False) -> CompactionReport:
+    """Упаковать каталог результатов в zip с индексом; с remove каталог удаляется после упаковки"""
+    directory, archive = Path(directory), Path(archive)
+    source = DirectoryStats.scan(directory)
+    started = time.perf_counter()
+    index = build_index(directory)
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as zip_file:
+        zip_file.writestr(INDEX_NAME, json.dumps(index, ensure_ascii=False))
+        for name in index["files"]:
+            compression = zipfile.ZIP_STORED if Path(name).suffix.lower() in STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+            zip_file.write(directory / name, arcname=name, compress_type=compression)
+    seconds = time.perf_counter() - started
+    if remove:
+        shutil.rmtree(directory)
+    return CompactionReport(source, archive.stat().st_size, seconds, len(index["tests"]))
+
+
+def extract(archive: Path, directory: Path) -> int:
+    """Распаковать архив обратно в каталог результатов; возвращает число файлов"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(archive) as zip_file:
+        names = [name for name in zip_file.namelist() if name != INDEX_NAME]
+        zip_file.extractall(directory, members=names)
+    return len(names)
+
+
+def measure_copy(directory: Path, archive: Path) -> List[str]:
+    """Сравнить время копирования каталога по файлам и одного архива (как это делает архивирование в CI)"""
+    with tempfile.TemporaryDirectory() as target:
+        started = time.perf_counter()
+        shutil.copytree(directory, Path(target) / "tree")
+        tree_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        shutil.copy2(archive, Path(target) / archive.name)
+        archive_seconds = time.perf_counter() - started
+    return [f"Копирование: каталог {tree_seconds:.2f} с, архив {archive_seconds:.2f} с"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    compact_parser = commands.add_parser("compact", help="Упаковать каталог allure-results в один архив")
+    compact_parser.add_argument("directory", type=Path)
+    compact_parser.add_argument("--output", type=Path, default=None, help="Архив (по умолчанию <каталог>.zip)")
+    compact_parser.add_argument("--remove", action="store_true", help="Удалить каталог после упаковки")
+    compact_parser.add_argument("--measure", action="store_true",
+                                help="Замерить копирование каталога по файлам и архива")
+    extract_parser = commands.add_parser("extract", help="Распаковать архив в каталог для allure generate")
+    extract_parser.add_argument("archive", type=Path)
+    extract_parser.add_argument("directory", type=Path)
+    args = parser.parse_args()
+
+    if args.command == "extract":
+        print(f"Распаковано файлов: {extract(args.archive, args.directory)}")
+        return
+
+    output = args.output or args.directory.with_suffix(".zip")
+    report = compact(args.directory, output, remove=args.remove and not args.measure)
+    lines = report.lines()
+    if args.measure:
+        lines += measure_copy(args.directory, output)
+        if args.remove:
+            shutil.rmtree(args.directory)
+    print(f"Архив результатов: {output}")
+    print("\n".join(lines))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Фоновая запись артефактов упавших тестов (скриншот, исходный код страницы) в allure-results.
+
+В хуке отчета остается только получение данных из браузера и регистрация вложения в
+текущем результате Allure; сжатие и запись файла выполняет отдельный поток. Очередь
+ограничена: если поток не успевает, тест ждет освобождения места не дольше put_timeout,
+после чего артефакт пропускается, а не копится в памяти.
+
+Скриншот локального Chrome снимается через DevTools сразу в WebP, остальные браузеры отдают
+PNG, который уменьшается и перекодируется в WebP (Pillow из requirements.txt; без него PNG
+пишется как есть, о чем выводится одно предупреждение). Исходный код
+страницы сжимается gzip. Одинаковые снимки (например, с повторов теста) пишутся один раз -
+вложения ссылаются на один файл. Общий объем артефактов на прогон ограничен.
+"""
+import base64
+import gzip
+import hashlib
+import io
+import logging
+import queue
+import threading
+import uuid
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from allure_commons.model2 import Attachment
+
+from common import reporting
+
+logger = logging.getLogger(__name__)
+
+PNG = reporting.attachment_type.PNG
+WEBP = ("image/webp", "webp")
+HTML_GZ = ("application/gzip", "html.gz")
+
+
+class ArtifactWriter:
+    """Очередь артефактов и поток, который сжимает их и пишет в каталог отчета Allure"""
+
+    def __init__(self, report_dir: Path, reporter=None, max_queue: int = 16, size_cap_mb: float = 200,
+                 screenshot_quality: int = 80, screenshot_max_width: int = 1280, put_timeout: float = 5.0):
+        """
+        :param reporter: AllureReporter плагина allure-pytest, в нем регистрируются вложения
+        :param size_cap_mb: сколько мегабайт артефактов можно записать за прогон, дальше снимки пропускаются
+        :param screenshot_max_width: до какой ширины уменьшать PNG перед перекодированием (нужен Pillow)
+        :param put_timeout: сколько секунд ждать места в заполненной очереди, прежде чем пропустить артефакт
+        """
+        self.report_dir = Path(report_dir)
+        self.reporter = reporter
+        self.size_cap = int(size_cap_mb * 1024 * 1024)
+        self.put_timeout = put_timeout
+        self.screenshot_quality = screenshot_quality
+        self.screenshot_max_width = screenshot_max_width
+        self.written = 0
+        self.skipped = 0
+        self.dropped = 0
+        self._files: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[Tuple[str, str, bytes]]]" = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+        self._thread.start()
+        if Image is None:
+            logger.warning("Pillow не установлен: PNG-скриншоты сохраняются без уменьшения и перекодирования в WebP")
+
+    @classmethod
+    def from_pytest_config(cls, config) -> Optional["ArtifactWriter"]:
+        """Писатель для allure-results текущего прогона; None, если отчет Allure не пишется"""
+        listener = config.pluginmanager.getplugin("allure_listener")
+        report_dir = getattr(config.option, "allure_report_dir", None)
+        if listener is None or not report_dir:
+            return None
+        size_cap_mb = config.getoption("--artifacts_size_cap_mb")
+        workerinput = getattr(config, "workerinput", None)
+        if workerinput:
+            # Лимит задан на прогон, каждый воркер xdist получает свою долю
+            size_cap_mb /= workerinput["workercount"]
+        return cls(Path(report_dir).resolve(), listener.allure_logger, size_cap_mb=size_cap_mb)
+
+    def capture(self, driver, name: str):
+        """Снять скриншот и исходный код страницы и поставить их в очередь на запись"""
+        screenshot, compressed = self._grab_screenshot(driver)
+        self.attach(screenshot, f"screenshot_{name}", "screenshot" if compressed else "png")
+        self.attach(driver.page_source.encode("utf-8"), "page_source", "html")
+
+    def attach(self, body: bytes, name: str, kind: str):
+        """
+        Зарегистрировать вложение в текущем результате Allure и отдать данные потоку записи.
+
+        :param kind: screenshot - готовый WebP, png - скриншот для перекодирования, html - исходный код страницы
+        """
+        # Артефакты падений прикрепляются и при --no_allure_steps: это не шаги page objects
+        if self.reporter is None:
+            return
+        digest = hashlib.sha1(body).hexdigest()
+        with self._lock:
+            file_name = self._files.get(digest)
+            if file_name is None:
+                if self.written + len(body) > self.size_cap:
+                    self.skipped += 1
+                    if self.skipped == 1:
+                        logger.warning("Лимит артефактов %d МБ исчерпан, дальше снимки не сохраняются",
+                                       self.size_cap // (1024 * 1024))
+                    return
+                # До сжатия резервируем исходный размер, поток записи уточнит его после
+                self.written += len(body)
+        if file_name is None:
+            file_name = f"{uuid.uuid4()}-attachment.{self._attachment_type(kind)[1]}"
+            try:
+                self._queue.put((file_name, kind, body), timeout=self.put_timeout)
+            except queue.Full:
+                with self._lock:
+                    self.written -= len(body)
+                    self.dropped += 1
+                logger.warning("Очередь записи артефактов заполнена, вложение %s пропущено", name)
+                return
+            with self._lock:
+                self._files[digest] = file_name
+        self._register(name, file_name, kind)
+
+    def _attachment_type(self, kind: str):
+        if kind == "html":
+            return HTML_GZ
+        if kind == "png" and Image is None:
+            return PNG.mime_type, PNG.extension
+        return WEBP
+
+    def _register(self, name: str, file_name: str, kind: str):
+        # Повторный снимок регистрируется так же: новое вложение указывает на уже записанный файл
+        mime_type, _ = self._attachment_type(kind)
+        executable = self.reporter.get_item(self.reporter._last_executable())
+        executable.attachments.append(Attachment(source=file_name, name=name, type=mime_type))
+
+    def _grab_screenshot(self, driver) -> Tuple[bytes, bool]:
+        execute_cdp_cmd = getattr(driver, "execute_cdp_cmd", None)
+        if execute_cdp_cmd is not None:
+            try:
+                data = execute_cdp_cmd("Page.captureScreenshot",
+                                       {"format": "webp", "quality": self.screenshot_quality})["data"]
+                return base64.b64decode(data), True
+            except Exception as e:
+                logger.debug("Скриншот через DevTools не получен, используется WebDriver: %s", e)
+        return driver.get_screenshot_as_png(), False
+
+    def _compress(self, kind: str, body: bytes) -> bytes:
+        if kind == "html":
+            return gzip.compress(body, compresslevel=6)
+        if kind == "png" and Image is not None:
+            image = Image.open(io.BytesIO(body))
+            if image.width > self.screenshot_max_width:
+                height = round(image.height * self.screenshot_max_width / image.width)
+                image = image.resize((self.screenshot_max_width, height))
+            output = io.BytesIO()
+            image.save(output, format="WEBP", quality=self.screenshot_quality)
+            return output.getvalue()
+        return body
+
+    def _run(self):
+        while True:
+            task = self._queue.get()
+            try:
+                if task is None:
+                    return
+                file_name, kind, body = task
+                data = self._compress(kind, body)
+                (self.report_dir / file_name).write_bytes(data)
+                with self._lock:
+                    self.written += len(data) - len(body)
+            except Exception as e:
+                logger.warning("Не удалось записать артефакт: %s", e)
+            finally:
+                self._queue.task_done()
+
+    def close(self):
+        """Дождаться записи всех артефактов из очереди и остановить поток"""
+        self._queue.put(None)
+        self._thread.join()
+        if self.skipped:
+            logger.warning("Артефактов пропущено из-за лимита: %d", self.skipped)
+        if self.dropped:
+            logger.warning("Артефактов пропущено из-за заполненной очереди: %d", self.dropped)
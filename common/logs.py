@@ -0,0 +1,144 @@
+"""
+Запись логов page objects и клиентов в файлы без блокировки тестов.
+
+Включается опцией pytest ``--log_dir``: корневой логгер получает QueueHandler, а запись
+в файл выполняет QueueListener в своем потоке. Каждый процесс пишет свой файл
+(``main`` или id воркера xdist), поэтому воркеры не перетирают логи друг друга.
+Каждая запись помечается id теста, во время которого она сделана; формат ``json``
+пишет JSON lines для поиска и фильтрации по тесту. Текст исключения форматируется в потоке
+теста и передается в поле ``exc`` отдельно от сообщения.
+
+Вывод логов в консоль остается за pytest (log_cli в pytest.ini).
+"""
+import copy
+import json
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+TEXT_FORMAT = "%(asctime)s - %(worker)s - %(test_id)s - %(name)s - %(levelname)s - %(message)s"
+_EXC_FORMATTER = logging.Formatter()
+
+
+class RecordContextFilter(logging.Filter):
+    """Добавляет к записи id воркера и теста; выполняется в потоке, который пишет лог"""
+
+    def __init__(self, worker: str):
+        super().__init__()
+        self.worker = worker
+        self.test_id: Optional[str] = None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.worker = self.worker
+        record.test_id = self.test_id or "-"
+        return True
+
+
+class ExcTextQueueHandler(QueueHandler):
+    """
+    QueueHandler, который сохраняет текст исключения в exc_text.
+
+    Стандартный prepare() вклеивает traceback в сообщение и очищает exc_info и exc_text,
+    поэтому форматтер в потоке записи не может вывести исключение отдельным полем.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            # exc_info нельзя передавать дальше: traceback держит кадры стека потока теста
+            record.exc_text = record.exc_text or _EXC_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """Одна запись - одна строка JSON"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "worker": getattr(record, "worker", None),
+            "test": getattr(record, "test_id", None),
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exc"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False)
+
+
+class StructuredLogging:
+    """Плагин pytest: очередь логов, поток записи в файл процесса и отметка текущего теста"""
+
+    def __init__(self, directory: Path, worker: str = "main", fmt: str = "text", level: int = logging.INFO):
+        """
+        :param fmt: text - строки с id воркера и теста, json - JSON lines
+        """
+        self.directory = Path(directory)
+        self.level = level
+        self.context = RecordContextFilter(worker)
+        suffix = "jsonl" if fmt == "json" else "log"
+        self.path = self.directory / f"page_objects-{worker}.{suffix}"
+        self.formatter = JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT, "%Y-%m-%d %H:%M:%S")
+        self._handler: Optional[QueueHandler] = None
+        self._listener: Optional[QueueListener] = None
+
+    @classmethod
+    def from_pytest_config(cls, config) -> Optional["StructuredLogging"]:
+        directory = config.getoption("--log_dir")
+        if not directory:
+            return None
+        level_name = config.getoption("--log_dir_level")
+        level = logging.getLevelName(level_name.upper())
+        if not isinstance(level, int):
+            raise pytest.UsageError(
+                f"--log_dir_level: неизвестный уровень {level_name!r}, допустимо: DEBUG, INFO, WARNING, ERROR, CRITICAL"
+            )
+        workerinput = getattr(config, "workerinput", None)
+        return cls(
+            directory,
+            worker=workerinput["workerid"] if workerinput else "main",
+            fmt=config.getoption("--log_dir_format"),
+            level=level,
+        )
+
+    def start(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.FileHandler(self.path, mode="w", encoding="utf-8")
+        file_handler.setFormatter(self.formatter)
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+        self._handler = ExcTextQueueHandler(log_queue)
+        self._handler.setLevel(self.level)
+        self._handler.addFilter(self.context)
+        self._listener = QueueListener(log_queue, file_handler)
+        self._listener.start()
+
+        root_logger = logging.getLogger()
+        root_logger.addHandler(self._handler)
+        if root_logger.getEffectiveLevel() > self.level:
+            root_logger.setLevel(self.level)
+
+    def stop(self):
+        """Снять обработчик, дописать очередь в файл и закрыть его"""
+        if self._handler is None:
+            return
+        logging.getLogger().removeHandler(self._handler)
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+        self._handler = self._listener = None
+
+    def pytest_runtest_logstart(self, nodeid):
+        self.context.test_id = nodeid
+
+    def pytest_runtest_logfinish(self, nodeid):
+        self.context.test_id = None
@@ -0,0 +1,121 @@
+"""
+Переключаемая обертка над allure.step и allure.attach.
+
+Клиенты, хелперы и page objects импортируют модуль под именем allure
+(``from common import reporting as allure``), поэтому код шагов не меняется.
+При выключенной отчетности шаги и вложения превращаются в no-op: не создаются
+объекты шагов Allure и не пишутся файлы в allure-results.
+
+Отчетность выключается переменной окружения ``ALLURE_STEPS=0`` или опцией
+pytest ``--no_allure_steps``; проверка выполняется при каждом вызове, поэтому
+порядок импорта модулей и установки флага не важен.
+
+Короткие текстовые вложения (списки валют, названия товаров, логины) можно не писать
+отдельными файлами, а копить в пакете теста: после ``start_bundling()`` они собираются
+в памяти и ``flush_bundle()`` прикрепляет их к тесту одним вложением с разделами по шагам.
+"""
+import functools
+import os
+import threading
+from typing import List, Tuple
+
+import allure as _allure
+
+attachment_type = _allure.attachment_type
+
+_enabled = os.environ.get("ALLURE_STEPS", "1").lower() not in ("0", "false", "no", "off")
+
+# Текстовые вложения не длиннее этого уходят в пакет теста, длинные пишутся как обычно
+BUNDLE_MAX_CHARS = 4096
+
+_bundling = False
+_bundle: List[Tuple[str, str]] = []
+_bundle_lock = threading.Lock()
+_steps = threading.local()
+
+
+def set_enabled(enabled: bool):
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def start_bundling():
+    """Копить короткие текстовые вложения до flush_bundle() вместо записи каждого в отдельный файл"""
+    global _bundling
+    _bundling = True
+
+
+def _step_stack() -> List[str]:
+    if not hasattr(_steps, "titles"):
+        _steps.titles = []
+    return _steps.titles
+
+
+class _Step:
+    """Шаг Allure, который решает, создавать ли реальный шаг, в момент входа"""
+
+    __slots__ = ("title", "_context")
+
+    def __init__(self, title: str):
+        self.title = title
+        self._context = None
+
+    def __enter__(self):
+        if not _enabled:
+            return None
+        self._context = _allure.step(self.title)
+        _step_stack().append(self.title)
+        return self._context.__enter__()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._context is None:
+            return False
+        context, self._context = self._context, None
+        _step_stack().pop()
+        return context.__exit__(exc_type, exc_val, exc_tb)
+
+    def __call__(self, func):
+        reported = _allure.step(self.title)(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            _step_stack().append(self.title)
+            try:
+                return reported(*args, **kwargs)
+            finally:
+                _step_stack().pop()
+
+        return wrapper
+
+
+def step(title: str) -> _Step:
+    """Аналог allure.step: работает и как контекстный менеджер, и как декоратор"""
+    return _Step(title)
+
+
+def attach(body, name=None, attachment_type=None, extension=None):
+    """Аналог allure.attach, ничего не делает при выключенной отчетности"""
+    if not _enabled:
+        return
+    if _bundling and attachment_type == _allure.attachment_type.TEXT and len(str(body)) <= BUNDLE_MAX_CHARS:
+        title = " / ".join(_step_stack() + [name or "вложение"])
+        with _bundle_lock:
+            _bundle.append((title, str(body)))
+        return
+    _allure.attach(body, name=name, attachment_type=attachment_type, extension=extension)
+
+
+def flush_bundle(name: str = "Вложения теста"):
+    """Прикрепить накопленные текстовые вложения к текущему тесту одним файлом"""
+    with _bundle_lock:
+        sections = list(_bundle)
+        _bundle.clear()
+    if sections and _enabled:
+        body = "\n\n".join(f"=== {title} ===\n{text}" for title, text in sections)
+        _allure.attach(body, name=name, attachment_type=_allure.attachment_type.TEXT)
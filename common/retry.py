@@ -0,0 +1,272 @@
+"""
+Повтор тестов только при временных сбоях.
+
+Вместо глобального ``--reruns`` (любой упавший тест повторяется с фиксированной паузой)
+плагин смотрит на исключение: сетевые ошибки, таймауты и потерянные сессии браузера
+повторяются с экспоненциальной задержкой и джиттером, а AssertionError и прочие ошибки
+самого теста отчитываются сразу. Повторяются только setup и call теста: фикстуры уровня
+сессии (клиенты API, токены, пул браузеров) не пересоздаются, сломанные фикстуры
+сбрасываются. Число повторов ограничено бюджетом на весь прогон, общим для воркеров
+pytest-xdist, - сломанное окружение не умножает время прогона.
+"""
+import json
+import logging
+import random
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import List, Optional, Tuple, Type
+
+import pytest
+from _pytest.runner import call_runtest_hook, check_interactive_exception
+from filelock import FileLock
+
+logger = logging.getLogger(__name__)
+
+
+def _transient_types() -> Tuple[Type[BaseException], ...]:
+    """Ошибки транспорта: соединение не установлено, оборвано или не дождалось ответа"""
+    types: List[Type[BaseException]] = [ConnectionError, TimeoutError]
+    try:
+        import requests
+        types += [requests.exceptions.ConnectionError, requests.exceptions.Timeout]
+    except ImportError:
+        pass
+    try:
+        import urllib3
+        # Через urllib3 идут и команды Selenium к хабу: обрыв соединения с Selenoid приходит отсюда
+        types += [urllib3.exceptions.ProtocolError, urllib3.exceptions.TimeoutError,
+                  urllib3.exceptions.NewConnectionError, urllib3.exceptions.MaxRetryError]
+    except ImportError:
+        pass
+    try:
+        import httpx
+        types += [httpx.TransportError]
+    except ImportError:
+        pass
+    try:
+        import pymysql
+        types += [pymysql.err.InterfaceError]
+    except ImportError:
+        pass
+    return tuple(types)
+
+
+TRANSIENT_TYPES = _transient_types()
+
+# Коды MySQL-клиента о потере соединения: 2003 нет соединения, 2006 сервер ушел, 2013 соединение потеряно.
+# Остальные OperationalError (1045 доступ запрещен, 1049 нет базы) повторять бессмысленно.
+MYSQL_CONNECTION_ERRORS = {2003, 2006, 2013}
+
+# Сообщения WebDriverException о потере браузера или соединения с хабом, а не об ошибке страницы
+WEBDRIVER_DISCONNECT_MARKERS = ("disconnected", "chrome not reachable", "session deleted",
+                                "session timed out or not found", "connection refused")
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    if isinstance(exc, TRANSIENT_TYPES):
+        return True
+    try:
+        import pymysql
+        if isinstance(exc, pymysql.err.OperationalError):
+            return bool(exc.args) and exc.args[0] in MYSQL_CONNECTION_ERRORS
+    except ImportError:
+        pass
+    try:
+        from selenium.common import exceptions as selenium_errors
+        if isinstance(exc, selenium_errors.InvalidSessionIdException):
+            return True
+        # Подклассы (TimeoutException ожиданий, NoSuchElement и т.п.) - ошибки страницы, не транспорта
+        if type(exc) is selenium_errors.WebDriverException:
+            message = (exc.msg or "").lower()
+            return any(marker in message for marker in WEBDRIVER_DISCONNECT_MARKERS)
+    except ImportError:
+        pass
+    return False
+
+
+def is_transient(exc: Optional[BaseException]) -> bool:
+    """
+    Временный ли сбой: исключение (или его причина по цепочке __cause__/__context__) -
+    ошибка сети, таймаут транспорта или потеря сессии браузера. Таймаут ожидания элемента,
+    проваленная проверка и ошибки доступа к БД временными не считаются.
+    """
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        if isinstance(exc, AssertionError):
+            return False
+        if _is_transient_error(exc):
+            return True
+        seen.add(id(exc))
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+def backoff_delay(attempt: int, base: float, max_delay: float) -> float:
+    """Экспоненциальная задержка перед повтором attempt (с 1) с джиттером: от d/2 до d"""
+    delay = min(max_delay, base * 2 ** (attempt - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class RetryBudget:
+    """Сколько повторов осталось на прогон; с path - общий счетчик воркеров xdist в файле"""
+
+    def __init__(self, limit: int, path: Optional[Path] = None):
+        self.limit = limit
+        self.path = Path(path) if path else None
+        self._used = 0
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        """Занять один повтор; False, если бюджет исчерпан"""
+        with self._lock:
+            if self.path is None:
+                if self._used >= self.limit:
+                    return False
+                self._used += 1
+                return True
+            with FileLock(str(self.path) + ".lock"):
+                used = json.loads(self.path.read_text(encoding="utf-8")) if self.path.exists() else 0
+                if used >= self.limit:
+                    return False
+                self.path.write_text(json.dumps(used + 1), encoding="utf-8")
+                return True
+
+    def remove(self):
+        """Удалить файл счетчика и его блокировку"""
+        if self.path is not None:
+            for path in (self.path, Path(str(self.path) + ".lock")):
+                path.unlink(missing_ok=True)
+
+
+class TransientRetryPlugin:
+    """Плагин pytest: протокол теста с повтором setup/call при временных сбоях"""
+
+    def __init__(self, retries: int, budget: RetryBudget, base_delay: float = 0.5, max_delay: float = 8.0):
+        """
+        :param retries: сколько раз максимум повторять один тест
+        :param base_delay: задержка перед первым повтором, дальше удваивается до max_delay
+        """
+        self.retries = retries
+        self.budget = budget
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retried: List[Tuple[str, str]] = []
+        self.budget_exhausted = False
+        self.shared_budget: Optional[RetryBudget] = None
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_configure_node(self, node):
+        # Контроллер xdist создает общий счетчик бюджета и передает его путь воркерам
+        if self.shared_budget is None:
+            path = Path(tempfile.gettempdir()) / f"retry_budget_{uuid.uuid4().hex}.json"
+            self.shared_budget = RetryBudget(self.budget.limit, path)
+        node.workerinput["retry_budget_path"] = str(self.shared_budget.path)
+
+    def pytest_sessionfinish(self, session):
+        if self.shared_budget is not None:
+            self.shared_budget.remove()
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if self.retries <= 0:
+            return None
+        attempt = 0
+        while True:
+            item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+            retry, reports = self._run_attempt(item, nextitem, attempt)
+            for report in reports:
+                item.ihook.pytest_runtest_logreport(report=report)
+            item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+            if not retry:
+                return True
+            attempt += 1
+            delay = backoff_delay(attempt, self.base_delay, self.max_delay)
+            logger.warning("Повтор %d/%d теста %s через %.2f с", attempt, self.retries, item.nodeid, delay)
+            time.sleep(delay)
+
+    def _run_attempt(self, item, nextitem, attempt: int):
+        """
+        Один прогон setup/call/teardown. Если сбой временный и повтор разрешен, отчет
+        упавшей фазы получает outcome "rerun", а teardown сворачивает только сам тест -
+        фикстуры модуля, класса и сессии остаются для следующей попытки.
+        """
+        hasrequest = hasattr(item, "_request")
+        if hasrequest and not item._request:
+            item._initrequest()
+
+        reports = []
+        failed_call = None
+        for when in ("setup", "call"):
+            call, report = self._call_and_report(item, when)
+            reports.append(report)
+            if report.failed:
+                failed_call = call
+            if not report.passed or item.config.getoption("setuponly", False):
+                break
+
+        retry = failed_call is not None and self._should_retry(item, failed_call, attempt)
+        if retry:
+            reports[-1].outcome = "rerun"
+        _, teardown = self._call_and_report(item, "teardown", nextitem=item.parent if retry else nextitem)
+        reports.append(teardown)
+
+        if hasrequest:
+            item._request = False
+            item.funcargs = None
+        if retry:
+            _reset_failed_fixtures(item)
+        return retry, reports
+
+    @staticmethod
+    def _call_and_report(item, when: str, **kwargs):
+        call = call_runtest_hook(item, when, **kwargs)
+        report = item.ihook.pytest_runtest_makereport(item=item, call=call)
+        if check_interactive_exception(call, report):
+            item.ihook.pytest_exception_interact(node=item, call=call, report=report)
+        return call, report
+
+    def _should_retry(self, item, call, attempt: int) -> bool:
+        if attempt >= self.retries or item.get_closest_marker("no_retry"):
+            return False
+        exc = call.excinfo.value if call.excinfo else None
+        if not is_transient(exc):
+            return False
+        if not self.budget.take():
+            if not self.budget_exhausted:
+                logger.warning("Бюджет повторов (%d) исчерпан, дальше сбои не повторяются", self.budget.limit)
+            self.budget_exhausted = True
+            return False
+        return True
+
+    def pytest_runtest_logreport(self, report):
+        # Под xdist отчеты воркеров приходят сюда и на контроллере - сводка собирается там же
+        if report.outcome == "rerun":
+            crash = getattr(report.longrepr, "reprcrash", None)
+            self.retried.append((report.nodeid, crash.message.splitlines()[0] if crash else report.when))
+
+    def pytest_report_teststatus(self, report):
+        if report.outcome == "rerun":
+            return "rerun", "R", ("RERUN", {"yellow": True})
+        return None
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.retried and not self.budget_exhausted:
+            return
+        terminalreporter.write_sep("=", "transient failure retries")
+        for nodeid, reason in self.retried:
+            terminalreporter.write_line(f"RETRY {nodeid} - {reason}")
+        if self.budget_exhausted:
+            terminalreporter.write_line(f"retry budget exhausted ({self.budget.limit})")
+
+
+def _reset_failed_fixtures(item):
+    """Сбросить закэшированные ошибки фикстур, чтобы следующая попытка создала их заново"""
+    fixture_info = getattr(item, "_fixtureinfo", None)
+    for fixture_defs in getattr(fixture_info, "name2fixturedefs", {}).values():
+        for fixture_def in fixture_defs:
+            cached = getattr(fixture_def, "cached_result", None)
+            if cached is not None and cached[2] is not None:
+                fixture_def.cached_result = None
@@ -0,0 +1,275 @@
+"""
+Распределение тестов по воркерам pytest-xdist с учетом их длительности.
+
+Длительность каждого теста (setup + call + teardown) сохраняется между прогонами в кэше
+pytest (.pytest_cache, ключ sharding/durations) как экспоненциальное среднее. При запуске
+с ``-n N --duration_sharding`` тесты делятся на пулы по каталогу верхнего уровня
+(backend, frontend), воркеры - между пулами пропорционально суммарной длительности, а
+внутри пула тесты раскладываются по очередям воркеров жадным LPT (самые долгие первыми,
+каждый - на наименее загруженный воркер). Воркер, опустошивший свою очередь, забирает
+самые короткие тесты из самой загруженной очереди своего пула, затем - других пулов.
+"""
+import heapq
+import logging
+import statistics
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+import pytest
+
+try:
+    from xdist.scheduler import LoadScheduling
+except ImportError:  # pytest-xdist ставится отдельно (см. Jenkinsfile)
+    LoadScheduling = object
+
+W = TypeVar("W", bound=Hashable)
+
+CACHE_KEY = "sharding/durations"
+DEFAULT_DURATION = 1.0
+
+logger = logging.getLogger(__name__)
+
+
+def pool_of(nodeid: str) -> str:
+    """Пул теста - каталог верхнего уровня: backend/..., frontend/..."""
+    return nodeid.split("/", 1)[0] if "/" in nodeid else ""
+
+
+class DurationStore:
+    """Длительности тестов между прогонами (экспоненциальное среднее по nodeid)"""
+
+    def __init__(self, cache=None, alpha: float = 0.5):
+        """
+        :param cache: config.cache pytest; без него данные живут только в памяти
+        :param alpha: вес последнего прогона в среднем
+        """
+        self.cache = cache
+        self.alpha = alpha
+        self.durations: Dict[str, float] = dict(cache.get(CACHE_KEY, {})) if cache is not None else {}
+        self._current: Dict[str, float] = {}
+
+    def record(self, nodeid: str, seconds: float):
+        """Добавить длительность фазы теста текущего прогона"""
+        self._current[nodeid] = self._current.get(nodeid, 0.0) + seconds
+
+    def estimate(self, nodeids: Iterable[str]) -> Dict[str, float]:
+        """
+        Оценка длительности для каждого теста. Для новых тестов - медиана известных
+        тестов того же пула, если их нет - DEFAULT_DURATION.
+        """
+        nodeids = list(nodeids)
+        by_pool: Dict[str, List[float]] = {}
+        for nodeid, seconds in self.durations.items():
+            by_pool.setdefault(pool_of(nodeid), []).append(seconds)
+        fallback = {pool: statistics.median(values) for pool, values in by_pool.items()}
+        return {nodeid: self.durations.get(nodeid, fallback.get(pool_of(nodeid), DEFAULT_DURATION))
+                for nodeid in nodeids}
+
+    def save(self):
+        for nodeid, seconds in self._current.items():
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = seconds if previous is None else \
+                self.alpha * seconds + (1 - self.alpha) * previous
+        self._current.clear()
+        if self.cache is not None:
+            self.cache.set(CACHE_KEY, self.durations)
+
+
+def split_workers(workers: Sequence[W], pool_loads: Dict[str, float]) -> Dict[str, List[W]]:
+    """
+    Разделить воркеры между пулами пропорционально суммарной длительности пулов.
+
+    Каждый непустой пул получает хотя бы один воркер; если воркеров меньше, чем пулов,
+    все пулы делят все воркеры.
+    """
+    pools = [pool for pool, load in sorted(pool_loads.items(), key=lambda item: -item[1])]
+    if not pools:
+        return {}
+    if len(workers) < len(pools):
+        return {pool: list(workers) for pool in pools}
+
+    total = sum(pool_loads.values()) or 1.0
+    counts = {pool: 1 for pool in pools}
+    for _ in range(len(workers) - len(pools)):
+        # Следующий воркер - пулу с наибольшей нагрузкой на воркер
+        pool = max(pools, key=lambda p: pool_loads[p] / total / counts[p])
+        counts[pool] += 1
+
+    result, start = {}, 0
+    for pool in pools:
+        result[pool] = list(workers[start:start + counts[pool]])
+        start += counts[pool]
+    return result
+
+
+def lpt_assign(durations: Dict[str, float], workers: Sequence[W]) -> Dict[W, List[str]]:
+    """
+    Разложить тесты по воркерам: пулы через split_workers, внутри пула - LPT.
+
+    :return: очередь nodeid для каждого воркера, самые долгие тесты в начале
+    """
+    pool_tests: Dict[str, List[str]] = {}
+    for nodeid in durations:
+        pool_tests.setdefault(pool_of(nodeid), []).append(nodeid)
+    pool_loads = {pool: sum(durations[nodeid] for nodeid in nodeids) for pool, nodeids in pool_tests.items()}
+
+    queues: Dict[W, List[str]] = {worker: [] for worker in workers}
+    loads: Dict[W, float] = {worker: 0.0 for worker in workers}
+    for pool, pool_workers in split_workers(workers, pool_loads).items():
+        for nodeid in sorted(pool_tests[pool], key=lambda n: -durations[n]):
+            worker = min(pool_workers, key=lambda w: loads[w])
+            queues[worker].append(nodeid)
+            loads[worker] += durations[nodeid]
+    return queues
+
+
+class DurationScheduling(LoadScheduling):
+    """
+    Планировщик xdist на основе lpt_assign.
+
+    Каждый воркер держит не больше prefetch отправленных тестов, остальные ждут в его
+    очереди на контроллере - так можно перекинуть хвост очереди на освободившийся воркер.
+    """
+
+    def __init__(self, config, log=None, store: Optional[DurationStore] = None, prefetch: int = 2):
+        super().__init__(config, log)
+        self.store = store or DurationStore()
+        self.prefetch = prefetch
+        self.node2queue: Dict[object, List[int]] = {}
+        self.node2pool: Dict[object, Optional[str]] = {}
+        self.durations: Dict[int, float] = {}
+        # Тесты упавшего воркера, которые некому отдать (все остальные завершаются) - ждут нового воркера
+        self.orphans: List[int] = []
+
+    @property
+    def tests_finished(self) -> bool:
+        if not self.collection_is_completed or self.orphans or any(self.node2queue.values()):
+            return False
+        return all(len(pending) < 2 for pending in self.node2pending.values())
+
+    @property
+    def has_pending(self) -> bool:
+        return bool(self.orphans) or any(self.node2queue.values()) or any(self.node2pending.values())
+
+    def add_node(self, node):
+        super().add_node(node)
+        # Воркер взамен упавшего: забирает тесты, оставшиеся без воркера
+        self.node2queue[node], self.orphans = self.orphans, []
+
+    def schedule(self):
+        assert self.collection_is_completed
+        if self.collection is not None:
+            for node in self.nodes:
+                self.node2queue.setdefault(node, [])
+                self.check_schedule(node)
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = list(self.node2collection.values())[0]
+        estimates = self.store.estimate(self.collection)
+        index = {nodeid: i for i, nodeid in enumerate(self.collection)}
+        self.durations = {index[nodeid]: seconds for nodeid, seconds in estimates.items()}
+
+        queues = lpt_assign(estimates, self.nodes)
+        for node, nodeids in queues.items():
+            self.node2queue[node] = [index[nodeid] for nodeid in nodeids]
+            self.node2pool[node] = pool_of(nodeids[0]) if nodeids else None
+            planned = sum(estimates[nodeid] for nodeid in nodeids)
+            logger.info("Воркер %s: тестов %d, ожидаемое время %.1f с",
+                        node.gateway.id, len(nodeids), planned)
+        for node in self.nodes:
+            self.check_schedule(node)
+
+    def check_schedule(self, node, duration=0):
+        if not node.shutting_down and node in self.node2collection:
+            pending = self.node2pending[node]
+            queue = self.node2queue.setdefault(node, [])
+            missing = self.prefetch - len(pending)
+            if missing > 0 and not queue:
+                queue.extend(self._take_orphans(missing) or self._steal(node, missing))
+            if missing > 0 and queue:
+                batch, queue[:] = queue[:missing], queue[missing:]
+                pending.extend(batch)
+                node.send_runtest_some(batch)
+        self._shutdown_idle()
+
+    def _shutdown_idle(self):
+        """
+        Завершить воркеры, когда работы больше нет. Пока у кого-то есть отправленные тесты,
+        остальные воркеры ждут: если тот упадет, его тесты нужно будет кому-то отдать.
+        """
+        if self.orphans or any(self.node2queue.values()):
+            return
+        for node in self.nodes:
+            if node.shutting_down:
+                continue
+            if all(not self.node2pending[other] for other in self.nodes if other is not node):
+                node.shutdown()
+
+    def _take_orphans(self, count: int) -> List[int]:
+        taken, self.orphans = self.orphans[:count], self.orphans[count:]
+        return taken
+
+    def _steal(self, thief, count: int) -> List[int]:
+        """Самые короткие тесты из наиболее загруженной очереди: сначала своего пула, потом любого"""
+        pool = self.node2pool.get(thief)
+        candidates = [node for node in self.node2queue if node is not thief and self.node2queue[node]]
+        same_pool = [node for node in candidates if self.node2pool.get(node) == pool]
+        for group in (same_pool, candidates):
+            if group:
+                victim = max(group, key=lambda node: sum(self.durations.get(i, 0) for i in self.node2queue[node]))
+                queue = self.node2queue[victim]
+                # В очереди тесты идут от долгих к коротким - забираем с конца
+                stolen, queue[:] = queue[-count:], queue[:-count]
+                return stolen
+        return []
+
+    def remove_node(self, node):
+        pending = self.node2pending.pop(node)
+        queue = self.node2queue.pop(node, [])
+        self.node2pool.pop(node, None)
+        crashitem = self.collection[pending.pop(0)] if pending else None
+        orphans = pending + queue
+        alive = [other for other in self.node2queue if not other.shutting_down]
+        if orphans and alive:
+            # Тесты упавшего воркера раздаются по наименее загруженным очередям работающих воркеров
+            heap: List[Tuple[float, int, object]] = [
+                (sum(self.durations.get(i, 0) for i in self.node2queue[other]), n, other)
+                for n, other in enumerate(alive)
+            ]
+            heapq.heapify(heap)
+            for index in sorted(orphans, key=lambda i: -self.durations.get(i, 0)):
+                load, n, other = heapq.heappop(heap)
+                self.node2queue[other].append(index)
+                heapq.heappush(heap, (load + self.durations.get(index, 0), n, other))
+        else:
+            self.orphans.extend(orphans)
+        for other in self.nodes:
+            self.check_schedule(other)
+        return crashitem
+
+
+class DurationShardingPlugin:
+    """Плагин pytest: запись длительностей тестов и выбор DurationScheduling для xdist"""
+
+    def __init__(self, config, enabled: bool):
+        self.config = config
+        self.enabled = enabled
+        self.store = DurationStore(getattr(config, "cache", None))
+
+    def pytest_runtest_logreport(self, report):
+        self.store.record(report.nodeid, report.duration)
+
+    def pytest_sessionfinish(self, session):
+        self.store.save()
+
+    @staticmethod
+    def _dist_is_load(config) -> bool:
+        return config.getvalue("dist") == "load"
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        if not self.enabled or LoadScheduling is object or not self._dist_is_load(config):
+            return None
+        return DurationScheduling(config, log, store=self.store)
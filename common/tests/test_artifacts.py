@@ -0,0 +1,119 @@
+import gzip
+import os
+import threading
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from common.artifacts import ArtifactWriter
+
+
+class StubReporter:
+    """AllureReporter с одним текущим тестом: копит вложения в списке"""
+
+    def __init__(self):
+        self.test = SimpleNamespace(attachments=[])
+
+    def _last_executable(self):
+        return "test"
+
+    def get_item(self, uuid):
+        return self.test
+
+
+@pytest.fixture
+def reporter():
+    return StubReporter()
+
+
+@allure.feature("Инфраструктура тестов")
+@allure.story("Фоновая запись артефактов упавших тестов")
+class TestArtifactWriter:
+    """Тесты дедупликации, лимита объема и ограниченной очереди ArtifactWriter."""
+
+    def test_identical_artifacts_written_once(self, tmp_path, reporter):
+        """Тест: одинаковые данные пишутся в один файл, на него ссылаются оба вложения."""
+        writer = ArtifactWriter(tmp_path, reporter)
+        writer.attach(b"<html>page</html>", "page_source", "html")
+        writer.attach(b"<html>page</html>", "page_source", "html")
+        writer.attach(b"<html>other</html>", "page_source", "html")
+        writer.close()
+
+        sources = [attachment.source for attachment in reporter.test.attachments]
+        assert len(sources) == 3
+        assert sources[0] == sources[1] != sources[2]
+        assert sorted(os.listdir(tmp_path)) == sorted(set(sources))
+        assert gzip.decompress((tmp_path / sources[0]).read_bytes()) == b"<html>page</html>"
+        assert {attachment.type for attachment in reporter.test.attachments} == {"application/gzip"}
+
+    def test_size_cap_skips_new_artifacts(self, tmp_path, reporter):
+        """Тест: после исчерпания лимита новые артефакты пропускаются, повторы уже записанных - нет."""
+        writer = ArtifactWriter(tmp_path, reporter, size_cap_mb=1000 / (1024 * 1024))
+        first, second, third = (os.urandom(400) for _ in range(3))
+        writer.attach(first, "screenshot_1", "screenshot")
+        writer.attach(second, "screenshot_2", "screenshot")
+        writer.attach(third, "screenshot_3", "screenshot")
+        writer.attach(first, "screenshot_1_retry", "screenshot")
+        writer.close()
+
+        assert writer.skipped == 1
+        assert writer.written == 800
+        assert [attachment.name for attachment in reporter.test.attachments] == \
+               ["screenshot_1", "screenshot_2", "screenshot_1_retry"]
+        assert len(os.listdir(tmp_path)) == 2
+
+    def test_size_cap_split_between_xdist_workers(self, tmp_path, reporter):
+        """Тест: под xdist каждый воркер получает свою долю общего лимита."""
+        options = {"--artifacts_size_cap_mb": 200}
+        config = SimpleNamespace(
+            pluginmanager=SimpleNamespace(getplugin=lambda name: SimpleNamespace(allure_logger=reporter)),
+            option=SimpleNamespace(allure_report_dir=str(tmp_path)),
+            getoption=options.__getitem__,
+            workerinput={"workerid": "gw0", "workercount": 4},
+        )
+        writer = ArtifactWriter.from_pytest_config(config)
+        writer.close()
+        assert writer.size_cap == 50 * 1024 * 1024
+
+        del config.workerinput
+        writer = ArtifactWriter.from_pytest_config(config)
+        writer.close()
+        assert writer.size_cap == 200 * 1024 * 1024
+
+    def test_full_queue_drops_artifact(self, tmp_path, reporter):
+        """Тест: если поток записи не успевает, артефакт пропускается по таймауту, а не копится."""
+        writer = ArtifactWriter(tmp_path, reporter, max_queue=1, put_timeout=0.01)
+        started, release = threading.Event(), threading.Event()
+        compress = writer._compress
+
+        def slow_compress(kind, body):
+            started.set()
+            release.wait(5)
+            return compress(kind, body)
+
+        writer._compress = slow_compress
+        writer.attach(b"in progress", "screenshot_1", "screenshot")
+        assert started.wait(5)
+        writer.attach(b"queued", "screenshot_2", "screenshot")
+        writer.attach(b"dropped", "screenshot_3", "screenshot")
+        release.set()
+        writer.close()
+
+        assert writer.dropped == 1
+        assert writer.written == len(b"in progress") + len(b"queued")
+        assert [attachment.name for attachment in reporter.test.attachments] == ["screenshot_1", "screenshot_2"]
+        assert sorted((tmp_path / name).read_bytes() for name in os.listdir(tmp_path)) == [b"in progress", b"queued"]
+
+    def test_png_kept_without_pillow(self, tmp_path, reporter, monkeypatch, caplog):
+        """Тест: без Pillow PNG пишется как есть с типом image/png, предупреждение выводится один раз."""
+        monkeypatch.setattr("common.artifacts.Image", None)
+        with caplog.at_level("WARNING", logger="common.artifacts"):
+            writer = ArtifactWriter(tmp_path, reporter)
+            writer.attach(b"png-1", "screenshot_1", "png")
+            writer.attach(b"png-2", "screenshot_2", "png")
+            writer.close()
+
+        assert [attachment.type for attachment in reporter.test.attachments] == ["image/png", "image/png"]
+        assert all(attachment.source.endswith(".png") for attachment in reporter.test.attachments)
+        assert len([record for record in caplog.records if "Pillow" in record.getMessage()]) == 1
@@ -0,0 +1,73 @@
+import json
+import logging
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from common.logs import StructuredLogging
+
+
+def make_config(tmp_path, level="INFO", fmt="text"):
+    options = {"--log_dir": str(tmp_path), "--log_dir_format": fmt, "--log_dir_level": level}
+    return SimpleNamespace(getoption=options.__getitem__)
+
+
+@pytest.fixture
+def root_level():
+    """StructuredLogging.start() может понизить уровень корневого логгера - возвращаем его после теста"""
+    level = logging.getLogger().level
+    yield
+    logging.getLogger().setLevel(level)
+
+
+def write_records(logs: StructuredLogging):
+    logger = logging.getLogger("test_logs")
+    logs.start()
+    try:
+        logs.pytest_runtest_logstart("tests/test_x.py::test_y")
+        logger.info("Открыта страница %s", "каталог")
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            logger.exception("Клик не удался")
+    finally:
+        logs.stop()
+
+
+@allure.feature("Инфраструктура тестов")
+@allure.story("Логи в файлы по воркерам")
+class TestStructuredLogging:
+    """Тесты настройки и формата файловых логов StructuredLogging."""
+
+    @pytest.mark.parametrize("level,expected", [("info", logging.INFO), ("DEBUG", logging.DEBUG),
+                                                ("Warning", logging.WARNING)])
+    def test_level_names_accepted(self, tmp_path, level, expected):
+        """Тест: уровень задается именем в любом регистре."""
+        assert StructuredLogging.from_pytest_config(make_config(tmp_path, level)).level == expected
+
+    def test_invalid_level_is_usage_error(self, tmp_path):
+        """Тест: неизвестный уровень - ошибка использования, а не ValueError из logging."""
+        with pytest.raises(pytest.UsageError, match="verbose"):
+            StructuredLogging.from_pytest_config(make_config(tmp_path, "verbose"))
+
+    def test_json_exception_in_separate_field(self, tmp_path, root_level):
+        """Тест: в JSON traceback попадает в поле exc, сообщение остается без него."""
+        logs = StructuredLogging.from_pytest_config(make_config(tmp_path, fmt="json"))
+        write_records(logs)
+
+        records = [json.loads(line) for line in logs.path.read_text(encoding="utf-8").splitlines()
+                   if '"test_logs"' in line]
+        assert [record["message"] for record in records] == ["Открыта страница каталог", "Клик не удался"]
+        assert "exc" not in records[0]
+        assert records[1]["exc"].startswith("Traceback") and "ZeroDivisionError" in records[1]["exc"]
+        assert {record["test"] for record in records} == {"tests/test_x.py::test_y"}
+
+    def test_text_exception_written_once(self, tmp_path, root_level):
+        """Тест: в текстовом формате traceback выводится один раз после сообщения."""
+        logs = StructuredLogging.from_pytest_config(make_config(tmp_path))
+        write_records(logs)
+
+        text = logs.path.read_text(encoding="utf-8")
+        assert text.count("Traceback") == 1
+        assert "Клик не удался\nTraceback" in text
@@ -0,0 +1,122 @@
+import socket
+from threading import Thread
+
+import allure
+import pymysql
+import pytest
+import requests
+from selenium.common.exceptions import InvalidSessionIdException, TimeoutException, WebDriverException
+
+from common.retry import RetryBudget, backoff_delay, is_transient
+
+pytest_plugins = ["pytester"]
+
+
+def _chained(cause: BaseException, wrapper: BaseException) -> BaseException:
+    try:
+        try:
+            raise cause
+        except BaseException as e:
+            raise wrapper from e
+    except BaseException as e:
+        return e
+
+
+@allure.feature("Инфраструктура тестов")
+@allure.story("Повтор тестов при временных сбоях")
+class TestTransientRetry:
+    """Тесты классификации сбоев, задержки, бюджета и протокола повтора."""
+
+    @pytest.mark.parametrize("exc", [
+        requests.exceptions.ReadTimeout("read timed out"),
+        requests.exceptions.ConnectionError("reset"),
+        socket.timeout("timed out"),
+        ConnectionResetError("reset by peer"),
+        InvalidSessionIdException("invalid session id"),
+        WebDriverException("disconnected: not connected to DevTools"),
+        pymysql.err.OperationalError(2013, "Lost connection to MySQL server during query"),
+        _chained(ConnectionRefusedError("refused"), RuntimeError("hub request failed")),
+    ], ids=["read_timeout", "connection_error", "socket_timeout", "reset", "invalid_session",
+            "webdriver_disconnected", "mysql_lost", "chained_cause"])
+    def test_transport_errors_are_transient(self, exc):
+        """Тест: сетевые ошибки и потеря сессии повторяются."""
+        assert is_transient(exc)
+
+    @pytest.mark.parametrize("exc", [
+        AssertionError("assert 1 == 2"),
+        TimeoutException("Ожидание //button превысило 10 с"),
+        WebDriverException("unknown error: cannot focus element"),
+        pymysql.err.OperationalError(1045, "Access denied for user"),
+        pymysql.err.OperationalError(1049, "Unknown database"),
+        ValueError("bad value"),
+        _chained(ConnectionResetError("reset"), AssertionError("response was empty")),
+        None,
+    ], ids=["assertion", "wait_timeout", "webdriver_page_error", "mysql_access_denied",
+            "mysql_unknown_db", "value_error", "assertion_over_network", "none"])
+    def test_test_errors_are_not_transient(self, exc):
+        """Тест: таймауты ожиданий, проверки и постоянные ошибки не повторяются."""
+        assert not is_transient(exc)
+
+    def test_backoff_delay_grows_with_jitter_and_cap(self, monkeypatch):
+        """Тест: задержка удваивается, джиттер от половины до полной, с верхней границей."""
+        monkeypatch.setattr("common.retry.random.uniform", lambda low, high: high)
+        assert [backoff_delay(attempt, 0.5, 3.0) for attempt in (1, 2, 3, 4)] == [0.5, 1.0, 2.0, 3.0]
+        monkeypatch.setattr("common.retry.random.uniform", lambda low, high: low)
+        assert [backoff_delay(attempt, 0.5, 3.0) for attempt in (1, 2, 3, 4)] == [0.25, 0.5, 1.0, 1.5]
+
+    def test_budget_in_memory(self):
+        """Тест: бюджет без файла выдает не больше limit повторов."""
+        budget = RetryBudget(2)
+        assert [budget.take() for _ in range(3)] == [True, True, False]
+
+    def test_budget_shared_through_file(self, tmp_path):
+        """Тест: бюджеты разных процессов с одним файлом делят общий лимит."""
+        path = tmp_path / "budget.json"
+        budgets = [RetryBudget(5, path) for _ in range(4)]
+        taken = []
+        threads = [Thread(target=lambda b=budget: taken.extend(b.take() for _ in range(3))) for budget in budgets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert taken.count(True) == 5
+        budgets[0].remove()
+        assert not path.exists()
+
+    def test_protocol_retries_call_with_warm_session_fixtures(self, pytester):
+        """Тест: повтор пересоздает фикстуры функции, фикстуры сессии остаются, ошибки теста не повторяются."""
+        pytester.makeconftest("""
+            from common.retry import RetryBudget, TransientRetryPlugin
+
+            def pytest_configure(config):
+                config.pluginmanager.register(
+                    TransientRetryPlugin(retries=2, budget=RetryBudget(10), base_delay=0, max_delay=0), "retry")
+        """)
+        pytester.makepyfile("""
+            import pytest
+            from selenium.common.exceptions import TimeoutException
+
+            calls = {"session": 0, "function": 0, "test": 0, "wait": 0}
+
+            @pytest.fixture(scope="session")
+            def client():
+                calls["session"] += 1
+
+            @pytest.fixture
+            def page():
+                calls["function"] += 1
+
+            def test_flaky(client, page):
+                calls["test"] += 1
+                if calls["test"] < 3:
+                    raise ConnectionResetError("reset by peer")
+
+            def test_wait_timeout(client):
+                calls["wait"] += 1
+                raise TimeoutException("element never appeared")
+
+            def test_counts():
+                assert calls == {"session": 1, "function": 3, "test": 3, "wait": 1}
+        """)
+        result = pytester.runpytest_inprocess("-p", "no:cacheprovider")
+        assert result.parseoutcomes() == {"passed": 2, "failed": 1, "rerun": 2}
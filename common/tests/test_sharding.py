@@ -0,0 +1,135 @@
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from common.sharding import DurationScheduling, DurationStore, lpt_assign, split_workers
+
+
+class StubNode:
+    """Воркер xdist без процесса: запоминает отправленные тесты и команду завершения"""
+
+    def __init__(self, name: str):
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+    def __repr__(self):
+        return self.gateway.id
+
+
+def make_scheduler(durations, nodes, prefetch=1):
+    config = SimpleNamespace(getvalue=lambda name: [f"{len(nodes)}*popen"],
+                             getoption=lambda name: None)
+    store = DurationStore()
+    store.durations = dict(durations)
+    scheduler = DurationScheduling(config, store=store, prefetch=prefetch)
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, list(durations))
+    scheduler.schedule()
+    return scheduler
+
+
+def complete(scheduler, node):
+    """Воркер завершил первый из отправленных ему тестов"""
+    scheduler.mark_test_complete(node, scheduler.node2pending[node][0])
+
+
+def run_to_end(scheduler, executed):
+    while scheduler.has_pending:
+        busy = [node for node in scheduler.nodes if scheduler.node2pending[node]]
+        assert busy, "есть тесты, но ни одному воркеру они не отправлены"
+        node = busy[0]
+        executed.append(scheduler.collection[scheduler.node2pending[node][0]])
+        complete(scheduler, node)
+
+
+@allure.feature("Инфраструктура тестов")
+@allure.story("Распределение тестов по воркерам xdist")
+class TestDurationSharding:
+    """Тесты раскладки по длительности и планировщика DurationScheduling."""
+
+    def test_split_workers_proportional_to_pool_load(self):
+        """Тест: воркеры делятся между пулами по нагрузке, каждому пулу хотя бы один."""
+        split = split_workers(["w1", "w2", "w3", "w4"], {"frontend": 90.0, "backend": 10.0})
+        assert split == {"frontend": ["w1", "w2", "w3"], "backend": ["w4"]}
+        assert split_workers(["w1"], {"frontend": 1.0, "backend": 1.0}) == {"frontend": ["w1"], "backend": ["w1"]}
+        assert split_workers(["w1"], {}) == {}
+
+    def test_lpt_assign_balances_longest_first(self):
+        """Тест: долгие тесты раскладываются первыми на наименее загруженный воркер пула."""
+        durations = {"frontend/a": 5.0, "frontend/b": 4.0, "frontend/c": 3.0, "frontend/d": 2.0, "backend/x": 0.1}
+        queues = lpt_assign(durations, ["w1", "w2", "w3"])
+        assert queues["w3"] == ["backend/x"]
+        assert queues["w1"] == ["frontend/a", "frontend/d"]
+        assert queues["w2"] == ["frontend/b", "frontend/c"]
+
+    def test_idle_worker_steals_shortest_from_same_pool(self):
+        """Тест: освободившийся воркер забирает самые короткие тесты из очереди своего пула."""
+        a, b = StubNode("a"), StubNode("b")
+        scheduler = make_scheduler({"frontend/t1": 1.0, "frontend/t2": 9.0, "frontend/t3": 5.0,
+                                    "frontend/t4": 3.0, "frontend/t5": 2.0}, [a, b])
+        index = {nodeid: i for i, nodeid in enumerate(scheduler.collection)}
+        stolen_from = list(scheduler.node2queue[a])
+        # b выполняет единственный короткий тест из своей очереди и уходит за чужими
+        while scheduler.node2queue[b]:
+            complete(scheduler, b)
+        complete(scheduler, b)
+        assert scheduler.node2pending[b] == [stolen_from[-1]]
+        assert stolen_from[-1] == index["frontend/t1"]
+        assert not b.shutting_down
+
+    def test_crashed_worker_tests_rescheduled_on_replacement(self):
+        """Тест: тесты упавшего воркера не теряются, даже если остальные уже закончили."""
+        nodes = [StubNode("a"), StubNode("b")]
+        scheduler = make_scheduler({"backend/t0": 1.0, "frontend/t1": 1.0, "frontend/t2": 1.0}, nodes,
+                                   prefetch=2)
+        a, b = sorted(nodes, key=lambda node: len(scheduler.node2pending[node]))
+        assert scheduler.node2pending[b] == [1, 2]
+        complete(scheduler, a)
+        # У b еще есть тесты - a не завершается, пока b может упасть
+        assert not a.shutting_down
+        a.shutting_down = True  # например, DSession завершает воркеры по своей логике
+
+        crashitem = scheduler.remove_node(b)
+        assert crashitem == "frontend/t1"
+        assert scheduler.orphans == [2]
+        assert not scheduler.tests_finished and scheduler.has_pending
+
+        replacement = StubNode("c")
+        scheduler.add_node(replacement)
+        scheduler.add_node_collection(replacement, list(scheduler.collection))
+        scheduler.schedule()
+        assert replacement.sent == [2]
+        complete(scheduler, replacement)
+        assert scheduler.tests_finished and replacement.shutting_down
+
+    def test_crashed_worker_tests_go_to_live_worker(self):
+        """Тест: тесты упавшего воркера отдаются работающему воркеру, все выполняются."""
+        nodes = [StubNode("a"), StubNode("b")]
+        durations = {f"frontend/t{i}": float(i + 1) for i in range(6)}
+        scheduler = make_scheduler(durations, nodes, prefetch=2)
+        crashitem = scheduler.remove_node(nodes[1])
+        executed = []
+        run_to_end(scheduler, executed)
+        assert sorted(executed + [crashitem]) == sorted(durations)
+        assert all(node.shutting_down for node in scheduler.nodes)
+
+    @pytest.mark.parametrize("workers", [1, 2, 3])
+    def test_all_tests_sent_exactly_once(self, workers):
+        """Тест: каждый тест отправляется ровно одному воркеру, в конце все воркеры завершаются."""
+        durations = {f"{pool}/t{i}": float(i % 4 + 1) for pool in ("backend", "frontend") for i in range(7)}
+        nodes = [StubNode(f"w{i}") for i in range(workers)]
+        scheduler = make_scheduler(durations, nodes, prefetch=2)
+        executed = []
+        run_to_end(scheduler, executed)
+        assert sorted(executed) == sorted(durations)
+        assert sorted(i for node in nodes for i in node.sent) == list(range(len(durations)))
+        assert all(node.shutting_down for node in nodes)
@@ -1,12 +1,32 @@
+import asyncio
+import json
 import pytest
+import pytest_asyncio
 import allure
-import random
+import httpx
 import requests
-from selenium import webdriver
-from selenium.webdriver.firefox.options import Options as FFoptions
-from selenium.webdriver.chrome.options import Options as CHoptions
 from backend.clients.auth_client import AuthClient
 from backend.clients.booking_client import BookingClient
+from backend.clients.async_auth_client import AsyncAuthClient
+from backend.clients.async_booking_client import AsyncBookingClient
+from backend.stubs.restful_booker_server import RestfulBookerServer
+from backend.helpers.load_testing import LoadProfile, parse_mix
+from backend.helpers.latency import latency_recorder, TimingHTTPAdapter, TimingAsyncTransport
+from backend.helpers.token_cache import TokenCache, MemoryTokenStore, FileTokenStore
+from common import reporting
+from common.artifacts import ArtifactWriter
+from common.logs import StructuredLogging
+from common.retry import RetryBudget, TransientRetryPlugin
+from common.sharding import DurationShardingPlugin
+from frontend.driver.broker import SessionBroker
+from frontend.driver.factory import BrowserVersionCache, DriverConfig, create_driver
+from frontend.driver.lean import ChromeProfileTemplate
+from frontend.driver.pool import DriverPool
+from frontend.helpers.opencart_seeder import DatabaseConfig, OpenCartSeeder, SeededCustomer, SeededProduct
+from frontend.page_object.login_state import LoginStateCache
+from frontend.page_object.waits import wait_stats
+
+artifact_writer_key = pytest.StashKey[ArtifactWriter]()
 
 
 def pytest_addoption(parser):
@@ -17,122 +37,285 @@ def pytest_addoption(parser):
     parser.addoption("--remote_url", help="Selenoid hub URL", default="http://localhost:4444/wd/hub")
     parser.addoption("--enable_vnc", action="store_true", help="Enable VNC for remote sessions")
     parser.addoption("--browser_version", help="Browser version for remote sessions", default="128.0")
+    parser.addoption("--lean", action="store_true",
+                     help="Lean browser: block images/fonts/analytics, disable animations, reuse a template profile")
+    parser.addoption("--page_load_strategy", choices=["normal", "eager", "none"], default=None,
+                     help="WebDriver page load strategy (default: eager with --lean, otherwise normal)")
+    parser.addoption("--viewport", default="1920x1080", help="Browser window size, WIDTHxHEIGHT")
+    parser.addoption("--device_scale_factor", type=float, default=1.0, help="Device pixel ratio of the page")
+    parser.addoption("--no_reduced_motion", action="store_true",
+                     help="Do not emulate prefers-reduced-motion in browser sessions")
+    parser.addoption("--browser_pool_size", type=int, default=1,
+                     help="Warm browser sessions kept per worker between tests (0 - new browser for every test)")
+    parser.addoption("--browser_max_uses", type=int, default=20,
+                     help="Recycle a pooled browser session after this many tests (0 - no limit)")
+    parser.addoption("--login_state_ttl", type=float, default=1800,
+                     help="Reuse captured admin/customer login state for this many seconds (0 - UI login every test)")
+    parser.addoption("--db_host", default=None, help="OpenCart MariaDB host (default: host from --url)")
+    parser.addoption("--db_port", type=int, default=3306, help="OpenCart MariaDB port")
+    parser.addoption("--db_user", default="bn_opencart", help="OpenCart MariaDB user")
+    parser.addoption("--db_password", default="", help="OpenCart MariaDB password")
+    parser.addoption("--db_name", default="bitnami_opencart", help="OpenCart database name")
+    parser.addoption("--db_prefix", default="oc_", help="OpenCart table prefix")
+    parser.addoption("--selenoid_prewarm", type=int, default=1,
+                     help="Selenoid sessions started ahead of demand in background (with --remote, 0 - disabled)")
+    parser.addoption("--selenoid_prewarm_max_idle", type=float, default=50.0,
+                     help="Discard a prewarmed session idle longer than this, seconds (Selenoid closes idle sessions after 60s)")
+    parser.addoption("--api_pool_size", type=int, default=20,
+                     help="Max keep-alive connections per API session and bulk operation concurrency")
+    parser.addoption("--api-target", "--api_target", dest="api_target", choices=["remote", "local"],
+                     default="remote", help="Restful-Booker target: public stand or in-process stub server")
+    parser.addoption("--load", action="store_true", help="Run load tests (marked with 'load')")
+    parser.addoption("--load_duration", type=float, default=10.0, help="Load run duration in seconds")
+    parser.addoption("--load_concurrency", type=int, default=10, help="Number of concurrent load workers")
+    parser.addoption("--load_rps", type=float, default=None, help="Target requests per second (default: unlimited)")
+    parser.addoption("--load_mix", default="get=70,create=20,update=10",
+                     help="Operation mix, e.g. get=70,create=20,update=10")
+    parser.addoption("--load_max_error_rate", type=float, default=0.01, help="Max allowed error rate")
+    parser.addoption("--load_report", default=None, help="Path to write load report JSON")
+    parser.addoption("--latency_report", default=None, help="Path to write per-endpoint latency histograms JSON")
+    parser.addoption("--api_quiet", action="store_true",
+                     help="Quiet/fast API clients: log only warnings and errors, no payload dumps")
+    parser.addoption("--api_trusted", action="store_true",
+                     help="Skip pydantic validation of booking responses (models built via model_construct)")
+    parser.addoption("--token_ttl", type=float, default=600, help="Auth token cache TTL in seconds")
+    parser.addoption("--token_refresh_margin", type=float, default=60,
+                     help="Refresh cached auth token this many seconds before expiry")
+    parser.addoption("--duration_sharding", action="store_true",
+                     help="With -n: schedule tests across xdist workers by recorded duration (LPT, backend/frontend pools)")
+    parser.addoption("--retries", type=int, default=2,
+                     help="Retry a test up to N times on transient failures (network, timeouts, lost browser session)")
+    parser.addoption("--retry_backoff", type=float, default=0.5, help="Delay before the first retry, doubles each attempt")
+    parser.addoption("--retry_max_delay", type=float, default=8.0, help="Upper bound of the retry delay, seconds")
+    parser.addoption("--retry_budget", type=int, default=10, help="Retries allowed per run across all xdist workers")
+    parser.addoption("--artifacts_size_cap_mb", type=float, default=200,
+                     help="Max size of failure screenshots and page sources written per run, MB")
+    parser.addoption("--log_dir", default=None,
+                     help="Write page object and client logs to per-worker files in this directory (off by default)")
+    parser.addoption("--log_dir_format", choices=["text", "json"], default="text",
+                     help="Format of --log_dir files: text lines or JSON lines with the test id")
+    parser.addoption("--log_dir_level", default="INFO", help="Minimum level of records written to --log_dir files")
+    parser.addoption("--no_allure_steps", action="store_true",
+                     help="Disable Allure steps and attachments from clients and page objects (also ALLURE_STEPS=0)")
 
 
-@pytest.fixture()
-def browser(request):
-    browser_name = request.config.getoption("--browser")
-    headless = request.config.getoption("--headless")
-    url = request.config.getoption("--url")
-    is_remote = request.config.getoption("--remote")
-    remote_url = request.config.getoption("--remote_url")
-    enable_vnc = request.config.getoption("--enable_vnc")
-    browser_version = request.config.getoption("--browser_version")
-
-    if is_remote:
-        # Настройка для Selenoid
-        capabilities = {
-            "browserName": "chrome" if browser_name in ["ch", "chrome"] else "firefox",
-            "version": browser_version,
-            "enableVNC": enable_vnc,
-        }
-
-        if browser_name in ["ch", "chrome"]:
-            options = CHoptions()
-            options.set_capability("selenoid:options", capabilities)
-            try:
-                driver = webdriver.Remote(
-                    command_executor=remote_url,
-                    options=options
-                )
-            except Exception as e:
-                print(f"Не удалось запустить Chrome {browser_version}, пробуем 127.0: {e}")
-                capabilities["version"] = "127.0"
-                options = CHoptions()
-                options.set_capability("selenoid:options", capabilities)
-                driver = webdriver.Remote(
-                    command_executor=remote_url,
-                    options=options
-                )
-        elif browser_name in ["ff", "firefox"]:
-            options = FFoptions()
-            options.set_capability("selenoid:options", capabilities)
-            driver = webdriver.Remote(
-                command_executor=remote_url,
-                options=options
-            )
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    if config.getoption("--no_allure_steps"):
+        reporting.set_enabled(False)
+
+    structured_logging = StructuredLogging.from_pytest_config(config)
+    if structured_logging is not None:
+        structured_logging.start()
+        config.add_cleanup(structured_logging.stop)
+        config.pluginmanager.register(structured_logging, "structured_logging")
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(
+            DurationShardingPlugin(config, enabled=config.getoption("--duration_sharding")), "duration_sharding")
+
+    workerinput = getattr(config, "workerinput", None)
+    budget_path = workerinput.get("retry_budget_path") if workerinput else None
+    config.pluginmanager.register(TransientRetryPlugin(
+        retries=config.getoption("--retries"),
+        budget=RetryBudget(config.getoption("--retry_budget"), budget_path),
+        base_delay=config.getoption("--retry_backoff"),
+        max_delay=config.getoption("--retry_max_delay"),
+    ), "transient_retry")
+
+    if config.pluginmanager.getplugin("allure_listener") is not None:
+        reporting.start_bundling()
+
+    writer = ArtifactWriter.from_pytest_config(config)
+    if writer is not None:
+        config.stash[artifact_writer_key] = writer
+        config.add_cleanup(writer.close)
+
+
+@pytest.fixture(scope="session")
+def driver_factory(request, tmp_path_factory):
+    """Функция запуска браузера; с --remote сессии заранее запрашиваются у Selenoid в фоне"""
+    config = DriverConfig.from_pytest_config(request.config)
+    if hasattr(request.config, "workerinput"):
+        version_cache = BrowserVersionCache(tmp_path_factory.getbasetemp().parent / "browser_versions.json")
     else:
-        # Локальный запуск
-        if browser_name in ["ch", "chrome"]:
-            options = CHoptions()
-            if headless:
-                options.add_argument("headless=new")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument(f"--user-data-dir=/tmp/chrome_{random.randint(1, 10000)}")
-            driver = webdriver.Chrome(options=options)
-        elif browser_name in ["ff", "firefox"]:
-            options = FFoptions()
-            if headless:
-                options.add_argument("--headless")
-            driver = webdriver.Firefox(options=options)
-
-    request.addfinalizer(driver.quit)
-
-    def open(path=""):
-        return driver.get(url + path.lstrip('/'))
-
-    def go_to_home():
-        return driver.get(url)
-
-    driver.open = open
-    driver.go_to_home = go_to_home
+        version_cache = BrowserVersionCache()
+
+    profiles = None
+    if config.lean and config.is_chrome and not config.remote:
+        workerinput = getattr(request.config, "workerinput", None)
+        root = tmp_path_factory.getbasetemp().parent if workerinput else tmp_path_factory.getbasetemp()
+        profiles = ChromeProfileTemplate(root, worker_id=workerinput["workerid"] if workerinput else "main")
+
+    def factory():
+        return create_driver(config, version_cache, profiles)
+
+    prewarm = request.config.getoption("--selenoid_prewarm")
+    if not config.remote or prewarm <= 0:
+        yield factory
+        return
+
+    # С пулом браузеров сессия пересоздается редко: замену заказывает пул перед пересозданием
+    broker = SessionBroker(factory, depth=prewarm, max_idle=request.config.getoption("--selenoid_prewarm_max_idle"),
+                           refill=request.config.getoption("--browser_pool_size") <= 0)
+    yield broker
+    broker.close()
+
 
+@pytest.fixture(scope="session")
+def driver_pool(request, driver_factory):
+    """Пул прогретых браузеров на воркер; None, если переиспользование выключено (--browser_pool_size 0)"""
+    pool_size = request.config.getoption("--browser_pool_size")
+    if pool_size <= 0:
+        yield None
+        return
+
+    pool = DriverPool(driver_factory, size=pool_size,
+                      max_uses=request.config.getoption("--browser_max_uses"),
+                      prepare=getattr(driver_factory, "prepare", None))
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def login_state(request) -> LoginStateCache:
+    """Снимки авторизации админа и покупателей на воркер: вход через UI выполняется один раз"""
+    return LoginStateCache(ttl=request.config.getoption("--login_state_ttl"))
+
+
+@pytest.fixture(scope="session")
+def opencart_seeder(request) -> OpenCartSeeder:
+    """Подготовка данных OpenCart через БД; в конце сессии удаляется все, что осталось после тестов"""
+    seeder = OpenCartSeeder(DatabaseConfig.from_pytest_config(request.config))
+    yield seeder
     try:
-        driver.maximize_window()
-    except Exception as e:
-        print(f"Не удалось максимизировать окно: {e}")
-        driver.set_window_size(1920, 1080)
+        seeder.cleanup_all()
+    finally:
+        seeder.close()
+
+
+@pytest.fixture()
+def seeded_customer(opencart_seeder) -> SeededCustomer:
+    """Клиент, созданный в БД до теста и удаленный после него"""
+    customer = opencart_seeder.seed_customer(firstname="Test123", lastname="Test123", password="4444")
+    yield customer
+    opencart_seeder.delete_customers([customer.customer_id])
+
+
+@pytest.fixture(scope="session")
+def worker_customer(opencart_seeder) -> SeededCustomer:
+    """Покупатель на воркер для тестов, которым нужен вход на витрину: снимок его сессии переиспользуется"""
+    customer = opencart_seeder.seed_customer(firstname="Test123", lastname="Test123", password="4444")
+    yield customer
+    opencart_seeder.delete_customers([customer.customer_id])
+
+
+@pytest.fixture()
+def seeded_product(opencart_seeder) -> SeededProduct:
+    """Товар, созданный в БД до теста и удаленный после него"""
+    product = opencart_seeder.seed_product()
+    yield product
+    opencart_seeder.delete_products([product.product_id])
+
+
+@pytest.fixture()
+def browser(request, driver_factory, driver_pool):
+    if driver_pool is None:
+        driver = driver_factory()
+        request.addfinalizer(driver.quit)
+        return driver
 
-    driver.implicitly_wait(5)
+    driver = driver_pool.acquire()
 
-    driver.go_to_home()
+    def release():
+        report = getattr(request.node, "rep_call", None)
+        driver_pool.release(driver, failed=report is None or report.failed)
 
+    request.addfinalizer(release)
     return driver
 
 
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--load"):
+        return
+    skip_load = pytest.mark.skip(reason="Нагрузочные тесты запускаются только с опцией --load")
+    for item in items:
+        if item.get_closest_marker("load"):
+            item.add_marker(skip_load)
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item):
     outcome = yield
     report = outcome.get_result()
+    # Результат фазы нужен фикстурам при teardown (например, пулу браузеров)
+    setattr(item, f"rep_{report.when}", report)
+    if report.when == "teardown":
+        reporting.flush_bundle()
 
     if report.when == "call" and report.failed:
         driver = item.funcargs.get("browser")
-        if driver is not None:
+        writer = item.config.stash.get(artifact_writer_key, None)
+        if driver is not None and writer is not None:
             try:
-                allure.attach(
-                    driver.get_screenshot_as_png(),
-                    name=f"screenshot_{item.name}",
-                    attachment_type=allure.attachment_type.PNG
-                )
-                allure.attach(
-                    driver.page_source,
-                    name="page_source",
-                    attachment_type=allure.attachment_type.HTML
-                )
+                writer.capture(driver, item.name)
             except Exception as e:
                 print(f"Не удалось сделать скриншот: {e}")
 
 
+def pytest_sessionfinish(session):
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["latency"] = latency_recorder.to_dict()
+        workeroutput["waits"] = wait_stats.to_dict()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Собираем гистограммы задержек и статистику ожиданий с воркеров pytest-xdist"""
+    workeroutput = getattr(node, "workeroutput", {})
+    latency = workeroutput.get("latency")
+    if latency:
+        latency_recorder.merge_dict(latency)
+    waits = workeroutput.get("waits")
+    if waits:
+        wait_stats.merge(waits)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workeroutput"):
+        return
+    if wait_stats:
+        terminalreporter.write_sep("=", "UI explicit waits per locator (top by total time)")
+        terminalreporter.write_line(wait_stats.format_table())
+    latency = latency_recorder.to_dict()
+    if not latency:
+        return
+    terminalreporter.write_sep("=", "API latency per endpoint, ms")
+    terminalreporter.write_line(latency_recorder.format_table())
+    report_path = config.getoption("--latency_report")
+    if report_path:
+        with open(report_path, "w", encoding="utf-8") as report_file:
+            json.dump(latency, report_file, indent=2)
+
+
 @pytest.fixture(scope="session")
-def base_url():
+def base_url(request):
+    """Адрес Restful-Booker: публичный стенд или локальный сервер-заглушка (--api-target=local)"""
+    if request.config.getoption("api_target") == "local":
+        server = RestfulBookerServer().start()
+        request.addfinalizer(server.stop)
+        return server.url
     return "https://restful-booker.herokuapp.com"
 
 
 @pytest.fixture(scope="session")
-def api_session():
-    """Сессия requests с общими заголовками"""
+def api_session(request):
+    """Сессия requests с общими заголовками и пулом соединений под пакетные операции"""
+    pool_size = request.config.getoption("--api_pool_size")
     session = requests.Session()
+    adapter = TimingHTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
     session.headers.update({
         "Content-Type": "application/json",
         "Accept": "application/json"
@@ -141,18 +324,91 @@ def api_session():
 
 
 @pytest.fixture(scope="session")
-def auth_client(base_url, api_session) -> AuthClient:
+def token_cache(request, tmp_path_factory) -> TokenCache:
+    """Кэш токенов; под pytest-xdist общий для всех воркеров через файл с блокировкой"""
+    if hasattr(request.config, "workerinput"):
+        store = FileTokenStore(tmp_path_factory.getbasetemp().parent / "auth_tokens.json")
+    else:
+        store = MemoryTokenStore()
+    return TokenCache(
+        store=store,
+        ttl=request.config.getoption("--token_ttl"),
+        refresh_margin=request.config.getoption("--token_refresh_margin")
+    )
+
+
+@pytest.fixture(scope="session")
+def auth_client(request, base_url, api_session, token_cache) -> AuthClient:
     """Page Object для авторизации"""
-    return AuthClient(base_url, api_session)
+    return AuthClient(base_url, api_session, token_cache=token_cache,
+                      quiet=request.config.getoption("--api_quiet"))
 
 
 @pytest.fixture(scope="session")
-def booking_client(base_url, api_session) -> BookingClient:
+def booking_client(request, base_url, api_session) -> BookingClient:
     """Page Object для бронирований"""
-    return BookingClient(base_url, api_session)
+    return BookingClient(base_url, api_session,
+                         max_workers=request.config.getoption("--api_pool_size"),
+                         quiet=request.config.getoption("--api_quiet"),
+                         trusted=request.config.getoption("--api_trusted"))
 
 
 @pytest.fixture(scope="session")
 def auth_token(auth_client) -> str:
-    """Получаем токен через клиент"""
-    return auth_client.create_token()
+    """Получаем токен через клиент (из общего кэша токенов)"""
+    return auth_client.get_token()
+
+
+@pytest.fixture(scope="session")
+def load_profile(request) -> LoadProfile:
+    """Профиль нагрузки из опций командной строки"""
+    return LoadProfile(
+        mix=parse_mix(request.config.getoption("--load_mix")),
+        duration=request.config.getoption("--load_duration"),
+        concurrency=request.config.getoption("--load_concurrency"),
+        target_rps=request.config.getoption("--load_rps")
+    )
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Общий event loop на всю сессию, чтобы пул соединений жил между тестами"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_api_session(request):
+    """Асинхронная сессия httpx с ограниченным пулом keep-alive соединений"""
+    pool_size = request.config.getoption("--api_pool_size")
+    limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+    async with httpx.AsyncClient(
+        headers={
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        },
+        transport=TimingAsyncTransport(limits=limits),
+        timeout=30
+    ) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def async_auth_client(request, base_url, async_api_session) -> AsyncAuthClient:
+    """Асинхронный Page Object для авторизации"""
+    return AsyncAuthClient(base_url, async_api_session, quiet=request.config.getoption("--api_quiet"))
+
+
+@pytest.fixture(scope="session")
+def async_booking_client(request, base_url, async_api_session) -> AsyncBookingClient:
+    """Асинхронный Page Object для бронирований"""
+    return AsyncBookingClient(base_url, async_api_session,
+                              quiet=request.config.getoption("--api_quiet"),
+                              trusted=request.config.getoption("--api_trusted"))
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_auth_token(async_auth_client) -> str:
+    """Получаем токен через асинхронный клиент"""
+    return await async_auth_client.create_token()
@@ -0,0 +1,107 @@
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class SessionBroker:
+    """
+    Заранее запрошенные у Selenoid сессии браузера.
+
+    В фоновых потоках держится очередь из depth запускаемых или уже готовых сессий
+    одного браузера и версии. take() отдает самую раннюю из них, поэтому тест получает
+    запущенный браузер без ожидания старта сессии на хабе.
+
+    С refill=True (новый браузер на каждый тест) замена заказывается сразу при выдаче.
+    С refill=False сессии заказывает только prepare(): пул браузеров вызывает его, когда
+    пересоздание сессии вот-вот понадобится, и слот Selenoid не занят впустую.
+
+    Сессия, которая простаивала дольше max_idle (Selenoid закрывает простаивающие сессии,
+    по умолчанию через 60 с) или не отвечает на запрос, заменяется новой.
+    """
+
+    def __init__(self, factory: Callable[[], WebDriver], depth: int = 1, max_idle: float = 50.0,
+                 refill: bool = True):
+        """
+        :param factory: функция запуска сессии (вызывается в фоновом потоке)
+        :param depth: сколько сессий держать запущенными наперед
+        :param max_idle: сколько секунд готовая сессия может ждать выдачи (0 - без ограничения)
+        :param refill: заказывать замену при каждой выдаче; False - только по prepare()
+        """
+        self.factory = factory
+        self.depth = depth
+        self.max_idle = max_idle
+        self.refill = refill
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._executor = ThreadPoolExecutor(max_workers=depth, thread_name_prefix="selenoid-broker")
+        self._pending: Deque[Future] = deque()
+        self._lock = threading.Lock()
+        self._closed = False
+        if refill:
+            self.prepare()
+
+    def __call__(self) -> WebDriver:
+        return self.take()
+
+    def take(self) -> WebDriver:
+        """Получить запущенную сессию; если заранее запущенной нет или она неисправна - запустить синхронно"""
+        with self._lock:
+            future = self._pending.popleft() if self._pending else None
+        if self.refill:
+            self.prepare()
+
+        if future is not None:
+            try:
+                driver, ready_at = future.result()
+            except Exception as e:
+                self.logger.warning("Фоновый запуск сессии не удался, запускаем синхронно: %s", e)
+            else:
+                if self._is_alive(driver, time.monotonic() - ready_at):
+                    self.logger.info("Выдана заранее запущенная сессия браузера")
+                    return driver
+                self._quit(driver)
+        return self.factory()
+
+    def _is_alive(self, driver: WebDriver, idle: float) -> bool:
+        if self.max_idle and idle > self.max_idle:
+            self.logger.warning("Заранее запущенная сессия простаивала %.0f с, запускаем новую", idle)
+            return False
+        try:
+            driver.current_url
+            return True
+        except Exception as e:
+            self.logger.warning("Заранее запущенная сессия не отвечает, запускаем новую: %s", e)
+            return False
+
+    def _quit(self, driver: WebDriver):
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.warning("Ошибка при закрытии сессии: %s", e)
+
+    def _start(self) -> Tuple[WebDriver, float]:
+        driver = self.factory()
+        return driver, time.monotonic()
+
+    def close(self):
+        """Остановить фоновые запуски и закрыть невостребованные сессии"""
+        with self._lock:
+            self._closed = True
+            pending, self._pending = list(self._pending), deque()
+        for future in pending:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        for future in pending:
+            if future.cancelled() or future.exception() is not None:
+                continue
+            self._quit(future.result()[0])
+
+    def prepare(self):
+        """Заказать фоновый запуск сессий, чтобы в очереди их было depth"""
+        with self._lock:
+            while not self._closed and len(self._pending) < self.depth:
+                self._pending.append(self._executor.submit(self._start))
@@ -0,0 +1,257 @@
+import json
+import logging
+import random
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from filelock import FileLock
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.options import Options as CHoptions
+from selenium.webdriver.firefox.options import Options as FFoptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from frontend.driver import lean, viewport
+from frontend.driver.lean import ChromeProfileTemplate
+from frontend.driver.viewport import Viewport
+
+
+@dataclass
+class DriverConfig:
+    """Параметры запуска браузера из опций командной строки pytest"""
+    browser: str
+    url: str
+    headless: bool = False
+    remote: bool = False
+    remote_url: str = "http://localhost:4444/wd/hub"
+    enable_vnc: bool = False
+    browser_version: str = "128.0"
+    lean: bool = False
+    page_load_strategy: str = "normal"
+    viewport: Viewport = field(default_factory=Viewport)
+
+    @classmethod
+    def from_pytest_config(cls, config) -> "DriverConfig":
+        lean_mode = config.getoption("--lean")
+        return cls(
+            browser=config.getoption("--browser"),
+            url=config.getoption("--url"),
+            headless=config.getoption("--headless"),
+            remote=config.getoption("--remote"),
+            remote_url=config.getoption("--remote_url"),
+            enable_vnc=config.getoption("--enable_vnc"),
+            browser_version=config.getoption("--browser_version"),
+            lean=lean_mode,
+            # eager не ждет картинок и шрифтов: все проверки page objects идут через явные ожидания
+            page_load_strategy=config.getoption("--page_load_strategy") or ("eager" if lean_mode else "normal"),
+            viewport=Viewport.parse(config.getoption("--viewport"),
+                                    device_scale_factor=config.getoption("--device_scale_factor"),
+                                    reduced_motion=not config.getoption("--no_reduced_motion")),
+        )
+
+    @property
+    def is_chrome(self) -> bool:
+        return self.browser in ["ch", "chrome"]
+
+    @property
+    def is_firefox(self) -> bool:
+        return self.browser in ["ff", "firefox"]
+
+
+FALLBACK_CHROME_VERSION = "127.0"
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserVersionCache:
+    """
+    Какая версия браузера реально выдается хабом вместо запрошенной.
+
+    Первая сессия определяет версию (с откатом Chrome на FALLBACK_CHROME_VERSION),
+    остальные сразу запрашивают известную версию - откат выполняется не больше одного
+    раза за прогон. С path кэш общий для воркеров pytest-xdist (JSON-файл под блокировкой).
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self._file_lock = FileLock(str(self.path) + ".lock") if self.path else None
+        self._thread_lock = threading.Lock()
+        self._versions: Dict[str, str] = {}
+
+    def get(self, browser: str, requested: str) -> Optional[str]:
+        key = f"{browser}:{requested}"
+        if key not in self._versions and self.path and self.path.exists():
+            data = json.loads(self.path.read_text(encoding="utf-8") or "{}")
+            if key in data:
+                self._versions[key] = data[key]
+        return self._versions.get(key)
+
+    def set(self, browser: str, requested: str, actual: str):
+        key = f"{browser}:{requested}"
+        self._versions[key] = actual
+        if self.path:
+            data = json.loads(self.path.read_text(encoding="utf-8") or "{}") if self.path.exists() else {}
+            data[key] = actual
+            self.path.write_text(json.dumps(data), encoding="utf-8")
+
+    def evict(self, browser: str, requested: str):
+        """Забыть версию, которую хаб перестал выдавать: следующая сессия определит ее заново"""
+        key = f"{browser}:{requested}"
+        self._versions.pop(key, None)
+        if self.path and self.path.exists():
+            with self.lock():
+                data = json.loads(self.path.read_text(encoding="utf-8") or "{}")
+                data.pop(key, None)
+                self.path.write_text(json.dumps(data), encoding="utf-8")
+
+    @contextmanager
+    def lock(self):
+        with self._thread_lock:
+            if self._file_lock is None:
+                yield
+            else:
+                with self._file_lock:
+                    yield
+
+
+def create_driver(config: DriverConfig, version_cache: Optional[BrowserVersionCache] = None,
+                  profiles: Optional[ChromeProfileTemplate] = None) -> WebDriver:
+    """
+    Запускает браузер (локально или в Selenoid) и готовит его к тестам.
+
+    К драйверу добавляются методы open(path) и go_to_home(), размер окна, масштаб
+    и prefers-reduced-motion задаются один раз (config.viewport) и открывается
+    главная страница. Неявное ожидание не выставляется: все ожидания
+    явные (frontend/page_object/waits.py), иначе каждый опрос find_element мог бы
+    блокироваться на время implicit wait.
+
+    :param version_cache: кэш доступных на хабе версий, чтобы откат версии Chrome не повторялся
+    :param profiles: шаблон профиля для локального Chrome вместо нового каталога на каждый запуск
+    """
+    if config.remote:
+        driver = _create_remote_driver(config, version_cache)
+    else:
+        driver = _create_local_driver(config, profiles)
+
+    def open(path=""):
+        return driver.get(config.url + path.lstrip('/'))
+
+    def go_to_home():
+        return driver.get(config.url)
+
+    driver.open = open
+    driver.go_to_home = go_to_home
+
+    viewport.apply_to_session(driver, config.viewport)
+    driver.go_to_home()
+
+    return driver
+
+
+def _create_remote_driver(config: DriverConfig, version_cache: Optional[BrowserVersionCache]) -> WebDriver:
+    if config.is_firefox:
+        return _start_remote(config, config.browser_version)
+    if not config.is_chrome:
+        raise ValueError(f"Неизвестный браузер: {config.browser}")
+    if version_cache is None:
+        return _start_chrome_with_fallback(config)[0]
+
+    version = version_cache.get(config.browser, config.browser_version)
+    if version is None:
+        # Версию определяет только первая сессия, остальные ждут результат под блокировкой
+        with version_cache.lock():
+            version = version_cache.get(config.browser, config.browser_version)
+            if version is None:
+                driver, version = _start_chrome_with_fallback(config)
+                version_cache.set(config.browser, config.browser_version, version)
+                return driver
+    try:
+        return _start_remote(config, version)
+    except SessionNotCreatedException:
+        logger.warning("Хаб больше не выдает Chrome %s, версия определяется заново", version)
+        version_cache.evict(config.browser, config.browser_version)
+        with version_cache.lock():
+            driver, version = _start_chrome_with_fallback(config)
+            version_cache.set(config.browser, config.browser_version, version)
+        return driver
+
+
+def _start_chrome_with_fallback(config: DriverConfig) -> Tuple[WebDriver, str]:
+    """Запускает Chrome запрошенной версии, при неудаче - FALLBACK_CHROME_VERSION"""
+    try:
+        return _start_remote(config, config.browser_version), config.browser_version
+    except Exception as e:
+        print(f"Не удалось запустить Chrome {config.browser_version}, пробуем {FALLBACK_CHROME_VERSION}: {e}")
+        return _start_remote(config, FALLBACK_CHROME_VERSION), FALLBACK_CHROME_VERSION
+
+
+def _start_remote(config: DriverConfig, version: str) -> WebDriver:
+    # Настройка для Selenoid
+    capabilities = {
+        "browserName": "chrome" if config.is_chrome else "firefox",
+        "version": version,
+        "enableVNC": config.enable_vnc,
+    }
+    options = _browser_options(config)
+    options.set_capability("selenoid:options", capabilities)
+    logger.info("Запрос сессии %s %s у Selenoid", capabilities["browserName"], version)
+    return webdriver.Remote(command_executor=config.remote_url, options=options)
+
+
+def _browser_options(config: DriverConfig):
+    options = CHoptions() if config.is_chrome else FFoptions()
+    options.page_load_strategy = config.page_load_strategy
+    if config.is_chrome:
+        viewport.apply_chrome_options(options, config.viewport)
+    else:
+        viewport.apply_firefox_options(options, config.viewport)
+    if config.lean:
+        if config.is_chrome:
+            lean.apply_chrome_options(options)
+        else:
+            lean.apply_firefox_options(options)
+    return options
+
+
+def _create_local_driver(config: DriverConfig, profiles: Optional[ChromeProfileTemplate] = None) -> WebDriver:
+    # Локальный запуск
+    if not (config.is_chrome or config.is_firefox):
+        raise ValueError(f"Неизвестный браузер: {config.browser}")
+    options = _browser_options(config)
+    if config.is_firefox:
+        if config.headless:
+            options.add_argument("--headless")
+        return webdriver.Firefox(options=options)
+
+    if config.headless:
+        options.add_argument("headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    profile = profiles.acquire() if profiles else None
+    options.add_argument(f"--user-data-dir={profile or f'/tmp/chrome_{random.randint(1, 10000)}'}")
+    try:
+        driver = webdriver.Chrome(options=options)
+    except Exception:
+        if profiles:
+            profiles.release(profile)
+        raise
+
+    if profiles:
+        quit_driver = driver.quit
+
+        def quit():
+            try:
+                quit_driver()
+            finally:
+                profiles.release(profile)
+
+        driver.quit = quit
+        # Профиль переживает браузер: cookies прошлой сессии удаляются, HTTP-кэш остается
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    if config.lean:
+        lean.enable_devtools_blocking(driver)
+    return driver
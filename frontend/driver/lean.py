@@ -0,0 +1,155 @@
+import itertools
+import json
+import logging
+import shutil
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+from filelock import FileLock
+
+from selenium.webdriver.chrome.options import Options as CHoptions
+from selenium.webdriver.firefox.options import Options as FFoptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# Ресурсы, на которые тесты не делают проверок: картинки, шрифты, сторонняя аналитика
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*facebook.net*",
+]
+
+CHROME_ARGUMENTS = [
+    "--blink-settings=imagesEnabled=false",
+    "--disable-remote-fonts",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--no-first-run",
+]
+
+# Настройки профиля Chrome (файл Default/Preferences шаблона)
+CHROME_PREFERENCES = {
+    "profile": {
+        "default_content_setting_values": {"images": 2, "notifications": 2, "geolocation": 2},
+        "password_manager_enabled": False,
+    },
+    "credentials_enable_service": False,
+    "translate": {"enabled": False},
+    "browser": {"check_default_browser": False},
+}
+
+FIREFOX_PREFERENCES = {
+    "permissions.default.image": 2,
+    "gfx.downloadable_fonts.enabled": False,
+    "browser.display.use_document_fonts": 0,
+    "toolkit.cosmeticAnimations.enabled": False,
+    "browser.newtabpage.enabled": False,
+    "browser.startup.homepage": "about:blank",
+    "app.update.enabled": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "toolkit.telemetry.enabled": False,
+}
+
+# CSS-переходы и анимации jQuery/Bootstrap отключаются до выполнения скриптов страницы
+DISABLE_ANIMATIONS_SCRIPT = """
+(function () {
+    var css = '*, *::before, *::after {transition: none !important; animation: none !important;'
+        + ' scroll-behavior: auto !important;}';
+    function addStyle() {
+        var style = document.createElement('style');
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+    }
+    if (document.documentElement) { addStyle(); } else { document.addEventListener('DOMContentLoaded', addStyle); }
+    document.addEventListener('DOMContentLoaded', function () {
+        if (window.jQuery) { window.jQuery.fx.off = true; }
+    });
+})();
+"""
+
+logger = logging.getLogger(__name__)
+
+
+def apply_chrome_options(options: CHoptions):
+    """Облегченный режим Chrome: без картинок, веб-шрифтов, анимаций и фоновых запросов браузера"""
+    for argument in CHROME_ARGUMENTS:
+        options.add_argument(argument)
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+
+def apply_firefox_options(options: FFoptions):
+    """Облегченный режим Firefox через prefs профиля"""
+    for name, value in FIREFOX_PREFERENCES.items():
+        options.set_preference(name, value)
+
+
+def enable_devtools_blocking(driver: WebDriver) -> bool:
+    """
+    Блокировка ресурсов и отключение анимаций через DevTools (локальный Chrome).
+
+    :return: False, если драйвер не поддерживает CDP - остаются только аргументы запуска
+    """
+    execute_cdp_cmd = getattr(driver, "execute_cdp_cmd", None)
+    if execute_cdp_cmd is None:
+        return False
+    execute_cdp_cmd("Network.enable", {})
+    execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": DISABLE_ANIMATIONS_SCRIPT})
+    return True
+
+
+class ChromeProfileTemplate:
+    """
+    Шаблон профиля Chrome, собранный один раз за прогон и скопированный один раз на воркер.
+
+    Вместо нового /tmp/chrome_<random> на каждый запуск браузер получает готовую копию
+    шаблона (без первого запуска, с настройками облегченного режима и прогретым HTTP-кэшем
+    предыдущих сессий). Копия занята, пока браузер запущен; после quit она возвращается
+    и достается следующему запуску, новая копия делается, только если все заняты.
+    """
+
+    def __init__(self, root: Path, worker_id: str = "main"):
+        """
+        :param root: общий каталог прогона (для xdist - родитель basetemp воркеров)
+        """
+        self.root = Path(root)
+        self.template = self.root / "chrome_template"
+        self.worker_dir = self.root / f"chrome_profiles_{worker_id}"
+        self._free: List[Path] = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def _build_template(self):
+        with FileLock(str(self.template) + ".lock"):
+            if self.template.exists():
+                return
+            building = self.template.with_name(self.template.name + ".tmp")
+            shutil.rmtree(building, ignore_errors=True)
+            (building / "Default").mkdir(parents=True)
+            (building / "Default" / "Preferences").write_text(json.dumps(CHROME_PREFERENCES), encoding="utf-8")
+            (building / "First Run").touch()
+            building.rename(self.template)
+            logger.info("Собран шаблон профиля Chrome: %s", self.template)
+
+    def acquire(self) -> Path:
+        """Каталог профиля для нового запуска браузера"""
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+            index = next(self._counter)
+        self._build_template()
+        profile = self.worker_dir / f"profile_{index}"
+        shutil.rmtree(profile, ignore_errors=True)
+        shutil.copytree(self.template, profile)
+        logger.info("Скопирован профиль Chrome: %s", profile)
+        return profile
+
+    def release(self, profile: Optional[Path]):
+        """Вернуть каталог профиля после закрытия браузера"""
+        if profile is None:
+            return
+        with self._lock:
+            self._free.append(profile)
@@ -0,0 +1,137 @@
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+@dataclass
+class _PooledSession:
+    driver: WebDriver
+    uses: int = 0
+
+
+class DriverPool:
+    """
+    Пул прогретых сессий WebDriver в пределах одного процесса (воркера xdist).
+
+    Между тестами сессия не закрывается: очищаются cookies, localStorage/sessionStorage,
+    закрываются лишние вкладки, а при выдаче следующему тесту открывается главная страница.
+    Сессия пересоздается после max_uses тестов, после упавшего теста и если не прошла
+    проверку работоспособности. Перед пересозданием вызывается prepare: брокер Selenoid
+    запускает замену в фоне, пока идет последний тест сессии.
+    """
+
+    def __init__(self, factory: Callable[[], WebDriver], size: int = 1, max_uses: int = 20,
+                 prepare: Optional[Callable[[], None]] = None):
+        """
+        :param factory: функция запуска нового браузера (уже открытого на главной странице)
+        :param size: сколько свободных сессий держать прогретыми
+        :param max_uses: после скольких тестов сессия пересоздается (0 - без ограничения)
+        :param prepare: заказ фонового запуска следующей сессии (SessionBroker.prepare)
+        """
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.prepare = prepare
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._idle: List[_PooledSession] = []
+        self._in_use: Dict[int, _PooledSession] = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self) -> WebDriver:
+        """Выдать сессию: свободную из пула или новую, если пул пуст"""
+        while True:
+            with self._lock:
+                session = self._idle.pop() if self._idle else None
+            if session is None:
+                session = _PooledSession(self.factory())
+                self.created += 1
+                self.logger.info("Запущена новая сессия браузера (всего запущено: %d)", self.created)
+                break
+            try:
+                session.driver.go_to_home()
+                self.reused += 1
+                break
+            except Exception as e:
+                self.logger.warning("Сессия браузера недоступна, пересоздаем: %s", e)
+                self._quit(session)
+
+        session.uses += 1
+        with self._lock:
+            self._in_use[id(session.driver)] = session
+        if self.max_uses and session.uses >= self.max_uses:
+            # Последний тест этой сессии: замена запускается параллельно с ним
+            self._prepare_next()
+        return session.driver
+
+    def release(self, driver: WebDriver, failed: bool = False):
+        """
+        Вернуть сессию в пул после теста.
+
+        :param failed: тест упал - состояние браузера не доверяем, сессия закрывается
+        """
+        with self._lock:
+            session = self._in_use.pop(id(driver), None)
+        if session is None:
+            driver.quit()
+            return
+
+        if failed:
+            self.logger.info("Тест упал, сессия браузера закрывается")
+            self._prepare_next()
+            self._quit(session)
+            return
+        if self.max_uses and session.uses >= self.max_uses:
+            self.logger.info("Сессия браузера отработала %d тестов, закрывается", session.uses)
+            self._quit(session)
+            return
+
+        try:
+            self._reset(session.driver)
+        except Exception as e:
+            self.logger.warning("Не удалось сбросить состояние браузера, сессия закрывается: %s", e)
+            self._quit(session)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(session)
+                return
+        self._quit(session)
+
+    def close(self):
+        """Закрыть все сессии пула"""
+        with self._lock:
+            sessions = self._idle + list(self._in_use.values())
+            self._idle, self._in_use = [], {}
+        for session in sessions:
+            self._quit(session)
+        self.logger.info("Пул браузеров закрыт: запущено сессий %d, переиспользовано %d", self.created, self.reused)
+
+    @staticmethod
+    def _reset(driver: WebDriver):
+        """Сброс состояния между тестами; заодно проверяет, что сессия жива"""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        # На about:blank и data: доступ к storage запрещен - это не повод пересоздавать сессию
+        driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+        driver.delete_all_cookies()
+
+    def _prepare_next(self):
+        if self.prepare is not None:
+            self.prepare()
+
+    def _quit(self, session: _PooledSession):
+        try:
+            session.driver.quit()
+        except Exception as e:
+            self.logger.warning("Ошибка при закрытии браузера: %s", e)
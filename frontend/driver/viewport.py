@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+
+from selenium.webdriver.chrome.options import Options as CHoptions
+from selenium.webdriver.firefox.options import Options as FFoptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+@dataclass(frozen=True)
+class Viewport:
+    """Размер окна и параметры отрисовки, одинаковые для всех сессий прогона"""
+    width: int = 1920
+    height: int = 1080
+    device_scale_factor: float = 1.0
+    reduced_motion: bool = True
+
+    @classmethod
+    def parse(cls, size: str, device_scale_factor: float = 1.0, reduced_motion: bool = True) -> "Viewport":
+        """Viewport из строки вида "1920x1080" """
+        try:
+            width, height = (int(value) for value in size.lower().split("x"))
+        except ValueError:
+            raise ValueError(f"Размер окна должен быть в формате ШИРИНАxВЫСОТА, получено: {size}")
+        return cls(width, height, device_scale_factor, reduced_motion)
+
+
+def apply_chrome_options(options: CHoptions, viewport: Viewport):
+    options.add_argument(f"--window-size={viewport.width},{viewport.height}")
+    options.add_argument(f"--force-device-scale-factor={viewport.device_scale_factor}")
+    if viewport.reduced_motion:
+        options.add_argument("--force-prefers-reduced-motion")
+
+
+def apply_firefox_options(options: FFoptions, viewport: Viewport):
+    options.add_argument(f"--width={viewport.width}")
+    options.add_argument(f"--height={viewport.height}")
+    options.set_preference("layout.css.devPixelsPerPx", str(viewport.device_scale_factor))
+    if viewport.reduced_motion:
+        options.set_preference("ui.prefersReducedMotion", 1)
+
+
+def apply_to_session(driver: WebDriver, viewport: Viewport):
+    """
+    Выставить размер окна при создании сессии.
+
+    В Chrome с поддержкой CDP размер области страницы и масштаб фиксируются эмуляцией
+    и не зависят от рамки окна и режима headless; остальные браузеры получают размер окна.
+    """
+    driver.set_window_size(viewport.width, viewport.height)
+    execute_cdp_cmd = getattr(driver, "execute_cdp_cmd", None)
+    if execute_cdp_cmd is None:
+        return
+    execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+        "width": viewport.width,
+        "height": viewport.height,
+        "deviceScaleFactor": viewport.device_scale_factor,
+        "mobile": False,
+    })
+    if viewport.reduced_motion:
+        execute_cdp_cmd("Emulation.setEmulatedMedia",
+                        {"features": [{"name": "prefers-reduced-motion", "value": "reduce"}]})
@@ -0,0 +1,123 @@
+import logging
+import mimetypes
+import re
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+SNAPSHOT_DIR = Path(__file__).parent / "snapshots"
+
+# route OpenCart -> сохраненная страница; для витрины и админки маршруты разные
+STORE_ROUTES: Dict[str, str] = {
+    "common/home": "home.html",
+    "product/category": "catalog.html",
+    "checkout/cart": "cart.html",
+    "account/wishlist": "wishlist.html",
+}
+ADMIN_ROUTES: Dict[str, str] = {
+    "customer/customer": "admin_customers.html",
+    "catalog/product": "admin_products.html",
+}
+
+_INCLUDE = re.compile(r"<!-- include:([\w.-]+) -->")
+
+
+class _SnapshotHandler(BaseHTTPRequestHandler):
+    server: "_SnapshotHTTPServer"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path.startswith("/harness/"):
+            return self._send_file(url.path[len("/harness/"):])
+
+        route = parse_qs(url.query).get("route", ["common/home"])[0]
+        routes = ADMIN_ROUTES if url.path.startswith("/administration") else STORE_ROUTES
+        name = routes.get(route)
+        if name is None:
+            # Текст причины уходит в строку статуса HTTP и должен быть в latin-1
+            return self.send_error(HTTPStatus.NOT_FOUND, f"No snapshot for route={route}")
+        return self._send_file(name)
+
+    def _send_file(self, name: str):
+        path = (self.server.directory / name).resolve()
+        if path.parent != self.server.directory or not path.is_file():
+            return self.send_error(HTTPStatus.NOT_FOUND)
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        body = self.server.render(path)
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", mimetypes.guess_type(path.name)[0] or "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        self.server.logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class _SnapshotHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, directory: Path, delay: float):
+        super().__init__(address, _SnapshotHandler)
+        self.directory = directory.resolve()
+        self.delay = delay
+        self.logger = logging.getLogger("SnapshotServer")
+        self._cache: Dict[Path, bytes] = {}
+
+    def render(self, path: Path) -> bytes:
+        # Общая шапка витрины хранится один раз и подставляется в страницы при первой отдаче
+        if path not in self._cache:
+            text = path.read_text(encoding="utf-8")
+            text = _INCLUDE.sub(lambda m: (self.directory / m.group(1)).read_text(encoding="utf-8"), text)
+            self._cache[path] = text.encode("utf-8")
+        return self._cache[path]
+
+
+class SnapshotServer:
+    """
+    Встроенный HTTP-сервер с сохраненными страницами OpenCart для запуска page objects без стенда.
+
+    Отдает главную, каталог, корзину, список желаний и списки клиентов/товаров админки
+    по тем же URL, что и настоящий магазин (route=...). Поведение, на которое опираются
+    page objects (меню, валюта, корзина, фильтры админки), эмулируется в snapshots/opencart.js.
+
+        with SnapshotServer() as server:
+            driver = create_driver(DriverConfig(browser="chrome", url=server.url, headless=True))
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, directory: Path = SNAPSHOT_DIR, delay: float = 0.0):
+        """
+        :param port: 0 - свободный порт
+        :param delay: искусственная задержка ответа в секундах (имитация сети до стенда)
+        """
+        self._server = _SnapshotHTTPServer((host, port), Path(directory), delay)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "SnapshotServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="snapshot-server", daemon=True)
+        self._thread.start()
+        self._server.logger.info("Сервер снимков OpenCart запущен: %s", self.url)
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "SnapshotServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,139 @@
+// Поведение страниц OpenCart, от которого зависят page objects: выпадающие меню, смена валюты,
+// добавление в корзину/список желаний, фильтр и удаление в списках админки.
+// Состояние (валюта, корзина, список желаний) хранится в localStorage вместо сессии сервера.
+(function () {
+    var CURRENCIES = {
+        USD: {symbol: "$", rate: 1, left: true},
+        EUR: {symbol: "€", rate: 0.7846, left: false},
+        GBP: {symbol: "£", rate: 0.6125, left: true}
+    };
+
+    function load(key) {
+        return JSON.parse(localStorage.getItem(key) || "[]");
+    }
+
+    function save(key, value) {
+        localStorage.setItem(key, JSON.stringify(value));
+    }
+
+    function currency() {
+        return CURRENCIES[localStorage.getItem("currency") || "USD"];
+    }
+
+    function format(amount) {
+        var current = currency();
+        var value = (amount * current.rate).toFixed(2);
+        return current.left ? current.symbol + value : value + current.symbol;
+    }
+
+    function renderPrices() {
+        var strong = document.querySelector("#form-currency strong");
+        if (strong) strong.textContent = currency().symbol;
+        document.querySelectorAll("[data-price]").forEach(function (node) {
+            node.textContent = format(parseFloat(node.getAttribute("data-price")));
+        });
+    }
+
+    function renderList(table) {
+        var body = table.querySelector("tbody");
+        var items = load(table.getAttribute("data-oc-list"));
+        body.innerHTML = "";
+        items.forEach(function (item) {
+            var row = document.createElement("tr");
+            row.innerHTML = '<td class="text-start"></td><td class="text-end">1</td>'
+                + '<td class="text-end" data-price="' + item.price + '"></td>';
+            row.firstChild.textContent = item.name;
+            body.appendChild(row);
+        });
+    }
+
+    function showAlert(html) {
+        var alert = document.createElement("div");
+        alert.className = "alert alert-success alert-dismissible";
+        alert.innerHTML = html + ' <button type="button" class="btn-close" data-bs-dismiss="alert"></button>';
+        document.getElementById("alert").prepend(alert);
+    }
+
+    function noResults(body, columns) {
+        body.innerHTML = '<tr><td class="text-center" colspan="' + columns + '">No results!</td></tr>';
+    }
+
+    document.addEventListener("click", function (event) {
+        var toggle = event.target.closest("[data-bs-toggle='dropdown']");
+        if (toggle) {
+            event.preventDefault();
+            var menu = toggle.parentElement.querySelector(".dropdown-menu");
+            document.querySelectorAll(".dropdown-menu.show").forEach(function (open) {
+                if (open !== menu) open.classList.remove("show");
+            });
+            menu.classList.toggle("show");
+            return;
+        }
+
+        var currencyItem = event.target.closest("#form-currency .dropdown-item");
+        if (currencyItem) {
+            event.preventDefault();
+            localStorage.setItem("currency", currencyItem.getAttribute("href"));
+            location.reload();
+            return;
+        }
+
+        var close = event.target.closest("[data-bs-dismiss='alert']");
+        if (close) {
+            close.closest(".alert").remove();
+            return;
+        }
+
+        if (event.target.closest("#button-filter")) {
+            var list = document.querySelector("#list table");
+            var filters = Array.from(document.querySelectorAll("[data-filter-column]"));
+            var body = list.querySelector("tbody");
+            Array.from(body.rows).forEach(function (row) {
+                var matches = filters.every(function (input) {
+                    var cell = row.cells[parseInt(input.getAttribute("data-filter-column"), 10)];
+                    return !input.value || (cell && cell.textContent.toLowerCase().indexOf(input.value.toLowerCase()) !== -1);
+                });
+                if (!matches) row.remove();
+            });
+            if (!body.rows.length) noResults(body, list.rows[0].cells.length);
+            return;
+        }
+
+        if (event.target.closest("#button-delete")) {
+            if (!confirm("Are you sure?")) return;
+            var table = document.querySelector("#list table");
+            table.querySelectorAll("tbody input[name='selected[]']:checked").forEach(function (box) {
+                box.closest("tr").remove();
+            });
+            if (!table.tBodies[0].rows.length) noResults(table.tBodies[0], table.rows[0].cells.length);
+        }
+    });
+
+    document.addEventListener("change", function (event) {
+        if (event.target.matches("thead input[type='checkbox']")) {
+            event.target.closest("table").querySelectorAll("tbody input[name='selected[]']").forEach(function (box) {
+                box.checked = event.target.checked;
+            });
+        }
+    });
+
+    document.addEventListener("submit", function (event) {
+        var form = event.target;
+        if (form.getAttribute("data-oc-toggle") !== "ajax") return;
+        event.preventDefault();
+        var action = (event.submitter && event.submitter.getAttribute("formaction")) || form.action;
+        var key = action.indexOf("wishlist.add") !== -1 ? "wishlist" : "cart";
+        var thumb = form.closest(".product-thumb");
+        var name = thumb.querySelector("h4 a").textContent.trim();
+        var items = load(key);
+        items.push({name: name, price: thumb.querySelector("[data-price]").getAttribute("data-price")});
+        save(key, items);
+        var title = key === "cart" ? "shopping cart" : "wish list";
+        showAlert('Success: You have added <a href="#">' + name + '</a> to your <a href="#">' + title + '</a>!');
+    });
+
+    document.addEventListener("DOMContentLoaded", function () {
+        document.querySelectorAll("table[data-oc-list]").forEach(renderList);
+        renderPrices();
+    });
+})();
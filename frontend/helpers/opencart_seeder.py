@@ -0,0 +1,268 @@
+import hashlib
+import logging
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+import pymysql
+
+from common import reporting as allure
+
+# Режим, который выставляет сам OpenCart для своих подключений: без STRICT_TRANS_TABLES
+# незаполненные NOT NULL колонки получают значения по умолчанию, как при сохранении из админки
+_OPENCART_SQL_MODE = "NO_ZERO_IN_DATE,NO_ENGINE_SUBSTITUTION"
+
+# Таблицы, которые OpenCart чистит при удалении клиента / товара из админки
+_CUSTOMER_TABLES = (
+    "customer_activity", "customer_affiliate", "customer_approval", "customer_history",
+    "customer_ip", "customer_online", "customer_reward", "customer_transaction",
+    "customer_wishlist", "address", "customer",
+)
+_PRODUCT_TABLES = (
+    "product_attribute", "product_description", "product_discount", "product_filter",
+    "product_image", "product_option", "product_option_value", "product_related",
+    "product_reward", "product_special", "product_to_category", "product_to_download",
+    "product_to_layout", "product_to_store", "review", "customer_wishlist", "product",
+)
+
+
+@dataclass(frozen=True)
+class SeededCustomer:
+    customer_id: int
+    firstname: str
+    lastname: str
+    email: str
+    password: str
+
+
+@dataclass(frozen=True)
+class SeededProduct:
+    product_id: int
+    name: str
+    model: str
+    keyword: str
+    price: float
+
+
+@dataclass(frozen=True)
+class DatabaseConfig:
+    host: str = "192.168.31.202"
+    port: int = 3306
+    user: str = "bn_opencart"
+    password: str = ""
+    database: str = "bitnami_opencart"
+    prefix: str = "oc_"
+
+    @classmethod
+    def from_pytest_config(cls, config) -> "DatabaseConfig":
+        # По умолчанию MariaDB стенда доступна на том же хосте, что и OpenCart
+        host = config.getoption("db_host") or urlsplit(config.getoption("url")).hostname or cls.host
+        return cls(
+            host=host,
+            port=config.getoption("db_port"),
+            user=config.getoption("db_user"),
+            password=config.getoption("db_password"),
+            database=config.getoption("db_name"),
+            prefix=config.getoption("db_prefix"),
+        )
+
+
+class OpenCartSeeder:
+    """
+    Подготовка тестовых данных OpenCart напрямую в MariaDB.
+
+    Клиенты и товары вставляются пачкой в одной транзакции и удаляются так же, вместе
+    со связанными строками (адреса, список желаний, описания, SEO URL). Все созданные
+    записи запоминаются, и cleanup_all при завершении сессии удаляет то, что тесты
+    не убрали сами. Подключение открывается при первом обращении.
+    """
+
+    def __init__(self, config: DatabaseConfig = None):
+        self.config = config or DatabaseConfig()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._connection: Optional[pymysql.connections.Connection] = None
+        self._lock = threading.Lock()
+        self._tables: Optional[set] = None
+        self._customers: set = set()
+        self._products: set = set()
+
+    def _table(self, name: str) -> str:
+        return f"`{self.config.prefix}{name}`"
+
+    def _connect(self) -> pymysql.connections.Connection:
+        if self._connection is None or not self._connection.open:
+            self.logger.info(f"Подключение к БД {self.config.database} на {self.config.host}:{self.config.port}")
+            self._connection = pymysql.connect(
+                host=self.config.host,
+                port=self.config.port,
+                user=self.config.user,
+                password=self.config.password,
+                database=self.config.database,
+                charset="utf8mb4",
+                autocommit=False,
+                init_command=f"SET SESSION sql_mode = '{_OPENCART_SQL_MODE}'",
+            )
+        return self._connection
+
+    def _existing_tables(self, cursor) -> set:
+        # Набор таблиц отличается между версиями OpenCart - удаляем только из существующих
+        if self._tables is None:
+            cursor.execute(
+                "SELECT table_name FROM information_schema.tables WHERE table_schema = %s",
+                (self.config.database,)
+            )
+            self._tables = {row[0] for row in cursor.fetchall()}
+        return self._tables
+
+    def _transaction(self, work):
+        with self._lock:
+            connection = self._connect()
+            try:
+                with connection.cursor() as cursor:
+                    result = work(cursor)
+                connection.commit()
+                return result
+            except Exception:
+                connection.rollback()
+                raise
+
+    @allure.step("Создание клиентов в БД")
+    def seed_customers(self, customers: Iterable[dict]) -> List[SeededCustomer]:
+        """
+        Создать клиентов одной транзакцией.
+
+        :param customers: словари с firstname, lastname, password и необязательным email
+        """
+        prepared = []
+        for customer in customers:
+            firstname, lastname = customer["firstname"], customer["lastname"]
+            email = (customer.get("email")
+                     or f"{firstname.lower()}.{lastname.lower()}.{uuid.uuid4().hex[:8]}@test.com")
+            prepared.append((firstname, lastname, email, str(customer["password"])))
+
+        def insert(cursor):
+            seeded = []
+            for firstname, lastname, email, password in prepared:
+                # md5 OpenCart принимает при входе как устаревший формат и сам перехэширует пароль
+                cursor.execute(
+                    f"INSERT INTO {self._table('customer')} SET customer_group_id = 1, store_id = 0, "
+                    "firstname = %s, lastname = %s, email = %s, telephone = '', password = %s, "
+                    "custom_field = '', newsletter = 0, status = 1, safe = 1, date_added = NOW()",
+                    (firstname, lastname, email, hashlib.md5(password.encode()).hexdigest())
+                )
+                seeded.append(SeededCustomer(cursor.lastrowid, firstname, lastname, email, password))
+            return seeded
+
+        seeded = self._transaction(insert)
+        self._customers.update(customer.customer_id for customer in seeded)
+        self.logger.info(f"Создано клиентов: {len(seeded)} ({', '.join(c.email for c in seeded)})")
+        return seeded
+
+    def seed_customer(self, firstname="Test", lastname="Test", password="Test", email=None) -> SeededCustomer:
+        return self.seed_customers([{
+            "firstname": firstname, "lastname": lastname, "password": password, "email": email
+        }])[0]
+
+    @allure.step("Создание товаров в БД")
+    def seed_products(self, products: Iterable[dict]) -> List[SeededProduct]:
+        """
+        Создать товары одной транзакцией: описание на всех языках магазина, привязка
+        к магазину по умолчанию и SEO URL.
+
+        :param products: словари с необязательными name, model, price и quantity
+        """
+        prepared = []
+        for product in products:
+            keyword = uuid.uuid4().hex
+            name = product.get("name") or f"Test{keyword}"
+            prepared.append((name, product.get("model") or name, keyword,
+                             float(product.get("price", 100)), int(product.get("quantity", 10))))
+
+        def insert(cursor):
+            cursor.execute(f"SELECT language_id FROM {self._table('language')}")
+            languages = [row[0] for row in cursor.fetchall()]
+            seeded = []
+            for name, model, keyword, price, quantity in prepared:
+                cursor.execute(
+                    f"INSERT INTO {self._table('product')} SET master_id = 0, model = %s, sku = '', upc = '', "
+                    "ean = '', jan = '', isbn = '', mpn = '', location = '', variant = '', override = '', "
+                    "quantity = %s, minimum = 1, subtract = 1, stock_status_id = 7, date_available = CURDATE(), "
+                    "manufacturer_id = 0, shipping = 1, price = %s, points = 0, weight = 0, weight_class_id = 1, "
+                    "length = 0, width = 0, height = 0, length_class_id = 1, status = 1, tax_class_id = 0, "
+                    "sort_order = 0, image = '', date_added = NOW(), date_modified = NOW()",
+                    (model, quantity, price)
+                )
+                product_id = cursor.lastrowid
+                cursor.executemany(
+                    f"INSERT INTO {self._table('product_description')} (product_id, language_id, name, "
+                    "description, tag, meta_title, meta_description, meta_keyword) "
+                    "VALUES (%s, %s, %s, '', '', %s, '', '')",
+                    [(product_id, language_id, name, name) for language_id in languages]
+                )
+                cursor.execute(
+                    f"INSERT INTO {self._table('product_to_store')} (product_id, store_id) VALUES (%s, 0)",
+                    (product_id,)
+                )
+                cursor.executemany(
+                    f"INSERT INTO {self._table('seo_url')} (store_id, language_id, `key`, `value`, keyword, "
+                    "sort_order) VALUES (0, %s, 'product_id', %s, %s, 0)",
+                    [(language_id, str(product_id), keyword) for language_id in languages]
+                )
+                seeded.append(SeededProduct(product_id, name, model, keyword, price))
+            return seeded
+
+        seeded = self._transaction(insert)
+        self._products.update(product.product_id for product in seeded)
+        self.logger.info(f"Создано товаров: {len(seeded)} ({', '.join(p.name for p in seeded)})")
+        return seeded
+
+    def seed_product(self, name=None, model=None, price=100, quantity=10) -> SeededProduct:
+        return self.seed_products([{"name": name, "model": model, "price": price, "quantity": quantity}])[0]
+
+    @allure.step("Удаление клиентов из БД")
+    def delete_customers(self, customer_ids: Sequence[int]):
+        self._delete("customer_id", _CUSTOMER_TABLES, customer_ids)
+        self._customers.difference_update(customer_ids)
+        self.logger.info(f"Удалено клиентов: {len(customer_ids)}")
+
+    @allure.step("Удаление товаров из БД")
+    def delete_products(self, product_ids: Sequence[int]):
+        def delete_seo_urls(cursor):
+            cursor.executemany(
+                f"DELETE FROM {self._table('seo_url')} WHERE `key` = 'product_id' AND `value` = %s",
+                [(str(product_id),) for product_id in product_ids]
+            )
+
+        self._delete("product_id", _PRODUCT_TABLES, product_ids, extra=delete_seo_urls)
+        self._products.difference_update(product_ids)
+        self.logger.info(f"Удалено товаров: {len(product_ids)}")
+
+    def _delete(self, column: str, tables: Sequence[str], ids: Sequence[int], extra=None):
+        ids = list(ids)
+        if not ids:
+            return
+        placeholders = ", ".join(["%s"] * len(ids))
+
+        def delete(cursor):
+            existing = self._existing_tables(cursor)
+            for table in tables:
+                if f"{self.config.prefix}{table}" in existing:
+                    cursor.execute(f"DELETE FROM {self._table(table)} WHERE {column} IN ({placeholders})", ids)
+            if extra is not None:
+                extra(cursor)
+
+        self._transaction(delete)
+
+    def cleanup_all(self):
+        """Удалить все записи, созданные этим экземпляром и не удаленные тестами"""
+        if self._customers:
+            self.delete_customers(sorted(self._customers))
+        if self._products:
+            self.delete_products(sorted(self._products))
+
+    def close(self):
+        if self._connection is not None and self._connection.open:
+            self._connection.close()
+        self._connection = None
@@ -1,4 +1,4 @@
-import allure
+from common import reporting as allure
 
 from frontend.page_object.base_page_with_header import BasePageWithHeader
 
@@ -10,6 +10,7 @@ class AccountLoginPage(BasePageWithHeader):
     INPUT_PASSWORD = "//input[contains(@name, 'password')]"
     BUTTON_LOGIN = "//button[contains(text(), 'Login')]"
     ELEM_MY_ACCOUNT = "//h2[contains(text(), 'My Account')]"
+    ACCOUNT_PAGE = "/index.php?route=account/account&customer_token={customer_token}"
 
     @allure.step("Авторизация пользователя")
     def account_login(self, browser, email, password):
@@ -30,4 +31,14 @@ class AccountLoginPage(BasePageWithHeader):
             self.wait_and_click(browser=browser, target_locator=self.BUTTON_LOGIN)
 
         with allure.step("Проверить успешную авторизацию"):
-            self.wait_element(browser=browser, target_locator=self.ELEM_MY_ACCOUNT)
\ No newline at end of file
+            self.wait_element(browser=browser, target_locator=self.ELEM_MY_ACCOUNT)
+
+    @allure.step("Открытие страницы аккаунта")
+    def open_account(self, browser, customer_token):
+        """
+        Открывает страницу аккаунта в уже авторизованной сессии (cookies должны быть выставлены).
+
+        :return: True, если сессия действительна, False - если сервер перенаправил на форму входа
+        """
+        browser.open(self.ACCOUNT_PAGE.format(customer_token=customer_token or ""))
+        return "route=account/login" not in browser.current_url and "My Account" in browser.title
@@ -1,16 +1,17 @@
 import uuid
-import allure
+from common import reporting as allure
 
 from selenium.webdriver.common.alert import Alert
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from frontend.page_object.base_page_with_header import BasePageWithHeader
+from frontend.page_object.header_elements import HeaderElements
 
 
 class AdminPage(BasePageWithHeader):
     ADMIN_PAGE = "/administration"
+    DASHBOARD_PAGE = "/administration/index.php?route=common/dashboard&user_token={user_token}"
     ADMIN_LOGIN_CARD = ".card"
     INPUT_USERNAME = "//input[contains(@name, 'username')]"
     BUTTON_LOGIN = "//button[contains(text(), 'Login')]"
@@ -46,6 +47,12 @@ class AdminPage(BasePageWithHeader):
     BUTTON_DELETE = "//button[contains(@class, 'btn btn-danger')]"
     CLEAR_LIST = "//td[contains (text(), 'No results!')]"
 
+    # Ответы админки после сохранения и удаления приходят заметно дольше обычной навигации
+    WAIT_PROFILES = {
+        HeaderElements.ALERT_SUCCESS: "long",
+        CLEAR_LIST: "long",
+    }
+
     @allure.step("Авторизация в админ-панели")
     def authorization_admin(self, browser):
         """Выполнение авторизации в административной панели с проверкой успешного входа"""
@@ -80,9 +87,24 @@ class AdminPage(BasePageWithHeader):
         with allure.step("5. Проверить успешность авторизации"):
             self.logger.info("Проверка успешности авторизации")
             with allure.step("Убедиться, что заголовок содержит 'Dashboard'"):
-                WebDriverWait(browser, 10).until(EC.title_contains("Dashboard"))
+                self.wait(browser, "title: Dashboard").until(EC.title_contains("Dashboard"))
                 self.logger.info("Авторизация прошла успешно")
 
+    @allure.step("Открытие дашборда по user_token")
+    def open_dashboard(self, browser, user_token):
+        """
+        Открывает дашборд с user_token уже авторизованной сессии (cookies должны быть выставлены).
+
+        :return: True, если сервер принял сессию, False - если перенаправил на форму входа
+        """
+        if not user_token:
+            return False
+        self.logger.info("Открытие дашборда по сохраненному user_token")
+        browser.open(self.DASHBOARD_PAGE.format(user_token=user_token))
+        is_logged_in = "Dashboard" in browser.title
+        self.logger.info(f"Сессия администратора {'действительна' if is_logged_in else 'недействительна'}")
+        return is_logged_in
+
     @allure.step("Добавление нового клиента")
     def add_customers(self, browser, firstname="Test", lastname="Test", password="Test"):
         """Добавление нового клиента в систему с возможностью кастомизации данных"""
@@ -1,50 +1,98 @@
 import logging
+from typing import Any, Dict, List, Optional, Sequence
 
-from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from frontend.page_object.locators import compile_locator, is_locator_attribute, normalize_xpath
+from frontend.page_object.waits import BackoffWait, TIMEOUT_PROFILES
+
+
+# Поиск элементов и чтение их данных за один вызов execute_script (один round-trip к драйверу)
+_EXTRACT_SCRIPT = """
+const [method, locator, child, fields] = arguments;
+let nodes = [];
+if (method === "xpath") {
+    const found = document.evaluate(locator, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < found.snapshotLength; i++) nodes.push(found.snapshotItem(i));
+} else {
+    nodes = Array.from(document.querySelectorAll(locator));
+}
+return nodes.map(node => {
+    const target = child ? node.querySelector(child) : node;
+    const row = {};
+    for (const field of fields) {
+        if (field === "element") row.element = node;
+        else if (!target) row[field] = null;
+        else if (field === "text") row.text = (target.innerText || "").trim();
+        else if (field === "visible") row.visible = !!(target.offsetWidth || target.offsetHeight
+                                                       || target.getClientRects().length);
+        else if (field.startsWith("attr:")) row[field] = target.getAttribute(field.slice(5));
+    }
+    return row;
+});
+"""
 
 
-def _configure_logging():
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
-
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+class BasePage:
+    # Профиль таймаута (ключ TIMEOUT_PROFILES) для отдельных локаторов страницы
+    WAIT_PROFILES: Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Нормализует XPath-локаторы класса и заранее компилирует их в CSS, где это возможно"""
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if is_locator_attribute(name, value):
+                value = normalize_xpath(value)
+                setattr(cls, name, value)
+                compile_locator(By.XPATH, value)
+        if "WAIT_PROFILES" in vars(cls):
+            cls.WAIT_PROFILES = {
+                normalize_xpath(locator) if is_locator_attribute("LOCATOR", locator) else locator: profile
+                for locator, profile in cls.WAIT_PROFILES.items()
+            }
 
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
 
-    file_handler = logging.FileHandler('page_objects.log', mode='w')
-    file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    @staticmethod
+    def locate(browser, target_locator, method=By.XPATH):
+        """
+        Стратегия поиска (By, value) для локатора: простой XPath заменяется на CSS.
 
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+        Внутри WebElement локатор не переводится: "//" в XPath ищет от корня документа,
+        а CSS - только среди потомков элемента.
+        """
+        if isinstance(browser, WebElement):
+            return method, target_locator
+        return compile_locator(method, target_locator)
 
+    def wait(self, browser, target_locator, timeout: Optional[float] = None, profile="default") -> BackoffWait:
+        """
+        Явное ожидание для локатора.
 
-_configure_logging()
+        Таймаут: явно переданный timeout, иначе профиль локатора из WAIT_PROFILES, иначе profile.
 
-class BasePage:
-    def __init__(self):
-        self.logger = logging.getLogger(self.__class__.__name__)
+        :param target_locator: str - локатор (ключ профиля и статистики ожиданий)
+        """
+        if timeout is None:
+            timeout = TIMEOUT_PROFILES[self.WAIT_PROFILES.get(target_locator, profile)]
+        return BackoffWait(browser, timeout, locator=target_locator)
 
-    def wait_and_click(self, browser, target_locator, method=By.XPATH, timeout=10):
+    def wait_and_click(self, browser, target_locator, method=By.XPATH, timeout=None):
         """
         Ожидает кликабельности элемента и выполняет клик по нему.
 
         :param browser: WebDriver instance - экземпляр браузера
         :param target_locator: str - локатор элемента для поиска
         :param method: By - метод поиска элемента (по умолчанию XPATH)
-        :param timeout: int - время ожидания элемента в секундах
+        :param timeout: int - время ожидания элемента в секундах (None - по профилю локатора)
         """
         self.logger.info(f"Ожидание и клик по элементу: {target_locator} (метод: {method})")
         try:
-            element = WebDriverWait(browser, timeout).until(
-                EC.element_to_be_clickable((method, target_locator))
+            element = self.wait(browser, target_locator, timeout).until(
+                EC.element_to_be_clickable(self.locate(browser, target_locator, method))
             )
             element.click()
             self.logger.info(f"Успешный клик по элементу: {target_locator}")
@@ -56,8 +104,8 @@ class BasePage:
     def data_entry(self, browser, target, value, method=By.XPATH):
         self.logger.info(f"Ввод данных '{value}' в поле: {target} (метод: {method})")
         try:
-            input_target = WebDriverWait(browser, 3).until(
-                EC.visibility_of_element_located((method, target)))
+            input_target = self.wait(browser, target, profile="short").until(
+                EC.visibility_of_element_located(self.locate(browser, target, method)))
             input_target.send_keys(value)
             self.logger.info(f"Успешный ввод данных в поле: {target}")
         except Exception as e:
@@ -65,19 +113,19 @@ class BasePage:
             raise
 
 
-    def wait_element(self, browser, target_locator, method=By.XPATH, timeout=10):
+    def wait_element(self, browser, target_locator, method=By.XPATH, timeout=None):
         """
         Ожидает плоявление элемента.
 
         :param browser: WebDriver instance - экземпляр браузера
         :param target_locator: str - локатор элемента для поиска
         :param method: By - метод поиска элемента (по умолчанию XPATH)
-        :param timeout: int - время ожидания элемента в секундах
+        :param timeout: int - время ожидания элемента в секундах (None - по профилю локатора)
         """
         self.logger.info(f"Ожидание элемента: {target_locator} (метод: {method})")
         try:
-            element = WebDriverWait(browser, timeout).until(
-                EC.visibility_of_element_located((method, target_locator)))
+            element = self.wait(browser, target_locator, timeout).until(
+                EC.visibility_of_element_located(self.locate(browser, target_locator, method)))
             self.logger.info(f"Элемент {target_locator} успешно найден")
             return element
         except Exception as e:
@@ -85,22 +133,52 @@ class BasePage:
             raise
 
 
-    def wait_elements(self, browser, target_locator, method=By.XPATH, timeout=10):
+    def wait_elements(self, browser, target_locator, method=By.XPATH, timeout=None):
         """
         Ожидает появление элементов и возвращает список
 
         :param browser: WebDriver instance
         :param target_locator: str - локатор элементов
         :param method: By - метод поиска
-        :param timeout: int - время ожидания
+        :param timeout: int - время ожидания (None - по профилю локатора)
         :return: list[WebElement] - список найденных элементов
         """
         self.logger.info(f"Ожидание элементов: {target_locator} (метод: {method})")
         try:
-            elements = WebDriverWait(browser, timeout).until(
-                EC.presence_of_all_elements_located((method, target_locator)))
+            elements = self.wait(browser, target_locator, timeout).until(
+                EC.presence_of_all_elements_located(self.locate(browser, target_locator, method)))
             self.logger.info(f"Найдено {len(elements)} элементов по локатору {target_locator}")
             return elements
         except Exception as e:
             self.logger.error(f"Элементы {target_locator} не найдены: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    def extract(self, browser, target_locator, method=By.XPATH, fields: Sequence[str] = ("text",),
+                child: Optional[str] = None, timeout=None) -> List[Dict[str, Any]]:
+        """
+        Ожидает появление элементов и читает их данные одним вызовом JavaScript.
+
+        Вместо N запросов element.text / get_attribute к драйверу (на Selenoid каждый - сетевой
+        round-trip) выполняется один execute_script на каждую попытку ожидания.
+
+        :param browser: WebDriver instance
+        :param target_locator: str - локатор элементов (XPATH или CSS_SELECTOR)
+        :param method: By - метод поиска
+        :param fields: что читать: "text" (видимый текст), "visible", "attr:<имя>",
+            "element" (сам WebElement, например для последующего клика)
+        :param child: CSS-селектор дочернего элемента, из которого читаются поля (кроме element)
+        :param timeout: int - время ожидания (None - по профилю локатора)
+        :return: list[dict] - по словарю полей на каждый найденный элемент
+        """
+        if method not in (By.XPATH, By.CSS_SELECTOR):
+            raise ValueError(f"extract поддерживает только XPATH и CSS_SELECTOR, получено: {method}")
+        self.logger.info(f"Чтение {list(fields)} элементов: {target_locator} (метод: {method})")
+        by, value = compile_locator(method, target_locator)
+        try:
+            rows = self.wait(browser, target_locator, timeout).until(
+                lambda driver: driver.execute_script(_EXTRACT_SCRIPT, by, value, child, list(fields)))
+            self.logger.info(f"Прочитано {len(rows)} элементов по локатору {target_locator}")
+            return rows
+        except Exception as e:
+            self.logger.error(f"Элементы {target_locator} не найдены: {str(e)}")
+            raise
@@ -1,8 +1,6 @@
-import allure
+from common import reporting as allure
 import random
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 from frontend.page_object.base_page_with_header import BasePageWithHeader
 
@@ -21,18 +19,18 @@ class CatalogPage(BasePageWithHeader):
 
         with allure.step("1. Получить все пункты выпадающего меню"):
             self.logger.info("Получение пунктов выпадающего меню")
-            menu_items = WebDriverWait(browser, 10).until(
-                EC.presence_of_all_elements_located((By.XPATH, self.header.NARBAR_MENU_DROPDOWN)))
+            menu_items = self.extract(browser, target_locator=self.header.NARBAR_MENU_DROPDOWN,
+                                      fields=("element", "text"))
             self.logger.info(f"Найдено пунктов меню: {len(menu_items)}")
             allure.attach(
-                str([item.text for item in menu_items]),
+                str([item["text"] for item in menu_items]),
                 name="Available menu items",
                 attachment_type=allure.attachment_type.TEXT
             )
 
         with allure.step(f"2. Выбрать случайный пункт меню (всего {len(menu_items)} вариантов)"):
             select_product = random.choice(menu_items)
-            selected_text = select_product.text
+            selected_text = select_product["text"]
             self.logger.info(f"Выбран пункт меню: {selected_text}")
             allure.attach(
                 selected_text,
@@ -42,7 +40,7 @@ class CatalogPage(BasePageWithHeader):
 
         with allure.step(f"3. Кликнуть на выбранный пункт: '{selected_text}'"):
             self.logger.info(f"Клик по выбранному пункту: {selected_text}")
-            select_product.click()
+            select_product["element"].click()
 
         with allure.step("4. Нажать 'Показать все' в выбранной категории"):
             self.logger.info("Нажатие 'Показать все' в выбранной категории")
@@ -58,10 +56,9 @@ class CatalogPage(BasePageWithHeader):
         self.logger.info(f"Получение первых {count} цен товаров")
 
         with allure.step(f"1. Получить первые {count} цен товаров"):
-            product_prices = WebDriverWait(browser, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, self.PRICE)))
+            product_prices = self.extract(browser, target_locator=self.PRICE, method=By.CSS_SELECTOR)
 
-            prices_list = [price.text for price in product_prices[:count]]
+            prices_list = [price["text"] for price in product_prices[:count]]
             self.logger.info(f"Получены цены: {prices_list}")
 
             allure.attach(
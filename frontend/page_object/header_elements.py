@@ -1,9 +1,7 @@
 import random
 
-import allure
+from common import reporting as allure
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 from frontend.page_object.base_page import BasePage
 
@@ -38,9 +36,11 @@ class HeaderElements(BasePage):
                               method=By.CSS_SELECTOR)
 
         with allure.step("2. Получить список доступных валют"):
-            currencies = WebDriverWait(browser, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, self.LIST_CURRENCY)))
-            available_currencies = [c.text.strip() for c in currencies]
+            currencies = self.extract(browser,
+                                      target_locator=self.LIST_CURRENCY,
+                                      method=By.CSS_SELECTOR,
+                                      fields=("element", "text"))
+            available_currencies = [c["text"] for c in currencies]
             allure.attach(
                 "\n".join(available_currencies),
                 name="Доступные валюты",
@@ -69,24 +69,12 @@ class HeaderElements(BasePage):
             )
 
             for currency in currencies:
-                if currency.text.strip() == selected_currency:
-                    currency.click()
+                if currency["text"] == selected_currency:
+                    currency["element"].click()
                     break
 
         return selected_currency
 
-    @allure.step("Установка масштаба страницы")
-    def set_page_zoom(self, browser, scale=0.6):
-        """
-        Устанавливает масштаб страницы.
-        :param browser: WebDriver instance
-        :param scale: коэффициент масштабирования (0.6 = 60%)
-        """
-        browser.execute_script(
-            f"document.body.style.transform='scale({scale})'; "
-            "document.body.style.transformOrigin='0 0'"
-        )
-
     @allure.step("Кликнуть на логотип")
     def click_logo(self, browser):
         self.wait_and_click(browser=browser, target_locator=self.LOGO)
\ No newline at end of file
@@ -1,4 +1,4 @@
-import allure
+from common import reporting as allure
 
 from frontend.page_object.base_page_with_header import BasePageWithHeader
 
@@ -29,7 +29,7 @@ class ListPage(BasePageWithHeader):
 
         with allure.step(f"2. Проверить что список не пуст (ожидаемый товар: '{product_name}')"):
             self.logger.info(f"Проверка что список не пуст")
-            items_in_list = self.wait_elements(browser, target_locator=items_locator)
+            items_in_list = [item["text"] for item in self.extract(browser, target_locator=items_locator)]
             self.logger.info(f"Количество товаров в списке: {len(items_in_list)}")
             allure.attach(
                 str(len(items_in_list)),
@@ -42,11 +42,11 @@ class ListPage(BasePageWithHeader):
             self.logger.info(f"Поиск товара '{product_name}' в {list_name}")
             found = False
             for item in items_in_list:
-                if product_name in item.text:
+                if product_name in item:
                     found = True
-                    self.logger.info(f"Товар найден: {item.text}")
+                    self.logger.info(f"Товар найден: {item}")
                     allure.attach(
-                        item.text,
+                        item,
                         name="Найденный товар",
                         attachment_type=allure.attachment_type.TEXT
                     )
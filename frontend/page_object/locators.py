@@ -0,0 +1,110 @@
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from selenium.webdriver.common.by import By
+
+# Пробелы внутри XPath вне строковых литералов, которые не меняют смысл выражения
+_SPACE_AFTER = re.compile(r"(?<=[(\[/@])\s+")
+_SPACE_BEFORE = re.compile(r"\s+(?=[)\]/,=])")
+_SPACE_AFTER_EQUALS = re.compile(r"=\s+")
+_SPACE_BEFORE_CALL = re.compile(r"\b(?!(?:and|or|div|mod)\b)([\w-]+)\s+\(")
+_COMMA = re.compile(r",\s*")
+_LITERAL = re.compile(r"""('[^']*'|"[^"]*")""")
+
+# //tag[...][...] или /tag[...] - шаг пути; предикаты разбираются отдельно
+_STEP = re.compile(r"(//|/)([\w-]+|\*)((?:\[[^\[\]]+\])*)")
+_PREDICATE = re.compile(r"\[([^\[\]]+)\]")
+_CONTAINS = re.compile(r"""^contains\(@([\w-]+), ('[^'"\\]*'|"[^'"\\]*")\)$""")
+_STARTS_WITH = re.compile(r"""^starts-with\(@([\w-]+), ('[^'"\\]*'|"[^'"\\]*")\)$""")
+_EQUALS = re.compile(r"""^@([\w-]+)=('[^'"\\]*'|"[^'"\\]*")$""")
+_HAS_ATTRIBUTE = re.compile(r"^@([\w-]+)$")
+
+
+def normalize_xpath(xpath: str) -> str:
+    """
+    Приводит XPath к каноничному виду: убирает лишние пробелы вне строковых литералов.
+
+    "// input[contains( @ placeholder, 'E-Mail')]" -> "//input[contains(@placeholder, 'E-Mail')]"
+    """
+    parts = _LITERAL.split(xpath.strip())
+    for index in range(0, len(parts), 2):
+        part = parts[index]
+        part = _SPACE_AFTER.sub("", part)
+        part = _SPACE_BEFORE.sub("", part)
+        part = _SPACE_AFTER_EQUALS.sub("=", part)
+        part = _SPACE_BEFORE_CALL.sub(r"\1(", part)
+        parts[index] = _COMMA.sub(", ", part)
+    return "".join(parts)
+
+
+def xpath_to_css(xpath: str) -> Optional[str]:
+    """
+    Переводит простой XPath в эквивалентный CSS-селектор.
+
+    Поддерживаются шаги по тегу через // и / с предикатами по атрибутам:
+    contains(@a, 'v'), starts-with(@a, 'v'), @a='v' и @a. Для text(), позиций, осей
+    и прочих конструкций возвращает None - такой локатор остается XPath.
+    """
+    xpath = normalize_xpath(xpath)
+    if not xpath.startswith("//"):
+        return None
+
+    selectors = []
+    position = 0
+    for match in _STEP.finditer(xpath):
+        if match.start() != position:
+            return None
+        position = match.end()
+        separator, tag, predicates = match.groups()
+
+        attributes = []
+        for predicate in _PREDICATE.findall(predicates):
+            attribute = _predicate_to_css(predicate)
+            if attribute is None:
+                return None
+            attributes.append(attribute)
+
+        step = ("" if tag == "*" and attributes else tag) + "".join(attributes)
+        if selectors:
+            selectors.append(" " if separator == "//" else " > ")
+        selectors.append(step)
+
+    if position != len(xpath) or not selectors:
+        return None
+    return "".join(selectors)
+
+
+def _predicate_to_css(predicate: str) -> Optional[str]:
+    for pattern, operator in ((_CONTAINS, "*="), (_STARTS_WITH, "^="), (_EQUALS, "=")):
+        match = pattern.match(predicate)
+        if match:
+            name, literal = match.groups()
+            return f'[{name}{operator}"{literal[1:-1]}"]'
+    match = _HAS_ATTRIBUTE.match(predicate)
+    if match:
+        return f"[{match.group(1)}]"
+    return None
+
+
+@lru_cache(maxsize=None)
+def compile_locator(method: str, locator: str) -> Tuple[str, str]:
+    """
+    Стратегия поиска для локатора page object: XPath переводится в CSS, если это возможно.
+
+    Результат кэшируется, так что разбор выполняется один раз на локатор.
+
+    :return: (By, value) для find_element / expected_conditions
+    """
+    if method != By.XPATH:
+        return method, locator
+    xpath = normalize_xpath(locator)
+    css = xpath_to_css(xpath)
+    if css is not None:
+        return By.CSS_SELECTOR, css
+    return By.XPATH, xpath
+
+
+def is_locator_attribute(name: str, value) -> bool:
+    """Константа-локатор page object: атрибут класса в верхнем регистре со строкой XPath"""
+    return name.isupper() and isinstance(value, str) and value.lstrip().startswith(("//", "(/", "( /"))
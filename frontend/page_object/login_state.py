@@ -0,0 +1,109 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from common import reporting as allure
+from frontend.page_object.account_login_page import AccountLoginPage
+from frontend.page_object.admin_page import AdminPage
+
+# Поля cookie, которые принимает WebDriver add_cookie
+_COOKIE_FIELDS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+
+
+@dataclass
+class LoginState:
+    """Снимок авторизации: cookies сессии и токен из URL (user_token админки или customer_token витрины)"""
+    cookies: List[dict]
+    token: Optional[str] = None
+    captured_at: float = field(default_factory=time.time)
+
+
+class LoginStateCache:
+    """
+    Авторизация в админке и на витрине без ввода логина через UI в каждом тесте.
+
+    Первый вход на воркере выполняется через page object, после чего сохраняются cookies
+    и токен из URL. Следующие сессии браузера получают этот снимок до навигации и сразу
+    открывают нужную страницу. Если снимок старше ttl или сервер его не принял (сессия
+    истекла, был выход), вход через UI выполняется заново и снимок обновляется.
+    """
+
+    def __init__(self, ttl: float = 1800):
+        """
+        :param ttl: сколько секунд снимок считается действительным (0 - всегда входить через UI)
+        """
+        self.ttl = ttl
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._states: Dict[str, LoginState] = {}
+
+    @allure.step("Авторизация в админ-панели (сохраненная сессия)")
+    def admin(self, browser, admin_page: Optional[AdminPage] = None):
+        """Открыть дашборд админки авторизованным; браузер должен быть на домене приложения"""
+        admin_page = admin_page or AdminPage()
+        state = self._fresh_state("admin")
+        if state is not None:
+            self._restore_cookies(browser, state)
+            if admin_page.open_dashboard(browser, state.token):
+                self.logger.info("Админ-сессия восстановлена из снимка")
+                return
+            self.logger.info("Снимок админ-сессии не принят сервером, выполняем вход заново")
+            self._states.pop("admin", None)
+
+        browser.open(admin_page.ADMIN_PAGE)
+        admin_page.authorization_admin(browser)
+        self._capture("admin", browser, self._url_param(browser, "user_token"))
+
+    @allure.step("Авторизация пользователя (сохраненная сессия)")
+    def customer(self, browser, email: str, password, account_page: Optional[AccountLoginPage] = None):
+        """Авторизовать покупателя и открыть страницу аккаунта"""
+        account_page = account_page or AccountLoginPage()
+        key = f"customer:{email}"
+        state = self._fresh_state(key)
+        if state is not None:
+            self._restore_cookies(browser, state)
+            if account_page.open_account(browser, state.token):
+                self.logger.info("Сессия покупателя %s восстановлена из снимка", email)
+                return
+            self.logger.info("Снимок сессии покупателя %s не принят сервером, выполняем вход заново", email)
+            self._states.pop(key, None)
+
+        account_page.account_login(browser, email=email, password=password)
+        self._capture(key, browser, self._url_param(browser, "customer_token"))
+
+    def invalidate(self, role: str = None):
+        """Сбросить снимок роли ("admin" или "customer:<email>") или все снимки"""
+        if role is None:
+            self._states.clear()
+        else:
+            self._states.pop(role, None)
+
+    def _fresh_state(self, key: str) -> Optional[LoginState]:
+        state = self._states.get(key)
+        if state is None or self.ttl <= 0:
+            return None
+        if time.time() - state.captured_at >= self.ttl:
+            self.logger.info("Снимок авторизации %s устарел", key)
+            self._states.pop(key, None)
+            return None
+        return state
+
+    @staticmethod
+    def _url_param(browser, name: str) -> Optional[str]:
+        return parse_qs(urlsplit(browser.current_url).query).get(name, [None])[0]
+
+    def _capture(self, key: str, browser, token: Optional[str] = None):
+        if self.ttl <= 0:
+            return
+        cookies = [{name: cookie[name] for name in _COOKIE_FIELDS if name in cookie}
+                   for cookie in browser.get_cookies()]
+        self._states[key] = LoginState(cookies=cookies, token=token)
+        self.logger.info("Сохранен снимок авторизации %s (cookies: %d)", key, len(cookies))
+
+    @staticmethod
+    def _restore_cookies(browser, state: LoginState):
+        # Cookies ставятся только для текущего домена, поэтому браузер уже должен быть на сайте
+        browser.delete_all_cookies()
+        for cookie in state.cookies:
+            browser.add_cookie(cookie)
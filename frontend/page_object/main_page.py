@@ -1,6 +1,6 @@
 import random
 
-import allure
+from common import reporting as allure
 from selenium.webdriver.common.by import By
 
 from frontend.page_object.base_page_with_header import BasePageWithHeader
@@ -30,7 +30,8 @@ class MainPage(BasePageWithHeader):
 
         with allure.step("1. Получить список всех товаров на странице"):
             self.logger.info("Получение списка всех товаров")
-            all_products = self.wait_elements(browser, target_locator=self.ALL_PRODUCT_NAME,method=By.CSS_SELECTOR)
+            all_products = self.extract(browser, target_locator=self.ALL_PRODUCT_NAME, method=By.CSS_SELECTOR,
+                                        fields=("element", "text"), child=self.TITLE_PRODUCT_NAME)
 
             self.logger.info(f"Найдено товаров: {len(all_products)}")
             allure.attach(
@@ -42,8 +43,7 @@ class MainPage(BasePageWithHeader):
             with allure.step("2. Выбрать случайный товар"):
                 filtered_products = []
                 for product in all_products:
-                    product_name = product.find_element(By.CSS_SELECTOR, self.TITLE_PRODUCT_NAME).text
-                    if product_name not in ['Apple Cinema 30"', 'Canon EOS 5D']:
+                    if product["text"] not in ['Apple Cinema 30"', 'Canon EOS 5D']:
                         filtered_products.append(product)
 
                 if not filtered_products:
@@ -55,8 +55,9 @@ class MainPage(BasePageWithHeader):
                     name="Количество товаров после фильтрации",
                     attachment_type=allure.attachment_type.TEXT
                 )
-                random_product = random.choice(filtered_products)
-                product_name = random_product.find_element(By.CSS_SELECTOR, self.TITLE_PRODUCT_NAME).text
+                selected_product = random.choice(filtered_products)
+                random_product = selected_product["element"]
+                product_name = selected_product["text"]
                 self.logger.info(f"Выбран товар: {product_name}")
                 allure.attach(
                     product_name,
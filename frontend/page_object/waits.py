@@ -0,0 +1,130 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple, TypeVar
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException
+)
+
+T = TypeVar("T")
+
+# Профили таймаутов в секундах; локаторы привязываются к профилю через BasePage.WAIT_PROFILES
+TIMEOUT_PROFILES: Dict[str, float] = {
+    "short": 3,
+    "default": 10,
+    "long": 20,
+}
+
+
+@dataclass
+class _LocatorWaits:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    timeouts: int = 0
+
+
+class WaitStats:
+    """Суммарное время явных ожиданий по локаторам - показывает, куда уходит время прогона"""
+
+    def __init__(self):
+        self._waits: Dict[str, _LocatorWaits] = {}
+        self._lock = threading.Lock()
+
+    def record(self, locator: str, seconds: float, timed_out: bool = False):
+        with self._lock:
+            waits = self._waits.setdefault(locator, _LocatorWaits())
+            waits.count += 1
+            waits.total += seconds
+            waits.max = max(waits.max, seconds)
+            waits.timeouts += int(timed_out)
+
+    def merge(self, data: Dict[str, dict]):
+        """Добавить статистику другого процесса (результат to_dict воркера xdist)"""
+        with self._lock:
+            for locator, other in data.items():
+                waits = self._waits.setdefault(locator, _LocatorWaits())
+                waits.count += other["count"]
+                waits.total += other["total"]
+                waits.max = max(waits.max, other["max"])
+                waits.timeouts += other["timeouts"]
+
+    def top(self, limit: int = 15) -> List[Tuple[str, _LocatorWaits]]:
+        """Локаторы с наибольшим суммарным временем ожидания"""
+        with self._lock:
+            items = list(self._waits.items())
+        return sorted(items, key=lambda item: item[1].total, reverse=True)[:limit]
+
+    def format_table(self, limit: int = 15) -> str:
+        lines = [f"{'locator':<70} {'count':>6} {'total s':>8} {'max s':>7} {'timeouts':>8}"]
+        for locator, waits in self.top(limit):
+            lines.append(f"{locator[:70]:<70} {waits.count:>6} {waits.total:>8.2f} "
+                         f"{waits.max:>7.2f} {waits.timeouts:>8}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, dict]:
+        with self._lock:
+            return {locator: vars(waits).copy() for locator, waits in self._waits.items()}
+
+    def __bool__(self) -> bool:
+        return bool(self._waits)
+
+
+wait_stats = WaitStats()
+
+
+class BackoffWait:
+    """
+    Явное ожидание с адаптивным интервалом опроса.
+
+    Первая проверка выполняется сразу, затем интервал растет от initial_poll
+    (несколько миллисекунд) до max_poll: быстрые элементы находятся почти без задержки,
+    а долгие ожидания не засыпают драйвер запросами. Интерфейс until совместим с WebDriverWait.
+    """
+
+    def __init__(self, driver, timeout: float, locator: str = "",
+                 initial_poll: float = 0.005, max_poll: float = 0.25, factor: float = 2.0,
+                 ignored_exceptions=(NoSuchElementException, StaleElementReferenceException),
+                 stats: WaitStats = wait_stats):
+        """
+        :param locator: ключ для статистики ожиданий
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.locator = locator
+        self.initial_poll = initial_poll
+        self.max_poll = max_poll
+        self.factor = factor
+        self.ignored_exceptions = tuple(ignored_exceptions)
+        self.stats = stats
+
+    def until(self, condition: Callable[..., T], message: str = "") -> T:
+        started = time.monotonic()
+        deadline = started + self.timeout
+        poll = self.initial_poll
+        last_error = None
+        while True:
+            try:
+                value = condition(self.driver)
+                if value:
+                    self._record(started, timed_out=False)
+                    return value
+            except self.ignored_exceptions as e:
+                last_error = e
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._record(started, timed_out=True)
+                screen = getattr(last_error, "screen", None)
+                stacktrace = getattr(last_error, "stacktrace", None)
+                raise TimeoutException(message or f"Ожидание {self.locator} превысило {self.timeout} с",
+                                       screen, stacktrace)
+            time.sleep(min(poll, remaining))
+            poll = min(poll * self.factor, self.max_poll)
+
+    def _record(self, started: float, timed_out: bool):
+        if self.stats is not None and self.locator:
+            self.stats.record(self.locator, time.monotonic() - started, timed_out)
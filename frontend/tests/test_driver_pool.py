@@ -0,0 +1,96 @@
+import allure
+import pytest
+
+from frontend.driver.broker import SessionBroker
+from frontend.driver.pool import DriverPool
+
+
+class FakeDriver:
+    """WebDriver без браузера: поддерживает ровно то, что нужно пулу и брокеру"""
+
+    current_url = "about:blank"
+    window_handles = ["main"]
+
+    def __init__(self, number: int):
+        self.number = number
+        self.quit_called = False
+        self.switch_to = self
+
+    def window(self, handle):
+        pass
+
+    def execute_script(self, script):
+        pass
+
+    def delete_all_cookies(self):
+        pass
+
+    def go_to_home(self):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeHub:
+    """Считает запуски сессий"""
+
+    def __init__(self):
+        self.started = []
+
+    def __call__(self) -> FakeDriver:
+        driver = FakeDriver(len(self.started) + 1)
+        self.started.append(driver)
+        return driver
+
+
+@pytest.mark.frontend
+@allure.feature("Инфраструктура page objects")
+@allure.story("Пул браузеров и заранее запущенные сессии Selenoid")
+class TestDriverPoolPrewarm:
+    """Тесты заказа фоновых сессий брокером и пулом браузеров."""
+
+    def test_broker_with_refill_keeps_session_ready(self):
+        """Тест: без пула брокер заказывает замену при каждой выдаче."""
+        hub = FakeHub()
+        broker = SessionBroker(hub, depth=1)
+        first = broker()
+        second = broker.take()
+        broker._pending[0].result()
+        broker.close()
+        assert (first.number, second.number) == (1, 2)
+        assert len(hub.started) == 3 and hub.started[2].quit_called
+
+    def test_pool_prewarms_only_before_recycle(self):
+        """Тест: с пулом сессия заказывается только на последнем тесте перед пересозданием."""
+        hub = FakeHub()
+        broker = SessionBroker(hub, depth=1, refill=False)
+        pool = DriverPool(broker, size=1, max_uses=3, prepare=broker.prepare)
+
+        for _ in range(2):
+            pool.release(pool.acquire())
+        assert len(hub.started) == 1
+
+        last = pool.acquire()
+        broker._pending[0].result()
+        assert len(hub.started) == 2
+        pool.release(last)
+        assert last.quit_called
+
+        replacement = pool.acquire()
+        assert replacement is hub.started[1]
+        pool.release(replacement)
+        pool.close()
+        broker.close()
+        assert len(hub.started) == 2
+
+    def test_pool_prewarms_after_failed_test(self):
+        """Тест: после упавшего теста замена запускается в фоне и выдается следующему тесту."""
+        hub = FakeHub()
+        broker = SessionBroker(hub, depth=1, refill=False)
+        pool = DriverPool(broker, size=1, max_uses=20, prepare=broker.prepare)
+        pool.release(pool.acquire(), failed=True)
+        assert pool.acquire() is hub.started[1]
+        pool.close()
+        broker.close()
+        assert len(hub.started) == 2
@@ -0,0 +1,75 @@
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import allure
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from frontend.driver.factory import DriverConfig, create_driver
+from frontend.harness.server import SnapshotServer
+from frontend.page_object.catalog_page import CatalogPage
+
+CATALOG = "index.php?route=product/category&language=en-gb&path=20"
+
+
+@pytest.fixture(scope="module")
+def snapshot_server():
+    with SnapshotServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="module")
+def harness_browser(request, snapshot_server):
+    """Headless-браузер против сервера снимков; тест пропускается, если браузер не запускается"""
+    config = DriverConfig(browser=request.config.getoption("--browser") or "chrome",
+                          url=snapshot_server.url, headless=True)
+    try:
+        driver = create_driver(config)
+    except WebDriverException as e:
+        pytest.skip(f"Браузер недоступен: {e.msg}")
+    yield driver
+    driver.quit()
+
+
+@pytest.mark.frontend
+@allure.feature("Инфраструктура page objects")
+@allure.story("Локальные снимки OpenCart")
+class TestSnapshotServer:
+    """Тесты встроенного сервера снимков страниц OpenCart."""
+
+    @pytest.mark.parametrize("path,marker", [
+        ("", "common-home"),
+        ("index.php?route=product/category&language=en-gb&path=20", "product-category"),
+        ("index.php?route=checkout/cart&language=en-gb", "Shopping Cart"),
+        ("index.php?route=account/wishlist&language=en-gb", "My Wishlist"),
+        ("administration/index.php?route=customer/customer", "button-filter"),
+        ("administration/index.php?route=catalog/product", "Test0001"),
+    ], ids=["home", "catalog", "cart", "wishlist", "admin_customers", "admin_products"])
+    def test_route_served_with_shared_header(self, snapshot_server, path, marker):
+        """Тест: маршрут OpenCart отдает свой снимок, шапка витрины подставлена."""
+        with urlopen(snapshot_server.url + path) as response:
+            body = response.read().decode("utf-8")
+        assert marker in body
+        assert "<!-- include:" not in body
+        if not path.startswith("administration"):
+            assert 'id="form-currency"' in body
+
+    def test_unknown_route_not_found(self, snapshot_server):
+        """Тест: для маршрута без снимка возвращается 404."""
+        with pytest.raises(HTTPError) as error:
+            urlopen(snapshot_server.url + "index.php?route=account/order")
+        assert error.value.code == 404
+
+
+@pytest.mark.frontend
+@allure.feature("Инфраструктура page objects")
+@allure.story("Page objects на локальных снимках")
+class TestPageObjectsOnHarness:
+    """Тесты page objects против встроенного сервера снимков в headless-браузере."""
+
+    def test_catalog_prices(self, harness_browser):
+        """Тест: CatalogPage получает первые цены товаров каталога из снимка."""
+        harness_browser.open(CATALOG)
+        prices = CatalogPage().get_current_product_prices(harness_browser)
+        assert len(prices) == 3
+        assert [price.split()[0] for price in prices] == ["$602.00", "$123.20", "$122.00"]
@@ -0,0 +1,42 @@
+import allure
+import pytest
+from selenium.webdriver.common.by import By
+
+from frontend.page_object.admin_page import AdminPage
+from frontend.page_object.locators import compile_locator, normalize_xpath, xpath_to_css
+
+
+@pytest.mark.frontend
+@allure.feature("Инфраструктура page objects")
+@allure.story("Компиляция локаторов")
+class TestLocatorCompilation:
+    """Тесты перевода XPath-локаторов в CSS."""
+
+    @pytest.mark.parametrize("xpath,css", [
+        ("//input[contains(@name, 'username')]", 'input[name*="username"]'),
+        ("// input[contains( @ placeholder, 'E-Mail')]", 'input[placeholder*="E-Mail"]'),
+        ("//i[contains (@class, 'fas fa-user')]", 'i[class*="fas fa-user"]'),
+        ("//input[@type='checkbox']", 'input[type="checkbox"]'),
+        ("//div[@id='top']/ul//*[@data-id]", 'div[id="top"] > ul [data-id]'),
+    ], ids=["contains", "odd_spacing", "contains_with_space", "equals", "descendant_and_child"])
+    def test_simple_xpath_translated_to_css(self, xpath, css):
+        """Тест: простые XPath переводятся в эквивалентный CSS."""
+        assert xpath_to_css(xpath) == css
+        assert compile_locator(By.XPATH, xpath) == (By.CSS_SELECTOR, css)
+
+    @pytest.mark.parametrize("xpath", [
+        "//a[contains(text(), 'Login')]",
+        "(//td[@class='text-start'])[4]",
+        "//h1[contains(text(), 'Shopping Cart')]/following::table//tbody/tr",
+        "//a[@x='1' and @y='2']",
+    ], ids=["text", "position", "axis", "and"])
+    def test_complex_xpath_falls_back(self, xpath):
+        """Тест: выражения без CSS-аналога остаются XPath."""
+        assert xpath_to_css(xpath) is None
+        assert compile_locator(By.XPATH, xpath) == (By.XPATH, normalize_xpath(xpath))
+
+    def test_page_locators_normalized_at_class_definition(self):
+        """Тест: локаторы page object нормализуются при определении класса."""
+        assert AdminPage.INPUT_EMAIL_FILTER == "//input[contains(@placeholder, 'E-Mail')]"
+        assert AdminPage.CLEAR_LIST in AdminPage.WAIT_PROFILES
+        assert AdminPage.ADMIN_PAGE == "/administration"
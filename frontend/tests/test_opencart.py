@@ -38,7 +38,6 @@ def test_add_random_product_to_cart(browser):
 
     with allure.step("Переход на главную страницу"):
         cp.header.click_logo(browser)
-        cp.header.set_page_zoom(browser)
 
     with allure.step("Добавление случайного товара в корзину"):
         product_name = mp.add_product_to_list(browser, list_type="cart")
@@ -58,7 +57,6 @@ def test_select_currency_title(browser):
 
     with allure.step("Переход на главную страницу"):
         cp.header.click_logo(browser)
-        cp.header.set_page_zoom(browser)
 
     with allure.step("Получение текущих цен товаров"):
         prices_before = cp.get_current_product_prices(browser)
@@ -78,9 +76,6 @@ def test_select_currency_title(browser):
         )
         allure.dynamic.title(f"Смена валюты на главной странице {new_currency}")
 
-    with allure.step("Корректировка масштаба после изменений"):
-        cp.header.set_page_zoom(browser)
-
     with allure.step("Получение новых цен после смены валюты"):
         prices_after = cp.get_current_product_prices(browser)
         allure.attach(
@@ -122,9 +117,6 @@ def test_select_currency_catalog(browser):
         )
         allure.dynamic.title(f"Смена валюты в каталоге {new_currency}")
 
-    with allure.step("Корректировка отображения страницы"):
-        cp.header.set_page_zoom(browser)
-
     with allure.step("Получение новых цен после смены валюты"):
         prices_after = cp.get_current_product_prices(browser)
         allure.attach(
@@ -148,7 +140,7 @@ def test_select_currency_catalog(browser):
 ])
 @allure.feature("Администрирование OpenCart")
 @allure.story("Регистрация новых пользователей через админ панель")
-def test_opencart_add_and_delete_user(browser, user_data):
+def test_opencart_add_and_delete_user(browser, login_state, user_data):
     """Тест регистрации и удаления нового пользователя в админ панели"""
     firstname = user_data["firstname"]
     lastname = user_data["lastname"]
@@ -157,11 +149,8 @@ def test_opencart_add_and_delete_user(browser, user_data):
     with allure.step("Инициализация страницы администрирования"):
         ap = AdminPage()
 
-    with allure.step("Открытие админ-панели"):
-        browser.open(ap.ADMIN_PAGE)
-
     with allure.step("Авторизация администратора"):
-        ap.authorization_admin(browser)
+        login_state.admin(browser, ap)
 
     with allure.step(f"Добавление пользователя: {firstname} {lastname}"):
         added_firstname, added_lastname, email = ap.add_customers(
@@ -187,17 +176,14 @@ def test_opencart_add_and_delete_user(browser, user_data):
 @pytest.mark.frontend
 @allure.feature("Управление товарами")
 @allure.story("Добавление и удаление товаров")
-def test_opencart_add_and_delete_product(browser):
+def test_opencart_add_and_delete_product(browser, login_state):
     """Тест по добавлению и удалению нового товара в разделе администратора"""
 
     with allure.step("Инициализация страницы администрирования"):
         ap = AdminPage()
 
-    with allure.step("Открытие админ-панели"):
-        browser.open(ap.ADMIN_PAGE)
-
     with allure.step("Авторизация администратора"):
-        ap.authorization_admin(browser)
+        login_state.admin(browser, ap)
 
     with allure.step("Добавление товара"):
         value = ap.add_product(browser)
@@ -213,50 +199,33 @@ def test_opencart_add_and_delete_product(browser):
 @pytest.mark.frontend
 @allure.feature("Управление товарами")
 @allure.story("Добавление товара в список желаний")
-def test_add_random_product_to_wish_list(browser):
+def test_add_random_product_to_wish_list(browser, login_state, worker_customer):
     """Тест добавления в список желаний"""
-    password = 4444
 
     with allure.step("Инициализация страниц"):
-        ap = AdminPage()
         cp = CatalogPage()
         al = AccountLoginPage()
         lp = ListPage()
         mp = MainPage()
 
-    with allure.step("Открытие админ-панели"):
-        browser.open(ap.ADMIN_PAGE)
-
-    with allure.step("Авторизация администратора"):
-        ap.authorization_admin(browser)
-
-    with allure.step("Добавление пользователя"):
-        added_firstname, added_lastname, email = ap.add_customers(
-            browser,
-            firstname="Test123",
-            lastname="Test123",
-            password=password
-        )
-
-        allure.attach(
-            f"Имя: {added_firstname}\nФамилия: {added_lastname}\nEmail: {email}",
-            name="Данные добавленного пользователя",
-            attachment_type=allure.attachment_type.TEXT
-        )
+    allure.attach(
+        f"Имя: {worker_customer.firstname}\nФамилия: {worker_customer.lastname}\nEmail: {worker_customer.email}",
+        name="Данные созданного пользователя",
+        attachment_type=allure.attachment_type.TEXT
+    )
 
     with allure.step("Открытие главной страницы"):
         browser.go_to_home()
 
     with allure.step("Переход на главную страницу"):
         cp.header.click_logo(browser)
-        cp.header.set_page_zoom(browser)
 
     with allure.step("Авторизация пользователя на сайте"):
-        al.account_login(browser, email=email, password=password)
+        login_state.customer(browser, email=worker_customer.email, password=worker_customer.password,
+                             account_page=al)
 
     with allure.step("Переход на главную страницу"):
         cp.header.click_logo(browser)
-        cp.header.set_page_zoom(browser)
 
     with allure.step("Добавление случайного товара в список желаний"):
         product_name = mp.add_product_to_list(browser, list_type="wishlist")